@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the border clipart seamless row renderer.
+
+Compares the previous per-tile renderer (one full-canvas RGBA layer and
+alpha composite per tile) with the row-strip renderer used by
+create_horizontal_seamless_mockup, checks that both produce identical
+pixels, and times the full mockup.
+
+Usage:
+    python benchmarks/bench_border_seamless.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from PIL import Image, ImageDraw
+
+from src.products.border_clipart.mockups import (
+    _render_seamless_row_strip,
+    create_horizontal_seamless_mockup,
+)
+from src.utils.image_utils import composite_region
+
+CANVAS_SIZE = (3000, 2250)
+ROWS = 4
+TITLE_ZONE_HEIGHT = 150
+BOTTOM_PADDING = 30
+
+
+def make_border(index: int, size=(900, 600)) -> Image.Image:
+    """Create a synthetic border strip with soft, partially transparent edges."""
+    img = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    color = ((60 * index) % 255, (120 + 40 * index) % 255, (200 - 30 * index) % 255)
+    for i in range(0, size[0], 60):
+        draw.ellipse((i, 100, i + 120, size[1] - 100), fill=color + (180,))
+        draw.rectangle((i + 20, 250, i + 40, 350), fill=(255, 255, 255, 90))
+    return img
+
+
+def _row_layout(border: Image.Image, row_idx: int):
+    row_height = (CANVAS_SIZE[1] - TITLE_ZONE_HEIGHT - BOTTOM_PADDING) // ROWS
+    max_border_height = int(row_height * 0.95)
+    scale = min(max_border_height / border.height, 1.0)
+    resized = border.resize(
+        (int(border.width * scale), int(border.height * scale)),
+        Image.Resampling.LANCZOS,
+    )
+    row_y = TITLE_ZONE_HEIGHT + row_idx * row_height + (row_height - resized.height) // 2
+    return resized, row_y
+
+
+def render_rows_per_tile(borders) -> Image.Image:
+    """Previous renderer: one full-size layer and composite per tile."""
+    canvas = Image.new("RGB", CANVAS_SIZE, "white")
+    for row_idx, border in enumerate(borders):
+        resized, row_y = _row_layout(border, row_idx)
+        tiles_needed = (CANVAS_SIZE[0] // resized.width) + 2
+        for tile_idx in range(tiles_needed):
+            tile_x = tile_idx * resized.width - (resized.width // 4)
+            if tile_x < CANVAS_SIZE[0]:
+                temp_canvas = Image.new("RGBA", CANVAS_SIZE, (255, 255, 255, 0))
+                temp_canvas.paste(resized, (tile_x, row_y), resized)
+                canvas = Image.alpha_composite(
+                    canvas.convert("RGBA"), temp_canvas
+                ).convert("RGB")
+    return canvas
+
+
+def render_rows_strip(borders) -> Image.Image:
+    """Current renderer: one strip and composite per row."""
+    canvas = Image.new("RGB", CANVAS_SIZE, "white")
+    for row_idx, border in enumerate(borders):
+        resized, row_y = _row_layout(border, row_idx)
+        composite_region(canvas, _render_seamless_row_strip(resized, CANVAS_SIZE[0]), (0, row_y))
+    return canvas
+
+
+def best_of(func, repeat: int, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant")
+    args = parser.parse_args()
+
+    borders = [make_border(i) for i in range(ROWS)]
+
+    legacy = render_rows_per_tile(borders)
+    strip = render_rows_strip(borders)
+    if legacy.tobytes() != strip.tobytes():
+        print("✗ Row-strip output differs from the per-tile renderer")
+        return 1
+    print("✓ Row-strip output is pixel-identical to the per-tile renderer")
+
+    legacy_time = best_of(render_rows_per_tile, args.repeat, borders)
+    strip_time = best_of(render_rows_strip, args.repeat, borders)
+    print(f"per-tile rows : {legacy_time * 1000:8.1f} ms")
+    print(f"row strips    : {strip_time * 1000:8.1f} ms  ({legacy_time / strip_time:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, border in enumerate(borders):
+            path = os.path.join(tmp, f"border_{i}.png")
+            border.save(path)
+            paths.append(path)
+        mockup_time = best_of(
+            create_horizontal_seamless_mockup, args.repeat, paths, "Benchmark Borders"
+        )
+    print(f"full mockup   : {mockup_time * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark and regression budget for the CLI.
+
+Runs main.py commands under ``python -X importtime`` in fresh interpreters,
+reports wall time, total import time and the most expensive imports, and
+fails when a command goes over its import-time budget or imports a heavy
+module it should not need (image/video libraries, AI SDKs, Flask).
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat N] [--top N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+project_root = Path(__file__).parent.parent
+
+# Import-time budgets in milliseconds (best of --repeat runs)
+BUDGETS_MS = {
+    "--help": 150,
+    "list-types": 250,
+}
+
+# Modules that CLI bookkeeping commands must not import
+HEAVY_MODULES = (
+    "cv2",
+    "numpy",
+    "flask",
+    "sklearn",
+    "moviepy",
+    "google.generativeai",
+    "google.genai",
+    "openai",
+    "src.products",
+)
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us, depth)."""
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def run_command(args: List[str]) -> Tuple[float, List[Tuple[str, int, int, int]]]:
+    """Run main.py with ``args`` under -X importtime.
+
+    Returns:
+        Wall time in seconds and the parsed import entries
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(project_root / "main.py"), *args],
+        cwd=project_root,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, parse_importtime(proc.stderr)
+
+
+def summarize(entries: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """Total cumulative import time of top-level imports, in microseconds."""
+    return {"total_us": sum(cum for _, _, cum, depth in entries if depth == 0)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to show")
+    args = parser.parse_args()
+
+    failed = False
+    for command, budget_ms in BUDGETS_MS.items():
+        runs = [run_command(command.split()) for _ in range(args.repeat)]
+        wall, entries = min(runs, key=lambda run: summarize(run[1])["total_us"])
+        import_ms = summarize(entries)["total_us"] / 1000
+
+        print(f"\nmain.py {command}")
+        print(f"  wall time   : {min(r[0] for r in runs) * 1000:8.1f} ms")
+        print(f"  import time : {import_ms:8.1f} ms  (budget {budget_ms} ms)")
+
+        top_level = sorted(
+            (e for e in entries if e[3] == 0), key=lambda e: e[2], reverse=True
+        )
+        for module, _, cumulative_us, _ in top_level[: args.top]:
+            print(f"    {cumulative_us / 1000:8.1f} ms  {module}")
+
+        imported = {module for module, _, _, _ in entries}
+        heavy = sorted(
+            m for m in imported if any(m == h or m.startswith(h + ".") for h in HEAVY_MODULES)
+        )
+        if heavy:
+            failed = True
+            print(f"  ✗ imports heavy modules: {', '.join(heavy[:10])}")
+        if import_ms > budget_ms:
+            failed = True
+            print(f"  ✗ import time over budget by {import_ms - budget_ms:.1f} ms")
+        if not heavy and import_ms <= budget_ms:
+            print("  ✓ within budget")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Deterministic synthetic inputs for the benchmark suite.
+
+Fixtures are generated from fixed seeds at production sizes (12in patterns
+and clipart at 300 dpi, US-letter journal pages) and cached in the system
+temp directory, so repeated runs only pay the generation cost once.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+# Bump when the generators change so stale caches are not reused
+FIXTURE_VERSION = 1
+
+PATTERN_SIZE = 3600
+OVERSIZED_PATTERN_SIZE = 4800
+CLIPART_SIZE = 3000
+JOURNAL_PAGE_SIZE = (2550, 3300)
+
+
+def fixture_root() -> Path:
+    root = Path(tempfile.gettempdir()) / f"mockup-bench-fixtures-v{FIXTURE_VERSION}"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def make_pattern(seed: int, size: int = PATTERN_SIZE) -> Image.Image:
+    """Seamless-looking colour pattern: layered sinusoids plus fine noise."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:size, 0:size].astype(np.float32) / size * 2 * np.pi
+    channels = []
+    for _ in range(3):
+        fx, fy = rng.integers(2, 9, size=2)
+        phase = rng.uniform(0, 2 * np.pi)
+        wave = np.sin(fx * x + phase) * np.cos(fy * y - phase)
+        channels.append(127 + 100 * wave + rng.normal(0, 12, (size, size)))
+    array = np.clip(np.stack(channels, axis=2), 0, 255).astype(np.uint8)
+    return Image.frombuffer("RGB", (size, size), array, "raw", "RGB", 0, 1)
+
+
+def make_clipart(seed: int, size: int = CLIPART_SIZE) -> Image.Image:
+    """Transparent clipart: soft-edged shapes with a transparent margin."""
+    rng = np.random.default_rng(seed)
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    margin = size // 8
+    for _ in range(int(rng.integers(6, 12))):
+        x0, y0 = rng.integers(margin, size - 2 * margin, size=2)
+        w, h = rng.integers(size // 10, size // 3, size=2)
+        color = tuple(int(c) for c in rng.integers(0, 256, size=3)) + (
+            int(rng.integers(160, 256)),
+        )
+        if rng.random() < 0.5:
+            draw.ellipse((x0, y0, x0 + w, y0 + h), fill=color)
+        else:
+            draw.polygon(
+                [(x0, y0 + h), (x0 + w // 2, y0), (x0 + w, y0 + h)], fill=color
+            )
+    return img.filter(ImageFilter.GaussianBlur(2))
+
+
+def make_journal_page(seed: int, size=JOURNAL_PAGE_SIZE) -> Image.Image:
+    """Paper texture with ruled lines and a tinted border."""
+    rng = np.random.default_rng(seed)
+    width, height = size
+    base = rng.integers(200, 245, size=3)
+    noise = rng.normal(0, 6, (height, width, 1))
+    array = np.clip(base + noise, 0, 255).astype(np.uint8)
+    img = Image.frombuffer("RGB", size, array, "raw", "RGB", 0, 1).copy()
+    draw = ImageDraw.Draw(img)
+    line_color = tuple(int(c) for c in rng.integers(80, 160, size=3))
+    for y in range(300, height - 200, 90):
+        draw.line((200, y, width - 200, y), fill=line_color, width=3)
+    draw.rectangle((60, 60, width - 60, height - 60), outline=line_color, width=12)
+    return img
+
+
+def _build_folder(name: str, count: int, factory, extension: str, **save_kwargs) -> str:
+    folder = fixture_root() / name
+    marker = folder / ".complete"
+    if marker.exists():
+        return str(folder)
+
+    if folder.exists():
+        shutil.rmtree(folder)
+    folder.mkdir(parents=True)
+    for index in range(count):
+        img = factory(index)
+        img.save(folder / f"{name}_{index + 1}.{extension}", dpi=(300, 300), **save_kwargs)
+    marker.touch()
+    return str(folder)
+
+
+def pattern_folder(count: int = 6) -> str:
+    """Folder of 3600x3600 pattern JPEGs."""
+    return _build_folder(
+        "patterns", count, lambda i: make_pattern(100 + i), "jpg", quality=90
+    )
+
+
+def oversized_pattern_folder(count: int = 4) -> str:
+    """Folder of 4800x4800 pattern JPEGs that the resizer has to shrink."""
+    return _build_folder(
+        "patterns_oversized",
+        count,
+        lambda i: make_pattern(200 + i, OVERSIZED_PATTERN_SIZE),
+        "jpg",
+        quality=90,
+    )
+
+
+def clipart_folder(count: int = 8) -> str:
+    """Folder of 3000x3000 transparent clipart PNGs."""
+    return _build_folder("clipart", count, lambda i: make_clipart(300 + i), "png")
+
+
+def journal_folder(count: int = 6) -> str:
+    """Folder of 2550x3300 journal page JPEGs."""
+    return _build_folder(
+        "journal_pages", count, lambda i: make_journal_page(400 + i), "jpg", quality=90
+    )
+
+
+def ensure_all() -> None:
+    """Generate every fixture folder (no-op when already cached)."""
+    pattern_folder()
+    oversized_pattern_folder()
+    clipart_folder()
+    journal_folder()
+
+
+def fresh_copy(source_folder: str, parent: str) -> str:
+    """Copy a fixture folder into ``parent`` so a benchmark can modify it."""
+    target = os.path.join(parent, os.path.basename(source_folder))
+    shutil.copytree(source_folder, target, ignore=shutil.ignore_patterns(".complete"))
+    return target
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the mockup, resize, video and zip hot paths.
+
+Each benchmark runs in its own interpreter against deterministic synthetic
+fixtures (see fixtures.py) and reports wall time, per-step breakdown and
+peak RSS. Results are written as JSON and can be compared against a stored
+baseline; the comparison exits non-zero on regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py list
+    python benchmarks/run_benchmarks.py run [-k NAME ...] [--repeat N] [--save-baseline]
+    python benchmarks/run_benchmarks.py compare [--baseline FILE] [--current FILE] [--threshold 0.15]
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import fixtures
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "baseline.json"
+DEFAULT_RESULTS = BENCH_DIR / "results" / "latest.json"
+
+
+class BenchContext:
+    """Work directory and step timer handed to each benchmark."""
+
+    def __init__(self, work_dir: str):
+        self.work_dir = work_dir
+        self.steps: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + time.perf_counter() - start
+
+
+BENCHMARKS: Dict[str, Callable[[BenchContext], None]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark. Only time spent inside ``ctx.step`` is measured."""
+
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+# ----------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------
+
+
+@benchmark("watermark")
+def bench_watermark(ctx: BenchContext) -> None:
+    from PIL import Image
+    from src.utils.common import apply_watermark
+
+    image_path = sorted(Path(fixtures.pattern_folder()).glob("*.jpg"))[0]
+    image = Image.open(image_path).convert("RGB")
+    with ctx.step("apply_watermark"):
+        apply_watermark(image)
+
+
+@benchmark("shared_main_mockup")
+def bench_shared_main_mockup(ctx: BenchContext) -> None:
+    from src.utils.mockup_utils import create_shared_main_mockup
+
+    folder = fixtures.fresh_copy(fixtures.pattern_folder(), ctx.work_dir)
+    with ctx.step("create_shared_main_mockup"):
+        create_shared_main_mockup(
+            folder,
+            "Benchmark Patterns",
+            "6 Seamless Patterns",
+            "commercial use | 300 dpi | 12x12in jpg",
+        )
+
+
+@benchmark("large_grid")
+def bench_large_grid(ctx: BenchContext) -> None:
+    from src.products.pattern.layered import create_large_grid
+
+    folder = fixtures.fresh_copy(fixtures.pattern_folder(), ctx.work_dir)
+    with ctx.step("create_large_grid"):
+        create_large_grid(folder)
+
+
+@benchmark("resize_pattern")
+def bench_resize_pattern(ctx: BenchContext) -> None:
+    from src.utils.resize_utils import ImageResizer
+
+    folder = fixtures.fresh_copy(fixtures.oversized_pattern_folder(), ctx.work_dir)
+    with ctx.step("resize_pattern_style"):
+        ImageResizer().resize_pattern_style(folder)
+
+
+@benchmark("resize_clipart")
+def bench_resize_clipart(ctx: BenchContext) -> None:
+    from src.utils.resize_utils import ImageResizer
+
+    folder = fixtures.fresh_copy(fixtures.clipart_folder(), ctx.work_dir)
+    with ctx.step("resize_clipart_style"):
+        ImageResizer().resize_clipart_style(folder)
+
+
+@benchmark("video_slideshow")
+def bench_video_slideshow(ctx: BenchContext) -> None:
+    from src.utils.video_utils import VideoCreator
+
+    images = sorted(str(p) for p in Path(fixtures.clipart_folder()).glob("*.png"))
+    output = os.path.join(ctx.work_dir, "slideshow.mp4")
+    with ctx.step("create_slideshow_video"):
+        VideoCreator().create_slideshow_video(images, output)
+
+
+@benchmark("video_tiling")
+def bench_video_tiling(ctx: BenchContext) -> None:
+    from src.utils.video_utils import VideoCreator
+
+    image = sorted(str(p) for p in Path(fixtures.pattern_folder()).glob("*.jpg"))[0]
+    output = os.path.join(ctx.work_dir, "tiling.mp4")
+    with ctx.step("create_tiling_video"):
+        VideoCreator().create_tiling_video(image, output)
+
+
+@benchmark("smart_zip")
+def bench_smart_zip(ctx: BenchContext) -> None:
+    from src.utils.file_operations import create_smart_zip_files
+
+    output_dir = os.path.join(ctx.work_dir, "zipped")
+    with ctx.step("create_smart_zip_files"):
+        create_smart_zip_files(fixtures.pattern_folder(), output_dir)
+
+
+def _run_workflow_steps(ctx: BenchContext, product_type: str, folder: str, steps: List[str]) -> None:
+    from src.core.base_processor import ProcessingConfig
+    from src.core.processor_factory import ProcessorFactory
+
+    config = ProcessingConfig(product_type=product_type, input_dir=folder, output_dir=folder)
+    processor = ProcessorFactory.create_processor(config)
+    for step in steps:
+        with ctx.step(step):
+            processor.run_workflow([step])
+
+
+@benchmark("pattern_workflow")
+def bench_pattern_workflow(ctx: BenchContext) -> None:
+    folder = fixtures.fresh_copy(fixtures.pattern_folder(), ctx.work_dir)
+    _run_workflow_steps(ctx, "pattern", folder, ["resize", "mockup", "video", "zip"])
+
+
+@benchmark("clipart_workflow")
+def bench_clipart_workflow(ctx: BenchContext) -> None:
+    folder = fixtures.fresh_copy(fixtures.clipart_folder(), ctx.work_dir)
+    _run_workflow_steps(ctx, "clipart", folder, ["resize", "mockup", "video", "zip"])
+
+
+@benchmark("journal_workflow")
+def bench_journal_workflow(ctx: BenchContext) -> None:
+    folder = fixtures.fresh_copy(fixtures.journal_folder(), ctx.work_dir)
+    _run_workflow_steps(ctx, "journal_papers", folder, ["resize", "mockup", "zip"])
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB.
+
+    VmHWM is read first because Linux carries ru_maxrss over from the
+    parent across exec, which would report the runner's own peak.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_worker(name: str, repeat: int, output_file: str) -> None:
+    """Run one benchmark ``repeat`` times in this process and write JSON."""
+    func = BENCHMARKS[name]
+    rss_before = _peak_rss_mb()
+    walls, step_runs = [], []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as work_dir:
+            ctx = BenchContext(work_dir)
+            func(ctx)
+            walls.append(sum(ctx.steps.values()))
+            step_runs.append(ctx.steps)
+
+    result = {
+        "wall_s": {
+            "min": min(walls),
+            "median": statistics.median(walls),
+            "runs": walls,
+        },
+        "steps_s": {
+            step: statistics.median(run[step] for run in step_runs)
+            for step in step_runs[0]
+        },
+        "peak_rss_mb": _peak_rss_mb(),
+        "startup_rss_mb": rss_before,
+    }
+    with open(output_file, "w") as f:
+        json.dump(result, f)
+
+
+def _run_in_subprocess(name: str, repeat: int) -> Dict:
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        output_file = tmp.name
+    try:
+        proc = subprocess.run(
+            [sys.executable, __file__, "_worker", name, str(repeat), output_file],
+            cwd=project_root,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if proc.returncode != 0:
+            return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr else "failed"}
+        with open(output_file) as f:
+            return json.load(f)
+    finally:
+        os.unlink(output_file)
+
+
+def _environment() -> Dict:
+    import cv2
+    import numpy
+    import PIL
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "pillow": PIL.__version__,
+        "numpy": numpy.__version__,
+        "opencv": cv2.__version__,
+    }
+
+
+def cmd_run(args) -> int:
+    names = [n for n in BENCHMARKS if not args.k or any(k in n for k in args.k)]
+    if not names:
+        print(f"✗ No benchmarks match: {', '.join(args.k)}")
+        return 1
+
+    print("Preparing fixtures...")
+    fixtures.ensure_all()
+
+    results = {}
+    for name in names:
+        result = _run_in_subprocess(name, args.repeat)
+        results[name] = result
+        if "error" in result:
+            print(f"✗ {name:<20} {result['error']}")
+            continue
+        print(
+            f"✓ {name:<20} {result['wall_s']['median'] * 1000:9.1f} ms  "
+            f"peak RSS {result['peak_rss_mb']:7.1f} MB"
+        )
+        if len(result["steps_s"]) > 1:
+            for step, seconds in result["steps_s"].items():
+                print(f"    {step:<18} {seconds * 1000:9.1f} ms")
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "repeat": args.repeat,
+        "environment": _environment(),
+        "benchmarks": results,
+    }
+    output = DEFAULT_BASELINE if args.save_baseline else Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {output}")
+    return 0 if all("error" not in r for r in results.values()) else 1
+
+
+def cmd_compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    print(f"{'benchmark':<22}{'baseline':>12}{'current':>12}{'change':>9}{'peak RSS':>18}")
+    regressions = []
+    for name, cur in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if not base or "error" in base or "error" in cur:
+            print(f"{name:<22}{'-':>12}{'-':>12}{'n/a':>9}")
+            continue
+
+        base_ms = base["wall_s"]["median"] * 1000
+        cur_ms = cur["wall_s"]["median"] * 1000
+        change = cur_ms / base_ms - 1
+        rss = f"{base['peak_rss_mb']:.0f}→{cur['peak_rss_mb']:.0f} MB"
+        flag = ""
+        if change > args.threshold:
+            flag = "  ✗"
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = "  ✓"
+        print(f"{name:<22}{base_ms:10.1f}ms{cur_ms:10.1f}ms{change:+8.1%}{rss:>18}{flag}")
+
+        for step, seconds in cur["steps_s"].items():
+            base_step = base["steps_s"].get(step)
+            if base_step and len(cur["steps_s"]) > 1:
+                step_change = seconds / base_step - 1
+                print(
+                    f"  {step:<20}{base_step * 1000:10.1f}ms{seconds * 1000:10.1f}ms"
+                    f"{step_change:+8.1%}"
+                )
+
+    if baseline.get("environment") != current.get("environment"):
+        print("\n⚠️ Baseline was recorded in a different environment; compare with care.")
+    if regressions:
+        print(f"\n✗ Regressions over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\n✓ No regressions over {args.threshold:.0%}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("list", help="List benchmarks")
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument("-k", action="append", help="Only run benchmarks whose name contains this")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark")
+    run_parser.add_argument("--output", default=str(DEFAULT_RESULTS), help="Results file")
+    run_parser.add_argument(
+        "--save-baseline", action="store_true", help=f"Write results to {DEFAULT_BASELINE}"
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="Compare results to a baseline")
+    compare_parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    compare_parser.add_argument("--current", default=str(DEFAULT_RESULTS))
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Allowed slowdown (0.15 = 15%%)"
+    )
+
+    worker_parser = subparsers.add_parser("_worker")
+    worker_parser.add_argument("name")
+    worker_parser.add_argument("repeat", type=int)
+    worker_parser.add_argument("output_file")
+
+    args = parser.parse_args()
+    if args.command == "list":
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+    if args.command == "run":
+        return cmd_run(args)
+    if args.command == "compare":
+        return cmd_compare(args)
+    if args.command == "_worker":
+        run_worker(args.name, args.repeat, args.output_file)
+        return 0
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,12 +20,6 @@ from src.core.config_manager import get_config_manager
 from src.utils.env_loader import setup_environment
 from src.utils.common import setup_logging
 
-# Import processors to register them
-from src.products.pattern.processor import PatternProcessor
-from src.products.clipart.processor import ClipartProcessor
-from src.products.border_clipart.processor import BorderClipartProcessor
-from src.products.journal_papers.processor import JournalPapersProcessor
-
 logger = setup_logging(__name__, gui_only=False)  # CLI should use console logging
 
 
@@ -40,6 +34,9 @@ Examples:
   %(prog)s process pattern input/my-pattern       # Process pattern with default workflow
   %(prog)s process clipart input/my-clipart       # Process clipart with default workflow
   %(prog)s process pattern input/my-pattern --steps resize mockup  # Custom workflow steps
+  %(prog)s watch --product-type pattern           # Process folders dropped into input/ as they arrive
+  %(prog)s batch --manifest jobs.csv --workers 2  # Process the folders listed in a manifest
+  %(prog)s batch --glob "input/*" --product-type clipart   # Process every matching folder
   %(prog)s list-types                             # List available product types
         """
     )
@@ -60,6 +57,48 @@ Examples:
                                help='AI provider for content generation')
     process_parser.add_argument('--no-video', action='store_true', help='Skip video creation')
     process_parser.add_argument('--no-zip', action='store_true', help='Skip ZIP file creation')
+    process_parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'],
+                               help='Capture a profile of the run into the output directory')
+    process_parser.add_argument('--encode-profile', choices=['draft', 'fast', 'balanced', 'archival'],
+                               help='Encode profile for every output (default: per product type)')
+    
+    # Watch command
+    watch_parser = subparsers.add_parser('watch', help='Process folders dropped into the input folder')
+    watch_parser.add_argument('input_dir', nargs='?', default='input', help='Folder to watch (default: input)')
+    watch_parser.add_argument('--product-type',
+                             help='Product type for folders not inside a product type folder '
+                                  '(input/<product_type>/<folder> always uses that type)')
+    watch_parser.add_argument('--settle', type=float, default=30.0,
+                             help='Seconds without changes before a folder is processed (default: 30)')
+    watch_parser.add_argument('--poll-interval', type=float, default=5.0,
+                             help='Seconds between checks (default: 5)')
+    watch_parser.add_argument('--concurrency', type=int, default=1, help='Folders processed at once (default: 1)')
+    watch_parser.add_argument('--polling', action='store_true', help='Poll instead of using inotify')
+    watch_parser.add_argument('--steps', nargs='*', help='Workflow steps to run')
+    watch_parser.add_argument('--ai-provider', default='gemini', choices=['gemini', 'openai'],
+                             help='AI provider for content generation')
+    watch_parser.add_argument('--no-video', action='store_true', help='Skip video creation')
+    watch_parser.add_argument('--no-zip', action='store_true', help='Skip ZIP file creation')
+    watch_parser.add_argument('--encode-profile', choices=['draft', 'fast', 'balanced', 'archival'],
+                             help='Encode profile for every output (default: per product type)')
+    
+    # Batch command
+    batch_parser = subparsers.add_parser('batch', help='Process many folders from a manifest or glob')
+    batch_source = batch_parser.add_mutually_exclusive_group(required=True)
+    batch_source.add_argument('--manifest',
+                              help='CSV or JSONL manifest with folder, product_type, steps and overrides')
+    batch_source.add_argument('--glob', help='Folder glob, e.g. "input/*" (requires --product-type)')
+    batch_parser.add_argument('--product-type', help='Product type for --glob folders')
+    batch_parser.add_argument('--results', default='batch_results.jsonl',
+                              help='JSONL results log (default: batch_results.jsonl)')
+    batch_parser.add_argument('--workers', type=int, default=1, help='Folders processed in parallel (default: 1)')
+    batch_parser.add_argument('--no-resume', action='store_true',
+                              help='Re-run entries that already succeeded in the results log')
+    batch_parser.add_argument('--steps', nargs='*', help='Workflow steps for entries without their own')
+    batch_parser.add_argument('--no-video', action='store_true', help='Skip video creation')
+    batch_parser.add_argument('--no-zip', action='store_true', help='Skip ZIP file creation')
+    batch_parser.add_argument('--encode-profile', choices=['draft', 'fast', 'balanced', 'archival'],
+                              help='Encode profile for entries that do not override it')
     
     # List types command
     list_parser = subparsers.add_parser('list-types', help='List available product types')
@@ -115,6 +154,12 @@ def run_process(args):
         if args.no_zip and 'zip' in workflow_steps:
             workflow_steps.remove('zip')
         
+        custom_settings = {}
+        if args.profile:
+            custom_settings["profile"] = args.profile
+        if args.encode_profile:
+            custom_settings["encode_profile"] = args.encode_profile
+        
         # Create configuration
         config = ProcessingConfig(
             product_type=args.product_type,
@@ -122,7 +167,8 @@ def run_process(args):
             output_dir=output_dir,
             ai_provider=args.ai_provider,
             create_video=not args.no_video,
-            create_zip=not args.no_zip
+            create_zip=not args.no_zip,
+            custom_settings=custom_settings
         )
         
         # Create and run processor
@@ -144,6 +190,13 @@ def run_process(args):
         print(f"Output Directory: {output_dir}")
         print(f"Workflow Steps: {', '.join(workflow_steps)}")
         print(f"Status: {'SUCCESS' if all(r.get('success', True) for r in results.values() if isinstance(r, dict)) else 'PARTIAL'}")
+        metrics = results.get("metrics", {})
+        for step, step_metrics in metrics.get("steps", {}).items():
+            print(f"  {step:<14} {step_metrics['wall_time_s']:8.2f}s  {step_metrics['images_decoded']:4d} images decoded")
+        if metrics.get("report_file"):
+            print(f"Run Report: {metrics['report_file']}")
+        if metrics.get("profile"):
+            print(f"Profile: {metrics['profile']['file']}")
         print("="*60)
         
     except Exception as e:
@@ -151,6 +204,87 @@ def run_process(args):
         sys.exit(1)
 
 
+def run_watch(args):
+    """Watch the input folder and process folders once their uploads settle."""
+    from src.core.folder_watcher import FolderWatcher
+    
+    skip_steps = [step for step, skip in (('video', args.no_video), ('zip', args.no_zip)) if skip]
+    custom_settings = {"encode_profile": args.encode_profile} if args.encode_profile else {}
+    try:
+        watcher = FolderWatcher(
+            input_dir=args.input_dir,
+            product_type=args.product_type,
+            settle_seconds=args.settle,
+            poll_interval=args.poll_interval,
+            concurrency=max(1, args.concurrency),
+            steps=args.steps,
+            skip_steps=skip_steps,
+            ai_provider=args.ai_provider,
+            custom_settings=custom_settings,
+            use_inotify=not args.polling,
+        )
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        logger.info("Watcher stopped")
+
+
+def run_batch(args):
+    """Process the folders of a manifest or glob and log one JSON result per folder."""
+    from src.core.batch import entries_from_glob, load_manifest, run_batch as run_batch_entries
+    
+    try:
+        if args.manifest:
+            entries = load_manifest(args.manifest)
+        elif not args.product_type:
+            logger.error("--glob requires --product-type")
+            sys.exit(1)
+        else:
+            entries = entries_from_glob(args.glob, args.product_type)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not read batch entries: {e}")
+        sys.exit(1)
+    
+    if not entries:
+        logger.error("No folders to process")
+        sys.exit(1)
+    
+    for entry in entries:
+        if entry.steps is None:
+            entry.steps = args.steps or None
+        if args.encode_profile:
+            entry.overrides.setdefault("encode_profile", args.encode_profile)
+    
+    skip_steps = [step for step, skip in (('video', args.no_video), ('zip', args.no_zip)) if skip]
+    try:
+        summary = run_batch_entries(
+            entries,
+            results_log=args.results,
+            workers=max(1, args.workers),
+            resume=not args.no_resume,
+            skip_steps=skip_steps,
+        )
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    
+    print("\n" + "="*60)
+    print("BATCH SUMMARY")
+    print("="*60)
+    print(f"Entries:   {summary['total']}")
+    print(f"Skipped:   {summary['skipped']} (already succeeded)")
+    print(f"Succeeded: {summary['succeeded']}")
+    print(f"Failed:    {summary['failed']}")
+    print(f"Results:   {summary['results_log']}")
+    print("="*60)
+    if summary["failed"]:
+        sys.exit(1)
+
+
 def run_list_types(args):
     """List available product types."""
     config_manager = get_config_manager()
@@ -225,15 +359,15 @@ def run_generate_content(args):
 
 def main():
     """Main entry point."""
-    # Setup environment first
+    # Parse arguments first so --help doesn't need the environment
+    parser = create_parser()
+    args = parser.parse_args()
+    
+    # Setup environment
     if not setup_environment():
         print("Environment setup failed. Please check your .env file.")
         return
     
-    # Parse arguments
-    parser = create_parser()
-    args = parser.parse_args()
-    
     # Default to GUI if no command specified
     if not args.command:
         args.command = 'gui'
@@ -244,6 +378,10 @@ def main():
         run_gui(args)
     elif args.command == 'process':
         run_process(args)
+    elif args.command == 'watch':
+        run_watch(args)
+    elif args.command == 'batch':
+        run_batch(args)
     elif args.command == 'list-types':
         run_list_types(args)
     elif args.command == 'generate-content':
@@ -0,0 +1,118 @@
+"""
+Thread-safe event log backing the web UI's Server-Sent Events stream.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class EventLog:
+    """Bounded ring buffer of events with monotonically increasing ids.
+
+    Workflow threads publish log events while any number of clients read
+    them. Reading never removes events, so several browser tabs each see
+    every message, and a client that reconnects with the id of the last
+    event it saw (``Last-Event-ID``) resumes where it left off as long as
+    those events are still in the buffer. An id newer than any event in
+    the log (the client saw a previous server process) replays the buffer.
+    """
+
+    def __init__(self, maxlen: int = 500):
+        self._events: deque = deque(maxlen=maxlen)
+        self._next_id = 1
+        self._condition = threading.Condition()
+
+    @property
+    def last_id(self) -> int:
+        """Id of the most recently published event (0 if none)."""
+        with self._condition:
+            return self._next_id - 1
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> int:
+        """Append an event and wake up waiting readers.
+
+        Args:
+            event_type: SSE event name (e.g. ``log``)
+            data: JSON-serializable payload
+
+        Returns:
+            The id assigned to the event
+        """
+        with self._condition:
+            event_id = self._next_id
+            self._next_id += 1
+            self._events.append({"id": event_id, "event": event_type, "data": data})
+            self._condition.notify_all()
+            return event_id
+
+    def _clamp(self, last_id: int) -> int:
+        # An id from before a server restart is ahead of this log; replay
+        # the buffer instead of waiting for new ids to catch up with it
+        return 0 if last_id > self._next_id - 1 else max(last_id, 0)
+
+    def resume_id(self, last_id: int) -> int:
+        """Id to resume after: ``last_id``, or 0 if it is from an earlier log."""
+        with self._condition:
+            return self._clamp(last_id)
+
+    def since(self, last_id: int = 0) -> List[Dict[str, Any]]:
+        """Return the buffered events with an id greater than ``last_id``."""
+        with self._condition:
+            last_id = self._clamp(last_id)
+            return [e for e in self._events if e["id"] > last_id]
+
+    def wait_since(self, last_id: int, timeout: float) -> List[Dict[str, Any]]:
+        """Block until events newer than ``last_id`` exist or the timeout expires."""
+        with self._condition:
+            last_id = self._clamp(last_id)
+            self._condition.wait_for(lambda: self._next_id - 1 > last_id, timeout)
+            return [e for e in self._events if e["id"] > last_id]
+
+    def stream(
+        self,
+        last_id: int = 0,
+        status_provider: Optional[Callable[[], Dict[str, Any]]] = None,
+        heartbeat: float = 1.0,
+    ) -> Iterator[str]:
+        """Generate an SSE stream starting after ``last_id``.
+
+        Args:
+            last_id: Id of the last event the client has seen
+            status_provider: Optional callable returning the current status;
+                a ``status`` event is sent on connect and whenever it changes
+            heartbeat: Seconds between wake-ups to check the status and send
+                a keep-alive comment when nothing else happened
+
+        Yields:
+            SSE-formatted chunks
+        """
+        last_id = self.resume_id(last_id)
+        last_status = None
+        last_sent = time.monotonic()
+        yield "retry: 2000\n\n"
+
+        while True:
+            if status_provider is not None:
+                status = json.dumps(status_provider(), default=str, sort_keys=True)
+                if status != last_status:
+                    last_status = status
+                    last_sent = time.monotonic()
+                    yield f"event: status\ndata: {status}\n\n"
+
+            for event in self.wait_since(last_id, heartbeat):
+                last_id = event["id"]
+                last_sent = time.monotonic()
+                yield format_sse(event)
+
+            if time.monotonic() - last_sent >= heartbeat * 15:
+                last_sent = time.monotonic()
+                yield ": keep-alive\n\n"
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Format a buffered event as an SSE message."""
+    payload = json.dumps(event["data"], default=str)
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {payload}\n\n"
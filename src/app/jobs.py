@@ -0,0 +1,405 @@
+"""
+SQLite-backed job queue and registry for the web app.
+
+Long-running work (batch workflows, listing preparation, Etsy uploads) is
+submitted as a job instead of a bare thread. Jobs are persisted with their
+parameters, progress, logs and result, and are executed by a small worker
+pool per job class so that two large jobs never run on top of each other.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from src.app.sqlite_store import SQLiteStore, data_path
+
+# Job classes and the default number of workers for each. CPU-bound jobs
+# (resizing, mockups, videos, zips) run one at a time; network-bound jobs
+# (AI content, Etsy uploads) mostly wait on remote APIs.
+JOB_CLASS_CPU = "cpu"
+JOB_CLASS_NETWORK = "network"
+DEFAULT_POOL_SIZES = {JOB_CLASS_CPU: 1, JOB_CLASS_NETWORK: 1}
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED)
+
+JOBS_DB_PATH = data_path("jobs.db")
+
+JOBS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    job_class TEXT NOT NULL,
+    description TEXT,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    progress_message TEXT,
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, job_class, created_at);
+CREATE TABLE IF NOT EXISTS job_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    level TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_logs_job ON job_logs (job_id, id);
+"""
+
+
+class JobCancelled(Exception):
+    """Raised inside a job handler when the job has been cancelled."""
+    pass
+
+
+class JobStore(SQLiteStore):
+    """Persistence for jobs and their logs."""
+
+    SCHEMA = JOBS_SCHEMA
+
+    def __init__(self, db_path: str = JOBS_DB_PATH):
+        super().__init__(db_path)
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["params"] = json.loads(job["params"]) if job["params"] else {}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+    def create(
+        self, kind: str, job_class: str, params: Dict[str, Any], description: str
+    ) -> Dict[str, Any]:
+        """Insert a new queued job and return it."""
+        job_id = uuid.uuid4().hex[:12]
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, job_class, description, params, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    kind,
+                    job_class,
+                    description,
+                    json.dumps(params, default=str),
+                    STATUS_QUEUED,
+                    time.time(),
+                ),
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT * FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list(
+        self, status: Optional[str] = None, limit: int = 50, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """List jobs, newest first, optionally filtered by status."""
+        query = "SELECT * FROM jobs"
+        args: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            args.append(status)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        args.extend([limit, offset])
+        rows = self._connect().execute(query, args).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def count(self, status: str) -> int:
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)
+        ).fetchone()[0]
+
+    def active_counts(self) -> Dict[tuple, int]:
+        """Number of queued and running jobs keyed by (job_class, status)."""
+        rows = self._connect().execute(
+            "SELECT job_class, status, COUNT(*) AS n FROM jobs "
+            "WHERE status IN (?, ?) GROUP BY job_class, status",
+            (STATUS_QUEUED, STATUS_RUNNING),
+        ).fetchall()
+        return {(row["job_class"], row["status"]): row["n"] for row in rows}
+
+    def claim_next(self, job_class: str) -> Optional[Dict[str, Any]]:
+        """Atomically move the oldest queued job of a class to running."""
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? AND job_class = ? "
+                "ORDER BY created_at LIMIT 1",
+                (STATUS_QUEUED, job_class),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                (STATUS_RUNNING, time.time(), row["id"]),
+            )
+        return self.get(row["id"])
+
+    def set_progress(
+        self, job_id: str, progress: float, message: Optional[str] = None
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET progress = ?, progress_message = COALESCE(?, progress_message) "
+                "WHERE id = ?",
+                (max(0.0, min(1.0, progress)), message, job_id),
+            )
+
+    def append_log(self, job_id: str, message: str, level: str = "info") -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO job_logs (job_id, timestamp, level, message) VALUES (?, ?, ?, ?)",
+                (job_id, time.time(), level, message),
+            )
+
+    def logs(self, job_id: str, since: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """Return log entries for a job with an id greater than ``since``."""
+        rows = self._connect().execute(
+            "SELECT id, timestamp, level, message FROM job_logs "
+            "WHERE job_id = ? AND id > ? ORDER BY id LIMIT ?",
+            (job_id, since, limit),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, "
+                "progress = CASE WHEN ? = ? THEN 1 ELSE progress END WHERE id = ?",
+                (
+                    status,
+                    json.dumps(result, default=str) if result is not None else None,
+                    error,
+                    time.time(),
+                    status,
+                    STATUS_SUCCEEDED,
+                    job_id,
+                ),
+            )
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        """Cancel a queued job or flag a running one.
+
+        Returns:
+            The job's status after the request, or None if it does not exist
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT status FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row["status"] == STATUS_QUEUED:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ?",
+                    (STATUS_CANCELLED, time.time(), job_id),
+                )
+                return STATUS_CANCELLED
+            if row["status"] == STATUS_RUNNING:
+                conn.execute(
+                    "UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,)
+                )
+            return row["status"]
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        row = self._connect().execute(
+            "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return bool(row and row[0])
+
+    def fail_interrupted(self) -> int:
+        """Mark jobs left running by a previous process as failed.
+
+        They are not re-queued: a half-finished upload could otherwise
+        create duplicate Etsy listings.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status = ?",
+                (
+                    STATUS_FAILED,
+                    "Interrupted by application restart",
+                    time.time(),
+                    STATUS_RUNNING,
+                ),
+            )
+            return cursor.rowcount
+
+
+class JobContext:
+    """Handle passed to a job handler for reporting progress and logs."""
+
+    def __init__(self, job: Dict[str, Any], store: JobStore):
+        self.job = job
+        self.id = job["id"]
+        self.params = job["params"]
+        self._store = store
+
+    def log(self, message: str, level: str = "info") -> None:
+        self._store.append_log(self.id, message, level)
+
+    def set_progress(self, progress: float, message: Optional[str] = None) -> None:
+        """Record progress as a fraction between 0 and 1."""
+        self._store.set_progress(self.id, progress, message)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._store.is_cancel_requested(self.id)
+
+    def check_cancelled(self) -> None:
+        """Raise JobCancelled if cancellation was requested."""
+        if self.cancelled:
+            raise JobCancelled(f"Job {self.id} was cancelled")
+
+
+JobHandler = Callable[[JobContext], Dict[str, Any]]
+
+
+class JobManager:
+    """Runs queued jobs on per-class worker pools.
+
+    Handlers are registered by job kind and receive a JobContext; the dict
+    they return is stored as the job result. A result with
+    ``"success": False`` marks the job as failed.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        pool_sizes: Optional[Dict[str, int]] = None,
+        on_change: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.store = store
+        self.pool_sizes = dict(pool_sizes or DEFAULT_POOL_SIZES)
+        self.on_change = on_change
+        self._handlers: Dict[str, tuple] = {}
+        self._wakeup = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._local = threading.local()
+        self._started = False
+
+    def register(self, kind: str, handler: JobHandler, job_class: str) -> None:
+        """Register the handler that runs jobs of ``kind``."""
+        if job_class not in self.pool_sizes:
+            raise ValueError(f"Unknown job class: {job_class}")
+        self._handlers[kind] = (handler, job_class)
+
+    def start(self, pool_sizes: Optional[Dict[str, int]] = None) -> None:
+        """Start the worker threads (idempotent).
+
+        Jobs left running by a previous process are marked failed; jobs
+        that were still queued are picked up again.
+        """
+        with self._wakeup:
+            if self._started:
+                return
+            if pool_sizes:
+                self.pool_sizes.update(pool_sizes)
+            self._started = True
+
+        self.store.fail_interrupted()
+        for job_class, size in self.pool_sizes.items():
+            for index in range(max(1, size)):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    args=(job_class,),
+                    name=f"job-{job_class}-{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def submit(
+        self, kind: str, params: Dict[str, Any], description: str
+    ) -> Dict[str, Any]:
+        """Queue a job and return its record."""
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind: {kind}")
+        _, job_class = self._handlers[kind]
+        job = self.store.create(kind, job_class, params, description)
+        self.start()
+        self._notify(job)
+        with self._wakeup:
+            self._wakeup.notify_all()
+        return job
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Request cancellation; running jobs stop at their next checkpoint."""
+        if self.store.request_cancel(job_id) is None:
+            return None
+        job = self.store.get(job_id)
+        self._notify(job)
+        return job
+
+    def current_job(self) -> Optional[JobContext]:
+        """Return the context of the job running on this thread, if any."""
+        return getattr(self._local, "context", None)
+
+    def _notify(self, job: Dict[str, Any]) -> None:
+        if self.on_change is not None:
+            try:
+                self.on_change(job)
+            except Exception:
+                pass
+
+    def _worker_loop(self, job_class: str) -> None:
+        while True:
+            job = self.store.claim_next(job_class)
+            if job is None:
+                with self._wakeup:
+                    self._wakeup.wait(timeout=5.0)
+                continue
+            self._run(job)
+
+    def _run(self, job: Dict[str, Any]) -> None:
+        context = JobContext(job, self.store)
+        self._local.context = context
+        self._notify(job)
+
+        status, result, error = STATUS_SUCCEEDED, None, None
+        try:
+            handler, _ = self._handlers.get(job["kind"], (None, None))
+            if handler is None:
+                raise ValueError(f"No handler registered for job kind: {job['kind']}")
+            result = handler(context) or {}
+            if result.get("success") is False:
+                status, error = STATUS_FAILED, result.get("error")
+        except JobCancelled as e:
+            status, error = STATUS_CANCELLED, str(e)
+            context.log(f"⚠️ {e}", "warning")
+        except Exception as e:
+            status, error = STATUS_FAILED, str(e)
+            context.log(f"✗ Job failed: {e}", "error")
+        finally:
+            self._local.context = None
+
+        self.store.finish(job["id"], status, result, error)
+        self._notify(self.store.get(job["id"]))
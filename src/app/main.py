@@ -10,7 +10,7 @@ import threading
 import webbrowser
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from functools import wraps
 from dataclasses import dataclass
 
@@ -25,18 +25,66 @@ from src.core.base_processor import ProcessingConfig
 from src.utils.env_loader import setup_environment
 from src.utils.ai_utils import get_available_providers
 from src.utils.common import ensure_dir_exists
-
-# Import processors to register them
-from src.products.pattern.processor import PatternProcessor
-from src.products.clipart.processor import ClipartProcessor
-from src.products.border_clipart.processor import BorderClipartProcessor
-from src.products.journal_papers.processor import JournalPapersProcessor
+from src.app.event_stream import EventLog
+from src.utils.metrics import JOB_QUEUE_DEPTH, PROMETHEUS_CONTENT_TYPE, REGISTRY
+from src.app.jobs import (
+    JobStore,
+    JobManager,
+    JobContext,
+    JobCancelled,
+    JOB_CLASS_CPU,
+    JOB_CLASS_NETWORK,
+    FINISHED_STATUSES,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+)
+from src.app.prepared_listings import (
+    PreparedListingsStore,
+    LISTING_STATUSES,
+    LISTING_UPLOADED,
+    LISTING_FAILED,
+    PENDING_STATUSES,
+    UPLOADABLE_STATUSES,
+)
 
 # Global variables for logging
-log_messages: List[Dict[str, Any]] = []
+event_log = EventLog(maxlen=500)
 processing_status: Dict[str, Any] = {"current_task": None, "is_running": False}
 
 
+def _sync_processing_status(job: Dict[str, Any]) -> None:
+    """Mirror the job queue into ``processing_status`` for the status stream."""
+    if job_store is None:
+        return
+    running = job_store.list(status=STATUS_RUNNING)
+    queued = job_store.count(STATUS_QUEUED)
+
+    if running:
+        processing_status["current_task"] = "; ".join(
+            j["description"] for j in running
+        )
+    elif queued:
+        processing_status["current_task"] = f"{queued} job(s) queued"
+    else:
+        processing_status["current_task"] = None
+    processing_status["is_running"] = bool(running) or queued > 0
+    processing_status["queued_jobs"] = queued
+
+    if job["status"] in FINISHED_STATUSES:
+        processing_status["last_result"] = job["result"] or {
+            "success": False,
+            "error": job["error"],
+        }
+
+
+# Persistent job queue and prepared listings (one row per product folder).
+# They are opened by init_stores() from main(), so importing this module
+# does not create database files.
+job_store: Optional[JobStore] = None
+job_manager: Optional[JobManager] = None
+listings_store: Optional[PreparedListingsStore] = None
+
+
 class ValidationError(Exception):
     """Exception raised for input validation errors."""
     pass
@@ -169,8 +217,6 @@ ensure_dir_exists("templates")
 
 def add_log(message: str, level: str = "info") -> None:
     """Add a message to the log with color coding."""
-    global log_messages
-
     # Determine message type and add color/emoji coding
     # Check for success conditions first (higher priority)
     if (
@@ -196,18 +242,21 @@ def add_log(message: str, level: str = "info") -> None:
         formatted_msg = f"ℹ️ {message}"
         level = "info"
 
-    # Only add to GUI logs, no console output
-    log_messages.append(
+    # Only add to GUI logs, no console output (the event log is bounded)
+    event_log.publish(
+        "log",
         {
             "message": formatted_msg,
             "level": level,
             "timestamp": __import__("time").time(),
-        }
+        },
     )
 
-    # Keep only last 100 messages to prevent memory issues
-    if len(log_messages) > 100:
-        log_messages = log_messages[-100:]
+    # Keep a per-job copy of messages logged while a job runs on this thread
+    # (main() logs before init_stores() has opened the job queue)
+    job = job_manager.current_job() if job_manager is not None else None
+    if job is not None:
+        job.log(message, level)
 
 
 def run_processor_workflow(
@@ -261,11 +310,34 @@ def index():
 
 @app.route("/log")
 def get_log():
-    """Get recent log messages."""
-    global log_messages
-    messages = log_messages.copy()
-    log_messages.clear()  # Clear after reading
-    return jsonify({"messages": messages})
+    """Get log messages newer than the ``since`` event id (polling fallback)."""
+    since = event_log.resume_id(request.args.get("since", default=0, type=int))
+    events = event_log.since(since)
+    return jsonify(
+        {
+            "messages": [event["data"] for event in events],
+            "last_id": events[-1]["id"] if events else since,
+        }
+    )
+
+
+@app.route("/events")
+def stream_events():
+    """Stream log messages and status changes as Server-Sent Events.
+
+    Clients resume from the ``Last-Event-ID`` header (sent automatically by
+    EventSource on reconnect) or a ``last_id`` query parameter.
+    """
+    last_id = request.headers.get("Last-Event-ID", type=int)
+    if last_id is None:
+        last_id = request.args.get("last_id", default=0, type=int)
+
+    stream = event_log.stream(last_id, status_provider=lambda: dict(processing_status))
+    return Response(
+        stream_with_context(stream),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.route("/status")
@@ -313,9 +385,16 @@ def get_ai_providers():
 
 
 def run_all_subfolders_workflow(
-    processor_type: str, workflow_steps: list = None, custom_settings: dict = None
+    processor_type: str,
+    workflow_steps: list = None,
+    custom_settings: dict = None,
+    job: Optional[JobContext] = None,
 ) -> dict:
-    """Run a processor workflow on all subfolders in the input directory."""
+    """Run a processor workflow on all subfolders in the input directory.
+
+    When run as a job, progress is reported per folder and cancellation is
+    checked before each folder starts.
+    """
     try:
         input_base_dir = "input"
 
@@ -341,10 +420,14 @@ def run_all_subfolders_workflow(
         successful_count = 0
         failed_count = 0
 
-        for subfolder in subfolders:
+        for index, subfolder in enumerate(subfolders):
             input_dir = os.path.join(input_base_dir, subfolder)
             output_dir = input_dir  # Use input directory for nested output folders
 
+            if job is not None:
+                job.check_cancelled()
+                job.set_progress(index / len(subfolders), f"Processing {subfolder}")
+
             add_log(f"Processing folder: {subfolder}")
 
             # Create configuration for this subfolder
@@ -392,6 +475,8 @@ def run_all_subfolders_workflow(
             "results": all_results,
         }
 
+    except JobCancelled:
+        raise
     except Exception as e:
         error_msg = f"Batch workflow failed: {str(e)}"
         add_log(error_msg)
@@ -415,34 +500,17 @@ def run_workflow(data: Dict[str, Any]):
 
         add_log(f"Starting {processor_type} workflow with steps: {workflow_steps}")
 
-        # Set processing status
-        processing_status["current_task"] = f"{processor_type} batch workflow"
-        processing_status["is_running"] = True
-
-        def run_in_background():
-            try:
-                result = run_all_subfolders_workflow(
-                    processor_type=processor_type,
-                    workflow_steps=workflow_steps,
-                    custom_settings=custom_settings,
-                )
-
-                # Update status
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = result
-
-            except Exception as e:
-                add_log(f"Background task failed: {e}", "error")
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = {"success": False, "error": str(e)}
-
-        # Start background thread
-        thread = threading.Thread(target=run_in_background)
-        thread.start()
+        job = job_manager.submit(
+            "run_workflow",
+            {
+                "processor_type": processor_type,
+                "workflow_steps": workflow_steps,
+                "custom_settings": custom_settings,
+            },
+            f"{processor_type} batch workflow",
+        )
 
-        add_log(f"Successfully started {processor_type} batch workflow", "success")
+        add_log(f"Successfully queued {processor_type} batch workflow (job {job['id']})", "success")
 
         return jsonify(
             {
@@ -450,13 +518,13 @@ def run_workflow(data: Dict[str, Any]):
                 "processor_type": processor_type,
                 "workflow_steps": workflow_steps,
                 "mode": "all_subfolders",
+                "job_id": job["id"],
+                "status": job["status"],
             }
         )
 
     except Exception as e:
         add_log(f"Workflow startup failed: {str(e)}", "error")
-        processing_status["current_task"] = None
-        processing_status["is_running"] = False
         return jsonify({"error": str(e)}), 500
 
 
@@ -509,9 +577,6 @@ def prepare_etsy_listings(data: Dict[str, Any]):
 
         add_log(f"Starting Etsy listing preparation for {processor_type} products")
 
-        # Import Etsy integration
-        from src.services.etsy.main import EtsyIntegration
-        from src.services.etsy.constants import DEFAULT_ETSY_INSTRUCTIONS
         from src.utils.env_loader import get_env_var
 
         # Get AI API key
@@ -530,74 +595,26 @@ def prepare_etsy_listings(data: Dict[str, Any]):
                 400,
             )
 
-        # Initialize Etsy integration with AI provider
-        etsy = EtsyIntegration(
-            etsy_api_key="dummy",  # Not needed for preparation
-            etsy_api_secret="dummy",  # Not needed for preparation
-            api_key=ai_api_key,
-            provider_type=ai_provider,
-        )
-
-        # Set processing status
-        processing_status["current_task"] = (
-            f"Preparing {processor_type} listings with AI"
+        job = job_manager.submit(
+            "prepare_listings",
+            {
+                "processor_type": processor_type,
+                "ai_provider": ai_provider,
+                "full_processing": False,
+            },
+            f"Preparing {processor_type} listings with AI",
         )
-        processing_status["is_running"] = True
-
-        def run_listing_preparation():
-            try:
-                # Prepare listings for all subfolders in input directory
-                input_base_dir = "input"
-                prepared_listings = etsy.prepare_bulk_listings(
-                    input_dir=input_base_dir,
-                    product_type=processor_type,
-                    skip_mockups=True,  # Assume mockups already exist
-                    skip_zips=True,  # Assume zips already exist
-                    skip_resize=True,  # Assume images already resized
-                )
-
-                # Save prepared listings to file
-                import json
-
-                output_file = "prepared_listings.json"
-                with open(output_file, "w") as f:
-                    json.dump(prepared_listings, f, indent=2)
-
-                # Update status
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = {
-                    "success": True,
-                    "listings_prepared": len(prepared_listings),
-                    "output_file": output_file,
-                    "listings": prepared_listings,
-                }
-
-                add_log(f"Successfully prepared {len(prepared_listings)} Etsy listings")
-                add_log(f"Listings saved to {output_file}")
-
-            except Exception as e:
-                add_log(f"Listing preparation failed: {str(e)}")
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = {"success": False, "error": str(e)}
-
-        # Start background thread
-        import threading
-
-        thread = threading.Thread(target=run_listing_preparation)
-        thread.start()
 
         return jsonify(
             {
                 "message": f"Started preparing {processor_type} listings with AI",
                 "ai_provider": ai_provider,
+                "job_id": job["id"],
+                "status": job["status"],
             }
         )
 
     except Exception as e:
-        processing_status["current_task"] = None
-        processing_status["is_running"] = False
         return jsonify({"error": str(e)}), 500
 
 
@@ -611,9 +628,6 @@ def full_bulk_processing(data: Dict[str, Any]):
 
         add_log(f"Starting full bulk processing for {processor_type} products")
 
-        # Import Etsy integration
-        from src.services.etsy.main import EtsyIntegration
-        from src.services.etsy.constants import DEFAULT_ETSY_INSTRUCTIONS
         from src.utils.env_loader import get_env_var
 
         # Get AI API key
@@ -632,108 +646,80 @@ def full_bulk_processing(data: Dict[str, Any]):
                 400,
             )
 
-        # Initialize Etsy integration with AI provider
-        etsy = EtsyIntegration(
-            etsy_api_key="dummy",  # Not needed for preparation
-            etsy_api_secret="dummy",  # Not needed for preparation
-            api_key=ai_api_key,
-            provider_type=ai_provider,
+        job = job_manager.submit(
+            "full_bulk_processing",
+            {
+                "processor_type": processor_type,
+                "ai_provider": ai_provider,
+                "full_processing": True,
+            },
+            f"Full processing {processor_type} products",
         )
 
-        # Set processing status
-        processing_status["current_task"] = f"Full processing {processor_type} products"
-        processing_status["is_running"] = True
-
-        def run_full_processing():
-            try:
-                # Run complete bulk processing (resize, mockups, zips, then AI content)
-                input_base_dir = "input"
-                prepared_listings = etsy.prepare_bulk_listings(
-                    input_dir=input_base_dir,
-                    product_type=processor_type,
-                    skip_mockups=False,  # Create mockups
-                    skip_zips=False,  # Create zips
-                    skip_resize=False,  # Resize images
-                )
-
-                # Save prepared listings to file
-                import json
-
-                output_file = "prepared_listings.json"
-                with open(output_file, "w") as f:
-                    json.dump(prepared_listings, f, indent=2)
-
-                # Update status
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = {
-                    "success": True,
-                    "listings_prepared": len(prepared_listings),
-                    "output_file": output_file,
-                    "listings": prepared_listings,
-                    "workflow": "full_processing",
-                }
-
-                add_log(
-                    f"Successfully completed full processing and prepared {len(prepared_listings)} Etsy listings"
-                )
-                add_log(f"Listings saved to {output_file}")
-
-            except Exception as e:
-                add_log(f"Full bulk processing failed: {str(e)}")
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = {"success": False, "error": str(e)}
-
-        # Start background thread
-        import threading
-
-        thread = threading.Thread(target=run_full_processing)
-        thread.start()
-
         return jsonify(
             {
                 "message": f"Started full bulk processing for {processor_type} products",
                 "ai_provider": ai_provider,
                 "workflow": "full_processing",
+                "job_id": job["id"],
+                "status": job["status"],
             }
         )
 
     except Exception as e:
-        processing_status["current_task"] = None
-        processing_status["is_running"] = False
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/get-prepared-listings")
 def get_prepared_listings():
-    """Get prepared listings if they exist."""
+    """Get prepared listings that have not been uploaded yet.
+
+    Query parameters:
+        status: Comma-separated statuses to include (default: pending ones)
+        limit, offset: Optional pagination
+    """
     try:
-        import json
-        import os
+        status_arg = request.args.get("status")
+        statuses = (
+            [s.strip() for s in status_arg.split(",") if s.strip()]
+            if status_arg
+            else list(PENDING_STATUSES)
+        )
+        unknown = [s for s in statuses if s not in LISTING_STATUSES]
+        if unknown:
+            raise ValidationError(f"Unknown listing status: {', '.join(unknown)}")
 
-        prepared_file = "prepared_listings.json"
-        if os.path.exists(prepared_file):
-            with open(prepared_file, "r") as f:
-                prepared_listings = json.load(f)
+        limit = request.args.get("limit", type=int)
+        offset = max(request.args.get("offset", default=0, type=int), 0)
+        if limit is not None:
+            limit = min(max(limit, 1), 500)
 
-            return jsonify(
-                {
-                    "success": True,
-                    "listings": prepared_listings,
-                    "count": len(prepared_listings),
-                }
-            )
-        else:
+        listings = listings_store.list(statuses, limit=limit, offset=offset)
+        total = listings_store.count(statuses)
+
+        if not total:
             return jsonify(
                 {
                     "success": False,
                     "listings": [],
                     "count": 0,
+                    "total": 0,
                     "message": "No prepared listings found",
                 }
             )
 
+        return jsonify(
+            {
+                "success": True,
+                "listings": listings,
+                "count": len(listings),
+                "total": total,
+                "offset": offset,
+            }
+        )
+
+    except ValidationError as e:
+        return jsonify({"success": False, "error": str(e), "listings": [], "count": 0}), 400
     except Exception as e:
         return jsonify({"success": False, "error": str(e), "listings": [], "count": 0})
 
@@ -743,9 +729,6 @@ def get_prepared_listings():
 def update_prepared_listing(data: Dict[str, Any]):
     """Update a specific prepared listing."""
     try:
-        import json
-        import os
-
         folder_name = data.get("folder_name")
         title = data.get("title", "").strip() if data.get("title") else ""
         description = data.get("description", "").strip() if data.get("description") else ""
@@ -795,34 +778,12 @@ def update_prepared_listing(data: Dict[str, Any]):
                 )
             tags[i] = tag  # Update with trimmed version
 
-        # Load existing prepared listings
-        prepared_file = "prepared_listings.json"
-        if not os.path.exists(prepared_file):
-            return jsonify({"error": "No prepared listings found"}), 400
-
-        with open(prepared_file, "r") as f:
-            prepared_listings = json.load(f)
-
-        # Find and update the specific listing
-        listing_found = False
-        for listing in prepared_listings:
-            if listing.get("folder_name") == folder_name:
-                listing["title"] = title
-                listing["description"] = description
-                listing["tags"] = tags
-                listing_found = True
-                break
-
-        if not listing_found:
+        if not listings_store.update_content(folder_name, title, description, tags):
             return (
                 jsonify({"error": f"Listing for folder '{folder_name}' not found"}),
                 404,
             )
 
-        # Save updated listings
-        with open(prepared_file, "w") as f:
-            json.dump(prepared_listings, f, indent=2)
-
         add_log(f"Updated listing for {folder_name}")
 
         return jsonify(
@@ -844,19 +805,12 @@ def update_prepared_listing(data: Dict[str, Any]):
 
 @app.route("/delete-prepared-listings", methods=["POST"])
 def delete_prepared_listings():
-    """Delete prepared listings file."""
+    """Delete all prepared listings, keeping a JSON backup."""
     try:
-        import os
-
-        prepared_file = "prepared_listings.json"
-
-        if os.path.exists(prepared_file):
-            # Create backup before deletion
-            backup_file = "prepared_listings_backup.json"
-            if os.path.exists(backup_file):
-                os.remove(backup_file)
-            os.rename(prepared_file, backup_file)
+        backup_file = "prepared_listings_backup.json"
+        deleted = listings_store.clear(backup_path=backup_file)
 
+        if deleted:
             add_log("Prepared listings deleted successfully (backup saved)")
 
             return jsonify(
@@ -864,6 +818,7 @@ def delete_prepared_listings():
                     "success": True,
                     "message": "Prepared listings deleted successfully",
                     "backup_created": True,
+                    "deleted_count": deleted,
                 }
             )
         else:
@@ -880,9 +835,6 @@ def delete_prepared_listings():
 def delete_single_prepared_listing(data: Dict[str, Any]):
     """Delete a single prepared listing."""
     try:
-        import json
-        import os
-
         folder_name = data.get("folder_name")
 
         if not folder_name or not isinstance(folder_name, str):
@@ -892,39 +844,55 @@ def delete_single_prepared_listing(data: Dict[str, Any]):
         if not folder_name:
             raise ValidationError("folder_name cannot be empty")
 
-        # Load existing prepared listings
-        prepared_file = "prepared_listings.json"
-        if not os.path.exists(prepared_file):
-            return jsonify({"error": "No prepared listings found"}), 400
-
-        with open(prepared_file, "r") as f:
-            prepared_listings = json.load(f)
-
-        # Find and remove the specific listing
-        initial_count = len(prepared_listings)
-        prepared_listings = [
-            listing
-            for listing in prepared_listings
-            if listing.get("folder_name") != folder_name
-        ]
-
-        if len(prepared_listings) == initial_count:
+        if not listings_store.delete(folder_name):
             return (
                 jsonify({"error": f"Listing for folder '{folder_name}' not found"}),
                 404,
             )
 
-        # Save updated listings
-        with open(prepared_file, "w") as f:
-            json.dump(prepared_listings, f, indent=2)
-
         add_log(f"Deleted prepared listing for {folder_name}")
 
         return jsonify(
             {
                 "success": True,
                 "message": f"Successfully deleted prepared listing for {folder_name}",
-                "remaining_count": len(prepared_listings),
+                "remaining_count": listings_store.count(PENDING_STATUSES),
+            }
+        )
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/retry-prepared-listing", methods=["POST"])
+@validate_json_request
+def retry_prepared_listing(data: Dict[str, Any]):
+    """Make a listing whose upload was interrupted uploadable again.
+
+    Only call this after checking that the listing did not reach Etsy.
+    """
+    try:
+        folder_name = data.get("folder_name")
+
+        if not folder_name or not isinstance(folder_name, str):
+            raise ValidationError("folder_name is required and must be a string")
+
+        folder_name = folder_name.strip()
+        if not folder_name:
+            raise ValidationError("folder_name cannot be empty")
+
+        if not listings_store.retry_interrupted(folder_name):
+            return (
+                jsonify({"error": f"No interrupted listing for folder '{folder_name}'"}),
+                404,
+            )
+
+        add_log(f"Prepared listing for {folder_name} will be uploaded again")
+
+        return jsonify(
+            {
+                "success": True,
+                "message": f"Listing for {folder_name} will be included in the next upload",
             }
         )
 
@@ -967,12 +935,10 @@ def upload_prepared_listings(data: Dict[str, Any]):
         # Import Etsy integration
         from src.services.etsy.main import EtsyIntegration
         from src.utils.env_loader import get_env_var
-        import json
-        import os
 
         # Check if prepared listings exist
-        prepared_file = "prepared_listings.json"
-        if not os.path.exists(prepared_file):
+        listings_count = listings_store.count(UPLOADABLE_STATUSES)
+        if not listings_count:
             return (
                 jsonify(
                     {
@@ -982,13 +948,6 @@ def upload_prepared_listings(data: Dict[str, Any]):
                 400,
             )
 
-        # Load prepared listings
-        with open(prepared_file, "r") as f:
-            prepared_listings = json.load(f)
-
-        if not prepared_listings:
-            return jsonify({"error": "No listings found in prepared file."}), 400
-
         # Get Etsy credentials
         etsy_api_key = get_env_var("ETSY_API_KEY")
         etsy_api_secret = get_env_var("ETSY_API_SECRET")
@@ -1019,118 +978,275 @@ def upload_prepared_listings(data: Dict[str, Any]):
                 400,
             )
 
-        # Set processing status
-        processing_status["current_task"] = (
-            f"Uploading {len(prepared_listings)} listings to Etsy"
+        job = job_manager.submit(
+            "upload_listings",
+            {"is_draft": is_draft},
+            f"Uploading {listings_count} listings to Etsy",
         )
-        processing_status["is_running"] = True
-
-        def run_etsy_upload():
-            try:
-                uploaded_listings = []
-                failed_listings = []
-                successfully_uploaded_folders = []
-
-                for listing_data in prepared_listings:
-                    try:
-                        add_log(f"Uploading listing: {listing_data['folder_name']}")
-                        result = etsy.upload_prepared_listing(
-                            listing_data, is_draft=is_draft
-                        )
-
-                        if result:
-                            uploaded_listings.append(result)
-                            successfully_uploaded_folders.append(
-                                listing_data["folder_name"]
-                            )
-                            listing_id = result.get("listing_id")
-                            add_log(
-                                f"✓ Successfully uploaded: {listing_data['folder_name']} (ID: {listing_id})"
-                            )
-                        else:
-                            failed_listings.append(listing_data["folder_name"])
-                            add_log(
-                                f"✗ Failed to upload: {listing_data['folder_name']}"
-                            )
-
-                    except Exception as e:
-                        failed_listings.append(listing_data["folder_name"])
-                        add_log(
-                            f"✗ Error uploading {listing_data['folder_name']}: {str(e)}"
-                        )
-
-                # Remove successfully uploaded listings from prepared_listings.json
-                if successfully_uploaded_folders:
-                    try:
-                        # Filter out successfully uploaded listings
-                        remaining_listings = [
-                            listing
-                            for listing in prepared_listings
-                            if listing["folder_name"]
-                            not in successfully_uploaded_folders
-                        ]
-
-                        # Update the prepared listings file
-                        with open(prepared_file, "w") as f:
-                            json.dump(remaining_listings, f, indent=2)
-
-                        if remaining_listings:
-                            add_log(
-                                f"✓ Removed {len(successfully_uploaded_folders)} uploaded listings from prepared list. {len(remaining_listings)} listings remaining."
-                            )
-                        else:
-                            add_log(
-                                f"✓ All prepared listings uploaded successfully. Prepared listings cleared."
-                            )
-
-                    except Exception as e:
-                        add_log(
-                            f"Warning: Could not update prepared listings file: {str(e)}",
-                            "warning",
-                        )
-
-                # Update status
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = {
-                    "success": len(failed_listings) == 0,
-                    "uploaded_count": len(uploaded_listings),
-                    "failed_count": len(failed_listings),
-                    "uploaded_listings": uploaded_listings,
-                    "failed_listings": failed_listings,
-                    "removed_from_prepared": successfully_uploaded_folders,
-                }
-
-                add_log(
-                    f"Upload complete: {len(uploaded_listings)} successful, {len(failed_listings)} failed"
-                )
-
-            except Exception as e:
-                add_log(f"Etsy upload failed: {str(e)}")
-                processing_status["current_task"] = None
-                processing_status["is_running"] = False
-                processing_status["last_result"] = {"success": False, "error": str(e)}
-
-        # Start background thread
-        import threading
-
-        thread = threading.Thread(target=run_etsy_upload)
-        thread.start()
 
         return jsonify(
             {
-                "message": f"Started uploading {len(prepared_listings)} prepared listings to Etsy",
+                "message": f"Started uploading {listings_count} prepared listings to Etsy",
                 "is_draft": is_draft,
-                "listings_count": len(prepared_listings),
+                "listings_count": listings_count,
+                "job_id": job["id"],
+                "status": job["status"],
             }
         )
 
     except Exception as e:
-        processing_status["current_task"] = None
-        processing_status["is_running"] = False
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/jobs")
+def list_jobs():
+    """List jobs, newest first (``?status=&limit=&offset=``)."""
+    status = request.args.get("status")
+    limit = min(max(request.args.get("limit", default=50, type=int), 1), 500)
+    offset = max(request.args.get("offset", default=0, type=int), 0)
+    jobs = job_store.list(status=status, limit=limit, offset=offset)
+    return jsonify({"jobs": jobs, "count": len(jobs), "limit": limit, "offset": offset})
+
+
+@app.route("/jobs/<job_id>")
+def get_job(job_id: str):
+    """Get a job with its logs newer than the ``logs_since`` log id."""
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Job not found: {job_id}"}), 404
+
+    logs_since = request.args.get("logs_since", default=0, type=int)
+    logs = job_store.logs(job_id, since=logs_since)
+    return jsonify(
+        {
+            "job": job,
+            "logs": logs,
+            "last_log_id": logs[-1]["id"] if logs else logs_since,
+        }
+    )
+
+
+@app.route("/metrics")
+def metrics():
+    """Prometheus metrics for workflows, AI and Etsy calls, caches and the job queue."""
+    counts = job_store.active_counts()
+    for job_class in (JOB_CLASS_CPU, JOB_CLASS_NETWORK):
+        for status in (STATUS_QUEUED, STATUS_RUNNING):
+            JOB_QUEUE_DEPTH.set(
+                counts.get((job_class, status), 0), job_class=job_class, status=status
+            )
+    return Response(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.route("/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_job(job_id: str):
+    """Cancel a queued job, or ask a running job to stop at its next checkpoint."""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({"error": f"Job not found: {job_id}"}), 404
+
+    if job["status"] in FINISHED_STATUSES:
+        add_log(f"Job {job_id} is {job['status']}")
+    else:
+        add_log(f"Cancellation requested for job {job_id}", "warning")
+    return jsonify({"success": True, "job": job})
+
+
+# Job handlers
+
+
+def run_workflow_job(job: JobContext) -> dict:
+    """Job handler for ``/run-workflow``."""
+    params = job.params
+    return run_all_subfolders_workflow(
+        processor_type=params["processor_type"],
+        workflow_steps=params.get("workflow_steps"),
+        custom_settings=params.get("custom_settings"),
+        job=job,
+    )
+
+
+def prepare_listings_job(job: JobContext) -> dict:
+    """Job handler for ``/prepare-etsy-listings`` and ``/full-bulk-processing``.
+
+    API keys are read from the environment when the job runs so that they
+    are never persisted with the job parameters.
+    """
+    from src.services.etsy.main import EtsyIntegration
+    from src.utils.env_loader import get_env_var
+
+    params = job.params
+    processor_type = params["processor_type"]
+    ai_provider = params["ai_provider"]
+    full_processing = params.get("full_processing", False)
+
+    key_name = "GEMINI_API_KEY" if ai_provider == "gemini" else "OPENAI_API_KEY"
+    ai_api_key = get_env_var(key_name)
+    if not ai_api_key:
+        return {"success": False, "error": f"{ai_provider.upper()} API key not configured"}
+
+    etsy = EtsyIntegration(
+        etsy_api_key="dummy",  # Not needed for preparation
+        etsy_api_secret="dummy",  # Not needed for preparation
+        api_key=ai_api_key,
+        provider_type=ai_provider,
+    )
+
+    # Full processing also resizes images and creates mockups and zips;
+    # otherwise they are assumed to exist already
+    prepared_listings = etsy.prepare_bulk_listings(
+        input_dir="input",
+        product_type=processor_type,
+        skip_mockups=not full_processing,
+        skip_zips=not full_processing,
+        skip_resize=not full_processing,
+        should_stop=lambda: job.cancelled,
+        on_progress=lambda done, total, name: job.set_progress(
+            done / total, f"Preparing {name}"
+        ),
+    )
+
+    # Keep whatever was prepared before a cancellation
+    listings_store.upsert_many(prepared_listings)
+    job.check_cancelled()
+
+    if full_processing:
+        add_log(
+            f"Successfully completed full processing and prepared {len(prepared_listings)} Etsy listings"
+        )
+    else:
+        add_log(f"Successfully prepared {len(prepared_listings)} Etsy listings")
+    add_log(f"Listings saved to {listings_store.db_path}")
+
+    result = {
+        "success": True,
+        "listings_prepared": len(prepared_listings),
+        "output_file": listings_store.db_path,
+        "listings": prepared_listings,
+    }
+    if full_processing:
+        result["workflow"] = "full_processing"
+    return result
+
+
+def upload_listings_job(job: JobContext) -> dict:
+    """Job handler for ``/upload-prepared-listings``.
+
+    Listings are read when the job starts, so edits made while the job was
+    queued are uploaded. Each listing's status is updated as it goes
+    (uploading, then uploaded or failed), so a cancelled upload never
+    re-uploads listings that already reached Etsy. Listings a crash left
+    ``uploading`` become ``interrupted`` and wait for the user to retry them.
+    """
+    from src.services.etsy.main import EtsyIntegration
+    from src.utils.env_loader import get_env_var
+
+    is_draft = job.params.get("is_draft", True)
+    prepared_listings = listings_store.list(UPLOADABLE_STATUSES)
+    if not prepared_listings:
+        return {"success": False, "error": "No prepared listings found"}
+
+    etsy = EtsyIntegration(
+        etsy_api_key=get_env_var("ETSY_API_KEY"),
+        etsy_api_secret=get_env_var("ETSY_API_SECRET"),
+    )
+    if not etsy.authenticate():
+        return {"success": False, "error": "Failed to authenticate with Etsy"}
+
+    uploaded_listings = []
+    failed_listings = []
+    successfully_uploaded_folders = []
+    cancelled = False
+
+    for index, listing_data in enumerate(prepared_listings):
+        if job.cancelled:
+            cancelled = True
+            break
+        folder_name = listing_data["folder_name"]
+        # Another upload job may have taken it since the list was read
+        if not listings_store.claim_for_upload(folder_name):
+            add_log(f"Skipping {folder_name}: already uploaded or being uploaded")
+            continue
+        job.set_progress(index / len(prepared_listings), f"Uploading {folder_name}")
+
+        try:
+            add_log(f"Uploading listing: {folder_name}")
+            result = etsy.upload_prepared_listing(listing_data, is_draft=is_draft)
+
+            if result:
+                uploaded_listings.append(result)
+                successfully_uploaded_folders.append(folder_name)
+                listing_id = result.get("listing_id")
+                listings_store.set_status(folder_name, LISTING_UPLOADED, listing_id=listing_id)
+                add_log(f"✓ Successfully uploaded: {folder_name} (ID: {listing_id})")
+            else:
+                failed_listings.append(folder_name)
+                listings_store.set_status(folder_name, LISTING_FAILED, error="Upload failed")
+                add_log(f"✗ Failed to upload: {folder_name}")
+
+        except Exception as e:
+            failed_listings.append(folder_name)
+            listings_store.set_status(folder_name, LISTING_FAILED, error=str(e))
+            add_log(f"✗ Error uploading {folder_name}: {str(e)}")
+
+    if successfully_uploaded_folders:
+        remaining = listings_store.count(PENDING_STATUSES)
+        if remaining:
+            add_log(
+                f"✓ Removed {len(successfully_uploaded_folders)} uploaded listings from prepared list. {remaining} listings remaining."
+            )
+        else:
+            add_log(
+                f"✓ All prepared listings uploaded successfully. Prepared listings cleared."
+            )
+
+    add_log(
+        f"Upload complete: {len(uploaded_listings)} successful, {len(failed_listings)} failed"
+    )
+    if cancelled:
+        raise JobCancelled(
+            f"Upload cancelled after {len(uploaded_listings)} listings"
+        )
+
+    return {
+        "success": len(failed_listings) == 0,
+        "uploaded_count": len(uploaded_listings),
+        "failed_count": len(failed_listings),
+        "uploaded_listings": uploaded_listings,
+        "failed_listings": failed_listings,
+        "removed_from_prepared": successfully_uploaded_folders,
+    }
+
+
+def init_stores() -> None:
+    """Open the job and listings databases and register the job handlers."""
+    global job_store, job_manager, listings_store
+    if job_manager is not None:
+        return
+    job_store = JobStore()
+    job_manager = JobManager(job_store, on_change=_sync_processing_status)
+    job_manager.register("run_workflow", run_workflow_job, JOB_CLASS_CPU)
+    job_manager.register("prepare_listings", prepare_listings_job, JOB_CLASS_NETWORK)
+    job_manager.register("full_bulk_processing", prepare_listings_job, JOB_CLASS_CPU)
+    job_manager.register("upload_listings", upload_listings_job, JOB_CLASS_NETWORK)
+    listings_store = PreparedListingsStore()
+
+
+def _job_pool_sizes() -> Dict[str, int]:
+    """Read worker pool sizes from JOB_WORKERS_CPU / JOB_WORKERS_NETWORK."""
+    from src.utils.env_loader import get_env_var
+
+    sizes = {}
+    for job_class in (JOB_CLASS_CPU, JOB_CLASS_NETWORK):
+        value = get_env_var(f"JOB_WORKERS_{job_class.upper()}")
+        if value:
+            try:
+                sizes[job_class] = max(1, int(value))
+            except ValueError:
+                add_log(f"Ignoring invalid JOB_WORKERS_{job_class.upper()}: {value}", "warning")
+    return sizes
+
+
 def main():
     """Main function to start the application."""
     # Setup GUI logging integration
@@ -1143,6 +1259,18 @@ def main():
         add_log("Environment setup failed. Please check your .env file.", "error")
         return
 
+    # Open the job queue and listings databases
+    init_stores()
+
+    # Move a legacy prepared_listings.json into the listings database
+    imported = listings_store.migrate_json()
+    if imported:
+        add_log(f"✓ Imported {imported} prepared listings from prepared_listings.json")
+    listings_store.mark_interrupted_uploads()
+
+    # Start job workers (jobs still queued from a previous run resume here)
+    job_manager.start(_job_pool_sizes())
+
     # Check available processors
     available_types = ProcessorFactory.get_available_types()
     add_log(f"Available processors: {', '.join(available_types)}")
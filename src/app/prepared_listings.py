@@ -0,0 +1,269 @@
+"""
+SQLite repository for prepared Etsy listings.
+
+Prepared listings used to live in a single ``prepared_listings.json`` that
+was loaded and rewritten for every edit. The repository stores one row per
+product folder, so editing, deleting or marking a listing as uploaded only
+touches that row, and several writers (the editor, preparation and upload
+jobs) can work at the same time.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.app.sqlite_store import SQLiteStore, data_path
+
+LISTING_PREPARED = "prepared"
+LISTING_UPLOADING = "uploading"
+LISTING_UPLOADED = "uploaded"
+LISTING_FAILED = "failed"
+# Left "uploading" by a crash: it may already exist on Etsy, so it is never
+# uploaded again until the user checks and retries it
+LISTING_INTERRUPTED = "interrupted"
+LISTING_STATUSES = (
+    LISTING_PREPARED, LISTING_UPLOADING, LISTING_UPLOADED, LISTING_FAILED, LISTING_INTERRUPTED,
+)
+
+# Listings still shown in the editor, and those picked up by an upload
+PENDING_STATUSES = (LISTING_PREPARED, LISTING_UPLOADING, LISTING_FAILED, LISTING_INTERRUPTED)
+UPLOADABLE_STATUSES = (LISTING_PREPARED, LISTING_FAILED)
+
+PREPARED_LISTINGS_DB_PATH = data_path("prepared_listings.db")
+PREPARED_LISTINGS_JSON_PATH = data_path("prepared_listings.json")
+
+LISTINGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prepared_listings (
+    folder_name TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'prepared',
+    listing_id TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_prepared_listings_status ON prepared_listings (status);
+"""
+
+
+class PreparedListingsStore(SQLiteStore):
+    """Prepared listings keyed by product folder name.
+
+    The listing itself (title, description, tags, file lists, ...) is kept
+    as a JSON document; status, Etsy listing id and the last error are
+    separate columns. Records come back as the listing dict with those
+    fields added, in the order they were first prepared.
+    """
+
+    SCHEMA = LISTINGS_SCHEMA
+
+    def __init__(self, db_path: str = PREPARED_LISTINGS_DB_PATH):
+        super().__init__(db_path)
+
+    @staticmethod
+    def _row_to_listing(row) -> Dict[str, Any]:
+        listing = json.loads(row["data"])
+        listing["folder_name"] = row["folder_name"]
+        listing["status"] = row["status"]
+        listing["listing_id"] = row["listing_id"]
+        listing["error"] = row["error"]
+        listing["updated_at"] = row["updated_at"]
+        return listing
+
+    @staticmethod
+    def _status_clause(statuses: Optional[Iterable[str]]) -> Tuple[str, List[Any]]:
+        if not statuses:
+            return "", []
+        statuses = list(statuses)
+        return f" WHERE status IN ({', '.join('?' * len(statuses))})", statuses
+
+    def migrate_json(self, json_path: str = PREPARED_LISTINGS_JSON_PATH) -> int:
+        """Import a legacy JSON file once, then rename it out of the way.
+
+        Returns:
+            Number of listings imported (0 if there was no file)
+        """
+        if not os.path.exists(json_path):
+            return 0
+        imported = self.import_json(json_path)
+        os.replace(json_path, json_path + ".imported")
+        return imported
+
+    def import_json(self, json_path: str) -> int:
+        """Import listings from a ``prepared_listings.json``-style file.
+
+        Returns:
+            Number of listings imported
+        """
+        with open(json_path, "r") as f:
+            listings = json.load(f)
+        self.upsert_many(listings)
+        return len(listings)
+
+    def upsert_many(
+        self, listings: Iterable[Dict[str, Any]], status: str = LISTING_PREPARED
+    ) -> int:
+        """Insert or replace listings in one transaction.
+
+        Re-preparing a folder replaces its content and resets its status
+        but keeps its position in the list.
+        """
+        now = time.time()
+        rows = []
+        for listing in listings:
+            data = {
+                k: v
+                for k, v in listing.items()
+                if k not in ("status", "listing_id", "error", "updated_at")
+            }
+            rows.append((listing["folder_name"], json.dumps(data), status, now, now))
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO prepared_listings (folder_name, data, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(folder_name) DO UPDATE SET data = excluded.data, "
+                "status = excluded.status, listing_id = NULL, error = NULL, "
+                "updated_at = excluded.updated_at",
+                rows,
+            )
+        return len(rows)
+
+    def get(self, folder_name: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT * FROM prepared_listings WHERE folder_name = ?", (folder_name,)
+        ).fetchone()
+        return self._row_to_listing(row) if row else None
+
+    def list(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Return listings in preparation order, optionally paginated."""
+        where, args = self._status_clause(statuses)
+        query = f"SELECT * FROM prepared_listings{where} ORDER BY rowid"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            args += [limit, offset]
+        rows = self._connect().execute(query, args).fetchall()
+        return [self._row_to_listing(row) for row in rows]
+
+    def count(self, statuses: Optional[Iterable[str]] = None) -> int:
+        where, args = self._status_clause(statuses)
+        return self._connect().execute(
+            f"SELECT COUNT(*) FROM prepared_listings{where}", args
+        ).fetchone()[0]
+
+    def update_content(
+        self, folder_name: str, title: str, description: str, tags: List[str]
+    ) -> bool:
+        """Update the editable fields of one listing.
+
+        Returns:
+            False if no listing exists for the folder
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE prepared_listings SET "
+                "data = json_set(data, '$.title', ?, '$.description', ?, '$.tags', json(?)), "
+                "updated_at = ? WHERE folder_name = ?",
+                (title, description, json.dumps(tags), time.time(), folder_name),
+            )
+            return cursor.rowcount > 0
+
+    def set_status(
+        self,
+        folder_name: str,
+        status: str,
+        listing_id: Optional[Any] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        if status not in LISTING_STATUSES:
+            raise ValueError(f"Unknown listing status: {status}")
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE prepared_listings SET status = ?, "
+                "listing_id = COALESCE(?, listing_id), error = ?, updated_at = ? "
+                "WHERE folder_name = ?",
+                (
+                    status,
+                    str(listing_id) if listing_id is not None else None,
+                    error,
+                    time.time(),
+                    folder_name,
+                ),
+            )
+            return cursor.rowcount > 0
+
+    def claim_for_upload(self, folder_name: str) -> bool:
+        """Atomically move an uploadable listing to ``uploading``.
+
+        Returns:
+            False if the listing is gone or another upload already claimed it
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE prepared_listings SET status = ?, error = NULL, updated_at = ? "
+                f"WHERE folder_name = ? AND status IN ({', '.join('?' * len(UPLOADABLE_STATUSES))})",
+                (LISTING_UPLOADING, time.time(), folder_name, *UPLOADABLE_STATUSES),
+            )
+            return cursor.rowcount > 0
+
+    def mark_interrupted_uploads(self) -> int:
+        """Mark listings left ``uploading`` by a previous process as interrupted.
+
+        They are not retried automatically because the upload may have
+        reached Etsy before the crash; see ``retry_interrupted``.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE prepared_listings SET status = ?, error = ?, updated_at = ? "
+                "WHERE status = ?",
+                (
+                    LISTING_INTERRUPTED,
+                    "Upload interrupted by application restart; check Etsy before retrying",
+                    time.time(),
+                    LISTING_UPLOADING,
+                ),
+            )
+            return cursor.rowcount
+
+    def retry_interrupted(self, folder_name: str) -> bool:
+        """Make an interrupted listing uploadable again.
+
+        Returns:
+            False if no interrupted listing exists for the folder
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE prepared_listings SET status = ?, error = NULL, updated_at = ? "
+                "WHERE folder_name = ? AND status = ?",
+                (LISTING_PREPARED, time.time(), folder_name, LISTING_INTERRUPTED),
+            )
+            return cursor.rowcount > 0
+
+    def delete(self, folder_name: str) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM prepared_listings WHERE folder_name = ?", (folder_name,)
+            )
+            return cursor.rowcount > 0
+
+    def clear(self, backup_path: Optional[str] = None) -> int:
+        """Delete all listings, optionally exporting them to a JSON backup first.
+
+        Returns:
+            Number of listings deleted
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("SELECT * FROM prepared_listings ORDER BY rowid").fetchall()
+            if backup_path and rows:
+                with open(backup_path, "w") as f:
+                    json.dump([self._row_to_listing(row) for row in rows], f, indent=2)
+            conn.execute("DELETE FROM prepared_listings")
+        return len(rows)
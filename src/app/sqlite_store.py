@@ -0,0 +1,45 @@
+"""
+Shared SQLite plumbing for the web app's persistent stores.
+"""
+
+import os
+import sqlite3
+import threading
+
+# Databases live in the project root, whatever directory the app runs from
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def data_path(filename: str) -> str:
+    """Absolute path of a data file in ``DATA_DIR``."""
+    return os.path.join(DATA_DIR, filename)
+
+
+class SQLiteStore:
+    """Base class for small SQLite-backed stores.
+
+    Flask request threads and job workers all use the same store object, so
+    each thread gets its own connection. The database runs in WAL mode so
+    readers are not blocked while a worker writes.
+
+    Subclasses set ``SCHEMA`` to the ``CREATE ... IF NOT EXISTS`` statements
+    they need; it is applied when the store is opened.
+    """
+
+    SCHEMA = ""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        if self.SCHEMA:
+            with self._connect() as conn:
+                conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
@@ -5,6 +5,7 @@ Provides common interface and workflow orchestration.
 
 import os
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
 from typing import Dict, List, Any, Optional, Union, Protocol
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -12,6 +13,19 @@ from enum import Enum
 
 from src.utils.common import setup_logging, ensure_dir_exists
 from src.utils.ai_utils import get_ai_provider
+from src.core.instrumentation import (
+    PROFILERS,
+    WorkflowMetrics,
+    WorkflowProfiler,
+    write_run_report,
+)
+from src.utils.metrics import BYTES_WRITTEN, IMAGES_PROCESSED, WORKFLOW_STEP_SECONDS
+from src.utils.image_encoding import ENCODE_PROFILES, PURPOSES, encode_profiles
+from src.utils.image_writer import ImageWriteQueue, active_writer, image_writes
+from src.utils.folder_inventory import (
+    IMAGE_EXTENSIONS, SOURCES, FolderInventory, cached_inventory, get_inventory, invalidate_path,
+)
+from src.core.config_manager import get_config_manager
 
 
 class WorkflowStep(Enum):
@@ -50,7 +64,15 @@ class ProcessingConfig:
         create_video: Whether to create video content
         create_zip: Whether to create ZIP archives
         watermark_opacity: Opacity level for watermarks (0-255)
-        custom_settings: Additional product-specific settings
+        custom_settings: Additional product-specific settings. Instrumentation
+            reads ``profile`` ("cprofile" or "pyinstrument") to capture a
+            profile of the run, and ``run_report`` (default True) to write
+            ``run_report.json`` into the output directory. ``encode_profile``
+            overrides the product type's encode profiles, either with one
+            profile name for every output or a purpose -> profile dict.
+            ``write_workers`` (default 2) and ``write_queue_size`` (default 4)
+            size the background image writer, ``resize_workers`` (default one
+            per CPU) the resize process pool.
         
     Raises:
         ValidationError: If configuration parameters are invalid
@@ -92,6 +114,26 @@ class ProcessingConfig:
             
         if self.ai_provider not in ["gemini", "openai"]:
             raise ValidationError(f"Unsupported ai_provider: {self.ai_provider}. Must be 'gemini' or 'openai'")
+            
+        profile = self.custom_settings.get("profile")
+        if profile and profile is not True and profile not in PROFILERS:
+            raise ValidationError(f"Unsupported profile: {profile}. Must be one of {', '.join(PROFILERS)}")
+            
+        encode_profile = self.custom_settings.get("encode_profile")
+        if encode_profile is not None:
+            names = encode_profile.values() if isinstance(encode_profile, dict) else [encode_profile]
+            unknown = [name for name in names if name not in ENCODE_PROFILES]
+            if unknown:
+                raise ValidationError(
+                    f"Unsupported encode_profile: {unknown[0]}. Must be one of {', '.join(ENCODE_PROFILES)}"
+                )
+            if isinstance(encode_profile, dict) and not set(encode_profile) <= set(PURPOSES):
+                raise ValidationError(f"encode_profile keys must be among {', '.join(PURPOSES)}")
+        
+        for key in ("write_workers", "write_queue_size", "resize_workers"):
+            value = self.custom_settings.get(key)
+            if value is not None and (not isinstance(value, int) or value < 1):
+                raise ValidationError(f"{key} must be a positive integer")
 
 
 class BaseProcessor(ABC):
@@ -100,11 +142,26 @@ class BaseProcessor(ABC):
     def __init__(self, config: ProcessingConfig):
         self.config = config
         self.logger = setup_logging(f"{config.product_type}_processor")
-        self.ai_provider = get_ai_provider(config.ai_provider)
+        self._ai_provider: Any = None
+        self._ai_provider_resolved = False
+        self.metrics = WorkflowMetrics()
         
         # Ensure output directory exists
         ensure_dir_exists(config.output_dir)
     
+    @property
+    def ai_provider(self) -> Any:
+        """Shared AI provider, looked up on first AI use (None if unavailable)."""
+        if not self._ai_provider_resolved:
+            self._ai_provider = get_ai_provider(self.config.ai_provider)
+            self._ai_provider_resolved = True
+        return self._ai_provider
+    
+    @ai_provider.setter
+    def ai_provider(self, provider: Any) -> None:
+        self._ai_provider = provider
+        self._ai_provider_resolved = True
+    
     def run_workflow(self, steps: Optional[List[str]] = None) -> Dict[str, Any]:
         """Run the complete processing workflow.
         
@@ -112,7 +169,8 @@ class BaseProcessor(ABC):
             steps: List of workflow steps to execute. If None, runs default steps.
             
         Returns:
-            Dict containing results of each step with success/error status
+            Dict containing results of each step with success/error status,
+            plus a "metrics" entry with per-step and per-artifact timings
             
         Raises:
             ProcessingError: If workflow execution fails
@@ -123,39 +181,167 @@ class BaseProcessor(ABC):
             
         self._validate_workflow_steps(steps)
         results: Dict[str, Any] = {}
+        self.metrics = WorkflowMetrics([self.config.input_dir, self.config.output_dir])
         
+        profiler = None
+        profile_result = None
+        profile = self.config.custom_settings.get("profile")
+        if profile:
+            profiler = WorkflowProfiler("cprofile" if profile is True else profile)
+            profiler.start()
+        
+        image_writer = ImageWriteQueue(
+            max_workers=self.config.custom_settings.get("write_workers", 2),
+            max_pending=self.config.custom_settings.get("write_queue_size", 4),
+        )
         try:
-            for step in steps:
-                step_name = step.replace("_", " ").title()
-                self.logger.info(f"Processing {step_name}...")
-                
-                try:
-                    result = self._execute_workflow_step(step)
-                    results[step] = result
-                    
-                    # Check if step was successful
-                    if isinstance(result, dict):
-                        if result.get("success", True):
-                            self.logger.info(f"✓ {step_name} completed successfully")
-                        else:
-                            error_msg = result.get('error', 'Unknown error')
-                            self.logger.error(f"✗ {step_name} failed: {error_msg}")
-                    else:
-                        self.logger.info(f"✓ {step_name} completed")
-                        
-                except Exception as step_error:
-                    error_msg = f"Step '{step}' failed: {str(step_error)}"
-                    self.logger.error(f"✗ {error_msg}")
-                    results[step] = {"success": False, "error": str(step_error)}
-                    # Continue with remaining steps instead of failing entirely
+            with encode_profiles(self._encode_profiles()), image_writes(image_writer), \
+                    cached_inventory(self.config.input_dir):
+                self._run_steps(steps, results, image_writer)
         
         except Exception as e:
             error_msg = f"Workflow execution failed: {str(e)}"
             self.logger.error(f"✗ {error_msg}")
             raise ProcessingError(error_msg) from e
         
+        finally:
+            image_writer.close()
+            if profiler is not None:
+                profile_result = profiler.stop(self.config.output_dir)
+        
+        results["metrics"] = self._finish_metrics(steps, profile_result)
         return results
     
+    def _encode_profiles(self) -> Dict[str, str]:
+        """Encode profile per output purpose for this run.
+        
+        Starts from the product type's ``encode_settings`` in ConfigManager;
+        ``custom_settings["encode_profile"]`` overrides them (a single name
+        applies to every purpose, e.g. "draft" for a quick preview run).
+        """
+        profiles = get_config_manager().get_encode_settings(self.config.product_type)
+        override = self.config.custom_settings.get("encode_profile")
+        if isinstance(override, dict):
+            profiles.update(override)
+        elif override:
+            profiles = {purpose: override for purpose in PURPOSES}
+        return profiles
+    
+    def _run_steps(
+        self, steps: List[str], results: Dict[str, Any], image_writer: ImageWriteQueue
+    ) -> None:
+        """Execute workflow steps in order, recording each step's result.
+        
+        Images a step hands to the background writer are flushed before the
+        step is considered finished, so the next step sees every file and
+        failed writes fail the step.
+        """
+        for step in steps:
+            step_name = step.replace("_", " ").title()
+            self.logger.info(f"Processing {step_name}...")
+            
+            try:
+                with self.metrics.measure(step) as step_metrics:
+                    try:
+                        result = self._execute_workflow_step(step)
+                    finally:
+                        # A failed step's writes must not spill into the next step
+                        writes = image_writer.drain()
+                        # Zips, videos and other non-image outputs are not tracked
+                        # individually, so every step ends with a rescan
+                        invalidate_path(self.config.input_dir)
+                if writes["queued"] and isinstance(result, dict):
+                    result["writes"] = writes
+                    if writes["errors"]:
+                        result["success"] = False
+                        result.setdefault("error", f"Failed to write {', '.join(writes['errors'])}")
+                results[step] = result
+                self.logger.info(
+                    f"{step_name}: {step_metrics['wall_time_s']:.2f}s wall, "
+                    f"{step_metrics['cpu_time_s']:.2f}s CPU, "
+                    f"{step_metrics['images_decoded']} images decoded"
+                )
+                
+                # Check if step was successful
+                succeeded = not isinstance(result, dict) or result.get("success", True)
+                if isinstance(result, dict):
+                    if succeeded:
+                        self.logger.info(f"✓ {step_name} completed successfully")
+                    else:
+                        error_msg = result.get('error', 'Unknown error')
+                        self.logger.error(f"✗ {step_name} failed: {error_msg}")
+                else:
+                    self.logger.info(f"✓ {step_name} completed")
+                self._export_step_metrics(step, step_metrics, succeeded)
+                    
+            except Exception as step_error:
+                error_msg = f"Step '{step}' failed: {str(step_error)}"
+                self.logger.error(f"✗ {error_msg}")
+                results[step] = {"success": False, "error": str(step_error)}
+                if step in self.metrics.measurements:
+                    self._export_step_metrics(step, self.metrics.measurements[step], False)
+                # Continue with remaining steps instead of failing entirely
+    
+    @property
+    def inventory(self) -> FolderInventory:
+        """Inventory of the input folder (cached for the current workflow run)."""
+        return get_inventory(self.config.input_dir)
+    
+    @contextmanager
+    def measure(self, name: str):
+        """Measure a sub-artifact of the current step (e.g. one mockup).
+        
+        Images the block hands to the background writer count towards its
+        ``bytes_written`` once they are written, without waiting for them.
+        
+        Usage:
+            with self.measure("grid_mockup"):
+                results["grid_mockup"] = self._create_grid_mockup()
+        """
+        writer = active_writer()
+        with writer.collect() if writer is not None else nullcontext([]) as futures, \
+                self.metrics.measure(name) as metrics:
+            try:
+                yield metrics
+            finally:
+                self.metrics.count_writes(metrics, futures)
+    
+    def _export_step_metrics(self, step: str, step_metrics: Dict[str, Any], succeeded: bool) -> None:
+        """Feed a finished step into the process-wide metrics served on /metrics."""
+        product_type = self.config.product_type
+        WORKFLOW_STEP_SECONDS.observe(
+            step_metrics["wall_time_s"],
+            product_type=product_type,
+            step=step,
+            status="success" if succeeded else "failure",
+        )
+        IMAGES_PROCESSED.inc(step_metrics["images_decoded"], product_type=product_type, step=step)
+        BYTES_WRITTEN.inc(step_metrics["bytes_written"], product_type=product_type, step=step)
+    
+    def _finish_metrics(
+        self, steps: List[str], profile_result: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the metrics entry of the results and write the run report."""
+        metrics = self.metrics.summary()
+        if profile_result:
+            metrics["profile"] = profile_result
+        
+        if self.config.custom_settings.get("run_report", True):
+            report = {
+                "product_type": self.config.product_type,
+                "input_dir": self.config.input_dir,
+                "workflow_steps": steps,
+                **metrics,
+            }
+            metrics["report_file"] = write_run_report(self.config.output_dir, report)
+        
+        total = metrics["total"]
+        self.logger.info(
+            f"Workflow took {total['wall_time_s']:.2f}s wall, {total['cpu_time_s']:.2f}s CPU, "
+            f"{total['images_decoded']} images decoded, {total['bytes_written'] / 1e6:.1f} MB written"
+        )
+        return metrics
+    
     def _validate_workflow_steps(self, steps: List[str]) -> None:
         """Validate that workflow steps are valid.
         
@@ -337,22 +523,12 @@ class BaseProcessor(ABC):
             Number of valid product images found
         """
         try:
-            from src.utils.file_operations import find_files_by_extension
-            
             if not os.path.exists(self.config.input_dir):
                 self.logger.warning(f"Input directory does not exist: {self.config.input_dir}")
                 return 0
             
-            image_files = find_files_by_extension(self.config.input_dir, ['.png', '.jpg', '.jpeg'])
-            
-            # Exclude files in specific directories and system files
-            excluded_patterns = ['/mocks/', '\\mocks\\', '/.DS_Store', 'Thumbs.db', '/temp/', '\\temp\\']
-            product_images = [
-                f for f in image_files 
-                if not any(pattern in f for pattern in excluded_patterns)
-            ]
-            
-            return len(product_images)
+            # Sources only: mocks, temp and other output folders are excluded
+            return self.inventory.count(extensions=IMAGE_EXTENSIONS, categories=[SOURCES])
             
         except Exception as e:
             self.logger.error(f"Error counting product images: {e}")
@@ -0,0 +1,345 @@
+"""
+Headless batch processing from a manifest or a folder glob.
+
+``main.py batch`` runs many folders through their workflows on a worker
+pool, without the web interface:
+
+- a manifest lists one folder per row, either as CSV with the columns
+  ``folder``, ``product_type``, ``steps``, ``overrides`` (and optionally
+  ``output_dir`` and ``ai_provider``) or as JSONL objects with the same keys
+- a glob such as ``input/*`` runs every matching folder as one product type
+
+Each finished entry is appended to a JSONL results log as soon as it
+completes. With ``resume`` the entries that already succeeded in that log
+are skipped, so an interrupted or partly failed batch is simply run again.
+"""
+
+import csv
+import glob
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.core.base_processor import ProcessingConfig
+from src.core.config_manager import get_config_manager
+from src.core.processor_factory import ProcessorFactory
+from src.utils.common import setup_logging
+from src.utils.folder_inventory import natural_sort_key
+
+logger = setup_logging(__name__)
+
+DEFAULT_RESULTS_LOG = "batch_results.jsonl"
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def run_folder(
+    folder: str,
+    product_type: str,
+    steps: Optional[List[str]] = None,
+    skip_steps: Iterable[str] = (),
+    output_dir: Optional[str] = None,
+    ai_provider: str = "gemini",
+    custom_settings: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Run one folder's workflow and summarize the outcome.
+
+    Args:
+        folder: Product folder
+        product_type: Registered product type
+        steps: Workflow steps (default: the product type's default steps)
+        skip_steps: Steps to drop from the workflow (e.g. "video")
+        output_dir: Output directory (default: the folder itself)
+        ai_provider: AI provider for content generation
+        custom_settings: ProcessingConfig custom settings
+
+    Returns:
+        Dict with success, per-step results, error, duration and run report
+    """
+    skip_steps = set(skip_steps)
+    start = time.perf_counter()
+    summary: Dict[str, Any] = {"success": False, "steps": {}, "error": None, "report_file": None}
+    try:
+        if not os.path.isdir(folder):
+            raise FileNotFoundError(f"Input directory not found: {folder}")
+        workflow_steps = [
+            step
+            for step in get_config_manager().get_workflow_steps(product_type, steps)
+            if step not in skip_steps
+        ]
+        config = ProcessingConfig(
+            product_type=product_type,
+            input_dir=folder,
+            output_dir=output_dir or folder,
+            ai_provider=ai_provider,
+            create_video="video" not in skip_steps,
+            create_zip="zip" not in skip_steps,
+            custom_settings=dict(custom_settings or {}),
+        )
+        results = ProcessorFactory.create_processor(config).run_workflow(workflow_steps)
+
+        for step, result in results.items():
+            if step == "metrics":
+                continue
+            if isinstance(result, dict):
+                summary["steps"][step] = {"success": result.get("success", True), "error": result.get("error")}
+            else:
+                summary["steps"][step] = {"success": True, "error": None}
+        failed = [step for step, result in summary["steps"].items() if not result["success"]]
+        summary["success"] = not failed
+        summary["error"] = f"Failed steps: {', '.join(failed)}" if failed else None
+        summary["report_file"] = results.get("metrics", {}).get("report_file")
+    except Exception as e:
+        summary["error"] = str(e)
+
+    summary["duration_s"] = round(time.perf_counter() - start, 2)
+    return summary
+
+
+def _parse_steps(value: Any) -> Optional[List[str]]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return [step for step in re.split(r"[\s,;]+", value) if step]
+    return [str(step) for step in value]
+
+
+def _parse_overrides(value: Any) -> Dict[str, Any]:
+    if value is None or value == "":
+        return {}
+    if isinstance(value, str):
+        value = json.loads(value)
+    if not isinstance(value, dict):
+        raise ValueError("overrides must be a JSON object")
+    return value
+
+
+@dataclass
+class BatchEntry:
+    """One folder to process.
+
+    Attributes:
+        folder: Product folder
+        product_type: Registered product type
+        steps: Workflow steps (None uses the product type's default steps)
+        overrides: ProcessingConfig custom settings for this folder
+        output_dir: Output directory (None uses the folder itself)
+        ai_provider: AI provider for content generation
+    """
+
+    folder: str
+    product_type: str
+    steps: Optional[List[str]] = None
+    overrides: Dict[str, Any] = field(default_factory=dict)
+    output_dir: Optional[str] = None
+    ai_provider: str = "gemini"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchEntry":
+        """Build an entry from a manifest row.
+
+        Raises:
+            ValueError: If a required field is missing or malformed
+        """
+        folder = (data.get("folder") or "").strip()
+        product_type = (data.get("product_type") or "").strip()
+        if not folder or not product_type:
+            raise ValueError("folder and product_type are required")
+        return cls(
+            folder=folder,
+            product_type=product_type,
+            steps=_parse_steps(data.get("steps")),
+            overrides=_parse_overrides(data.get("overrides")),
+            output_dir=(data.get("output_dir") or "").strip() or None,
+            ai_provider=(data.get("ai_provider") or "").strip() or "gemini",
+        )
+
+    @property
+    def key(self) -> str:
+        """Identity used to resume: folder, product type and steps."""
+        steps = " ".join(self.steps) if self.steps else "default"
+        return f"{os.path.abspath(self.folder)}|{self.product_type}|{steps}"
+
+
+def load_manifest(path: str) -> List[BatchEntry]:
+    """Read a CSV or JSONL manifest.
+
+    Raises:
+        ValueError: If a row cannot be parsed (the message names the line)
+    """
+    entries = []
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.DictReader(f)
+            rows = ((reader.line_num, row) for row in reader)
+        else:
+            rows = ((line_num, line) for line_num, line in enumerate(f, start=1) if line.strip())
+        for line_num, row in rows:
+            try:
+                if isinstance(row, str):
+                    row = json.loads(row)
+                entries.append(BatchEntry.from_dict(row))
+            except (ValueError, AttributeError) as e:
+                raise ValueError(f"{path}:{line_num}: {e}") from None
+    return entries
+
+
+def entries_from_glob(
+    pattern: str,
+    product_type: str,
+    steps: Optional[List[str]] = None,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> List[BatchEntry]:
+    """One entry per folder matching ``pattern``, in natural order."""
+    folders = sorted(
+        (path for path in glob.glob(pattern) if os.path.isdir(path)),
+        key=natural_sort_key,
+    )
+    return [
+        BatchEntry(folder=folder, product_type=product_type, steps=steps, overrides=dict(overrides or {}))
+        for folder in folders
+    ]
+
+
+def succeeded_keys(results_log: str) -> Set[str]:
+    """Keys of the entries whose latest result in the log succeeded."""
+    latest: Dict[str, bool] = {}
+    if not os.path.exists(results_log):
+        return set()
+    with open(results_log) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Partial last line from an interrupted run
+                continue
+            if "key" in record:
+                latest[record["key"]] = bool(record.get("success"))
+    return {key for key, success in latest.items() if success}
+
+
+def _run_entry(
+    entry: BatchEntry, skip_steps: List[str], resize_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    started_at = _now()
+    custom_settings = dict(entry.overrides)
+    if resize_workers is not None:
+        custom_settings.setdefault("resize_workers", resize_workers)
+    summary = run_folder(
+        entry.folder,
+        entry.product_type,
+        steps=entry.steps,
+        skip_steps=skip_steps,
+        output_dir=entry.output_dir,
+        ai_provider=entry.ai_provider,
+        custom_settings=custom_settings,
+    )
+    # "steps" is the requested step list; the outcome of each step is kept apart
+    summary["step_results"] = summary.pop("steps")
+    return {
+        "key": entry.key,
+        **asdict(entry),
+        **summary,
+        "started_at": started_at,
+        "finished_at": _now(),
+    }
+
+
+def _append_result(results_log: str, record: Dict[str, Any]) -> None:
+    with open(results_log, "a") as f:
+        f.write(json.dumps(record, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def run_batch(
+    entries: List[BatchEntry],
+    results_log: str = DEFAULT_RESULTS_LOG,
+    workers: int = 1,
+    resume: bool = True,
+    skip_steps: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """Process every entry and append one JSONL record per entry to ``results_log``.
+
+    Args:
+        entries: Folders to process
+        results_log: JSONL results log (appended to)
+        workers: Folders processed in parallel, each in its own process
+            (1 runs in-process)
+        resume: Skip entries whose latest result in the log succeeded
+        skip_steps: Steps dropped from every workflow
+
+    Returns:
+        Dict with total, skipped, succeeded and failed counts and the log path
+
+    Raises:
+        ValueError: If an entry has an unknown product type
+    """
+    unknown = sorted({e.product_type for e in entries if not ProcessorFactory.supports_type(e.product_type)})
+    if unknown:
+        raise ValueError(
+            f"Unknown product type(s): {', '.join(unknown)}. "
+            f"Available types: {', '.join(ProcessorFactory.get_available_types())}"
+        )
+
+    done = succeeded_keys(results_log) if resume else set()
+    pending = [entry for entry in entries if entry.key not in done]
+    summary = {
+        "total": len(entries),
+        "skipped": len(entries) - len(pending),
+        "succeeded": 0,
+        "failed": 0,
+        "results_log": results_log,
+    }
+    if summary["skipped"]:
+        logger.info(f"Skipping {summary['skipped']} entries that already succeeded")
+    if not pending:
+        return summary
+
+    skip_steps = list(skip_steps)
+    workers = max(1, min(workers, len(pending)))
+    # Share the CPUs between folders instead of giving every folder's
+    # resize step a pool of its own
+    resize_workers = max(1, (os.cpu_count() or 1) // workers) if workers > 1 else None
+
+    def record(result: Dict[str, Any]) -> None:
+        _append_result(results_log, result)
+        outcome = "succeeded" if result["success"] else "failed"
+        summary[outcome] += 1
+        finished = summary["succeeded"] + summary["failed"]
+        if result["success"]:
+            logger.info(f"✅ [{finished}/{len(pending)}] {result['folder']} in {result['duration_s']:.1f}s")
+        else:
+            logger.error(f"❌ [{finished}/{len(pending)}] {result['folder']}: {result['error']}")
+
+    logger.info(f"Processing {len(pending)} folders with {workers} worker(s)")
+    if workers == 1:
+        for entry in pending:
+            record(_run_entry(entry, skip_steps))
+        return summary
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_run_entry, entry, skip_steps, resize_workers): entry for entry in pending
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. out of memory)
+                    entry = futures[future]
+                    result = {"key": entry.key, **asdict(entry), "success": False, "error": str(e)}
+                    result.setdefault("duration_s", 0.0)
+                record(result)
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    return summary
@@ -75,6 +75,9 @@ class ProductTypeConfig:
     color_settings: Dict[str, Any] = field(default_factory=dict)
     layout_settings: Dict[str, Any] = field(default_factory=dict)
 
+    # Output encoding: purpose ("delivery", "mockup", "working") -> encode profile
+    encode_settings: Dict[str, str] = field(default_factory=dict)
+
     # External integrations
     etsy_settings: Dict[str, Any] = field(default_factory=dict)
     ai_prompts: Dict[str, str] = field(default_factory=dict)
@@ -426,6 +429,7 @@ class ConfigManager:
             "resize_settings": config.resize_settings,
             "mockup_settings": config.mockup_settings,
             "video_settings": config.video_settings,
+            "encode_settings": config.encode_settings,
             "etsy_settings": config.etsy_settings,
             "ai_prompts": config.ai_prompts,
             "custom_settings": config.custom_settings,
@@ -497,6 +501,19 @@ class ConfigManager:
 
         return config.layout_settings
 
+    def get_encode_settings(self, product_type: str) -> Dict[str, str]:
+        """Get the encode profile for each output purpose of a product type.
+
+        Purposes missing from the product type's ``encode_settings`` use
+        ``DEFAULT_PURPOSE_PROFILES`` (archival delivery files, balanced
+        mockups, fast working files).
+        """
+        from src.utils.image_encoding import DEFAULT_PURPOSE_PROFILES
+
+        config = self.get_config(product_type)
+        encode_settings = config.encode_settings if config else {}
+        return {**DEFAULT_PURPOSE_PROFILES, **encode_settings}
+
 
 # Global configuration manager instance
 config_manager = ConfigManager()
@@ -0,0 +1,487 @@
+"""
+Watch-folder daemon: process product folders as soon as uploads finish.
+
+``FolderWatcher`` watches the input folder for product folders and runs
+each one through its product type's workflow (``ProcessorFactory`` and
+``run_workflow``) once it is stable, i.e. its source images have not
+changed for ``settle_seconds``. Changes are picked up with inotify on
+Linux and by polling elsewhere (or when inotify is unavailable).
+
+Product type per folder:
+
+- ``input/<product_type>/<folder>``: folders inside a folder named after a
+  registered product type use that type
+- ``input/<folder>``: any other folder uses the watcher's default product
+  type and is ignored when there is none
+
+Each folder gets a ``<folder>.status.json`` next to it with its state
+(waiting, queued, running, done, failed), timings, per-step results and a
+signature of the source images it was processed with. A folder is only
+processed again when its source images change, so outputs written by the
+workflow itself and restarts of the daemon do not trigger reruns. Source
+images uploaded while a folder is running are not part of that signature,
+so the folder is processed again once they settle.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.batch import run_folder
+from src.core.processor_factory import ProcessorFactory
+from src.utils.common import setup_logging
+from src.utils.folder_inventory import IMAGE_EXTENSIONS, SOURCES, FolderInventory, recorded_writes
+
+logger = setup_logging(__name__)
+
+STATUS_SUFFIX = ".status.json"
+DEFAULT_SETTLE_SECONDS = 30.0
+DEFAULT_POLL_INTERVAL = 5.0
+
+WAITING = "waiting"
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _subfolders(path: str) -> List[str]:
+    """Visible subfolders of ``path`` (one scandir, no recursion)."""
+    try:
+        with os.scandir(path) as it:
+            return sorted(
+                entry.name
+                for entry in it
+                if not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False)
+            )
+    except OSError:
+        return []
+
+
+def status_file_path(folder: str) -> str:
+    """``<folder>.status.json`` next to the folder."""
+    return os.path.normpath(folder) + STATUS_SUFFIX
+
+
+def read_status(folder: str) -> Dict[str, Any]:
+    """The folder's status file contents (empty if missing or unreadable)."""
+    try:
+        with open(status_file_path(folder)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_status(folder: str, status: Dict[str, Any]) -> None:
+    """Atomically replace the folder's status file."""
+    path = status_file_path(folder)
+    parent, name = os.path.split(path)
+    temp_path = os.path.join(parent, f".{name}.tmp")
+    try:
+        with open(temp_path, "w") as f:
+            json.dump({**status, "updated_at": _now()}, f, indent=2, default=str)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write status for {folder}: {e}")
+
+
+def source_signature(folder: str) -> Optional[str]:
+    """Digest of the folder's source images (None if it has none yet)."""
+    entries = FolderInventory(folder).files(extensions=IMAGE_EXTENSIONS, categories=[SOURCES])
+    if not entries:
+        return None
+    digest = hashlib.sha1()
+    for entry in entries:
+        digest.update(f"{entry.relpath}\0{entry.size}\0{entry.mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def uploads_since(folder: str, since_ns: int, written: Set[str]) -> List[str]:
+    """Source images changed since ``since_ns`` that the pipeline did not write.
+
+    Args:
+        folder: Product folder
+        since_ns: ``time.time_ns()`` when the run started
+        written: Absolute paths written by the run (see ``recorded_writes``)
+
+    Returns:
+        Relative paths of the images, in natural order
+    """
+    entries = FolderInventory(folder).files(extensions=IMAGE_EXTENSIONS, categories=[SOURCES])
+    return [e.relpath for e in entries if e.mtime_ns >= since_ns and e.path not in written]
+
+
+class _Inotify:
+    """Minimal ctypes binding for Linux inotify.
+
+    Raises:
+        OSError: If inotify is not available
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    MASK = (
+        IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    )
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._add_watch.restype = ctypes.c_int
+
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._paths: Dict[int, str] = {}
+        self._watched: Set[str] = set()
+
+    def watch(self, path: str) -> None:
+        if path in self._watched:
+            return
+        wd = self._add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+        self._paths[wd] = path
+        self._watched.add(path)
+
+    def read(self, timeout: float) -> Optional[List[str]]:
+        """Paths with events within ``timeout`` seconds.
+
+        Returns:
+            Changed paths, or None if the kernel queue overflowed and any
+            watched path may have changed
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        changed: List[str] = []
+        overflow = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+                name = data[offset + self._EVENT.size : offset + self._EVENT.size + length]
+                offset += self._EVENT.size + length
+                if mask & self.IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                path = self._paths.get(wd)
+                if path is None:
+                    continue
+                if mask & self.IN_IGNORED:
+                    # Watched directory was removed
+                    del self._paths[wd]
+                    self._watched.discard(path)
+                    continue
+                name = os.fsdecode(name.rstrip(b"\0"))
+                changed.append(os.path.join(path, name) if name else path)
+        return None if overflow else changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+@dataclass
+class _Candidate:
+    """Watch state of one product folder."""
+
+    folder: str
+    product_type: str
+    processed: Optional[str] = None
+    signature: Optional[str] = None
+    changed_at: float = 0.0
+    dirty: bool = True
+
+
+class FolderWatcher:
+    """Process product folders in ``input_dir`` once uploads settle.
+
+    Args:
+        input_dir: Folder to watch
+        product_type: Product type for folders not inside a product type
+            folder (None ignores them)
+        settle_seconds: Seconds without changes before a folder is processed
+        poll_interval: Seconds between checks
+        concurrency: Folders processed at the same time
+        steps: Workflow steps (default: each product type's default steps)
+        skip_steps: Steps to drop from the workflow (e.g. "video")
+        ai_provider: AI provider for content generation
+        custom_settings: Passed to each run's ProcessingConfig
+        use_inotify: Use inotify when available instead of polling
+
+    Raises:
+        ValueError: If the default product type is not registered
+    """
+
+    def __init__(
+        self,
+        input_dir: str = "input",
+        product_type: Optional[str] = None,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        concurrency: int = 1,
+        steps: Optional[List[str]] = None,
+        skip_steps: Iterable[str] = (),
+        ai_provider: str = "gemini",
+        custom_settings: Optional[Dict[str, Any]] = None,
+        use_inotify: bool = True,
+    ):
+        if product_type is not None and not ProcessorFactory.supports_type(product_type):
+            raise ValueError(
+                f"Unknown product type: {product_type}. "
+                f"Available types: {', '.join(ProcessorFactory.get_available_types())}"
+            )
+        self.input_dir = os.path.abspath(input_dir)
+        self.product_type = product_type
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.concurrency = concurrency
+        self.steps = steps
+        self.skip_steps = set(skip_steps)
+        self.ai_provider = ai_provider
+        self.custom_settings = custom_settings or {}
+        self.use_inotify = use_inotify
+
+        self._candidates: Dict[str, _Candidate] = {}
+        self._running: Dict[Future, _Candidate] = {}
+        self._inotify: Optional[_Inotify] = None
+
+    def discover(self) -> Dict[str, str]:
+        """Product folders currently in the input folder, mapped to their product type."""
+        folders: Dict[str, str] = {}
+        for name in _subfolders(self.input_dir):
+            path = os.path.join(self.input_dir, name)
+            if ProcessorFactory.supports_type(name):
+                for child in _subfolders(path):
+                    folders[os.path.join(path, child)] = name
+            elif self.product_type:
+                folders[path] = self.product_type
+        return folders
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """Watch until ``stop_event`` is set (or forever), then let running folders finish."""
+        stop_event = stop_event or threading.Event()
+        os.makedirs(self.input_dir, exist_ok=True)
+        if self.use_inotify:
+            try:
+                self._inotify = _Inotify()
+                self._inotify.watch(self.input_dir)
+            except OSError as e:
+                logger.warning(f"⚠️ inotify unavailable ({e}), polling every {self.poll_interval:g}s")
+                self._inotify = None
+
+        mode = "inotify" if self._inotify else "polling"
+        logger.info(
+            f"👀 Watching {self.input_dir} ({mode}, settle {self.settle_seconds:g}s, "
+            f"{self.concurrency} concurrent)"
+        )
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="watch")
+        try:
+            while not stop_event.is_set():
+                self.check(executor)
+                self._wait(stop_event)
+        finally:
+            logger.info("Stopping watcher, waiting for running folders to finish...")
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._collect_finished()
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+
+    def check(self, executor: ThreadPoolExecutor) -> List[str]:
+        """Refresh every folder's state and queue the ones that have settled.
+
+        Returns:
+            Folders queued by this check
+        """
+        self._collect_finished()
+        now = time.monotonic()
+        folders = self.discover()
+        active = {candidate.folder for candidate in self._running.values()}
+
+        for folder in set(self._candidates) - set(folders):
+            del self._candidates[folder]
+
+        queued = []
+        for folder, product_type in folders.items():
+            candidate = self._candidates.get(folder)
+            if candidate is None:
+                candidate = self._candidates[folder] = self._load_candidate(folder, product_type)
+                self._watch_tree(folder)
+            if folder in active:
+                continue
+
+            if candidate.dirty or self._inotify is None:
+                candidate.dirty = False
+                signature = source_signature(folder)
+                if signature != candidate.signature:
+                    candidate.signature = signature
+                    candidate.changed_at = now
+                    if signature is not None and signature != candidate.processed:
+                        write_status(folder, self._status(candidate, WAITING))
+
+            if candidate.signature is None or candidate.signature == candidate.processed:
+                continue
+            if now - candidate.changed_at < self.settle_seconds:
+                continue
+
+            write_status(folder, self._status(candidate, QUEUED, queued_at=_now()))
+            future = executor.submit(self._process, candidate.folder, candidate.product_type)
+            self._running[future] = candidate
+            queued.append(folder)
+            logger.info(f"📥 Queued {folder} ({candidate.product_type})")
+        return queued
+
+    def _load_candidate(self, folder: str, product_type: str) -> _Candidate:
+        status = read_status(folder)
+        processed = status.get("source_signature") if status.get("state") in (DONE, FAILED) else None
+        return _Candidate(folder, product_type, processed=processed)
+
+    def _watch_tree(self, folder: str) -> None:
+        if self._inotify is None:
+            return
+        try:
+            for root, dirs, _ in os.walk(folder):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                self._inotify.watch(root)
+        except OSError as e:
+            # Usually fs.inotify.max_user_watches; polling still sees everything
+            logger.warning(f"⚠️ Cannot watch {folder} ({e}), falling back to polling")
+            self._inotify.close()
+            self._inotify = None
+
+    def _wait(self, stop_event: threading.Event) -> None:
+        if self._inotify is None:
+            stop_event.wait(self.poll_interval)
+            return
+
+        changed = self._inotify.read(self.poll_interval)
+        if changed is None:
+            for candidate in self._candidates.values():
+                candidate.dirty = True
+            return
+        for path in changed:
+            for folder, candidate in self._candidates.items():
+                if path == folder or path.startswith(folder + os.sep):
+                    candidate.dirty = True
+                    if os.path.isdir(path):
+                        self._watch_tree(path)
+                    break
+
+    def _collect_finished(self) -> None:
+        for future in [f for f in self._running if f.done()]:
+            candidate = self._running.pop(future)
+            if future.cancelled():
+                continue
+            try:
+                signature, uploaded = future.result()
+            except Exception as e:
+                logger.error(f"❌ Watcher failed on {candidate.folder}: {e}")
+                continue
+            candidate.signature = signature
+            if uploaded:
+                # Run again once the uploads that arrived mid-run settle
+                candidate.processed = None
+                candidate.changed_at = time.monotonic()
+                candidate.dirty = True
+            else:
+                # Outputs written by the run are not changes to re-process
+                candidate.processed = signature
+                candidate.dirty = False
+
+    def _status(self, candidate: _Candidate, state: str, **fields: Any) -> Dict[str, Any]:
+        return {
+            "folder": candidate.folder,
+            "product_type": candidate.product_type,
+            "state": state,
+            **fields,
+        }
+
+    def _process(self, folder: str, product_type: str) -> Tuple[Optional[str], List[str]]:
+        """Run the folder's workflow and record the outcome in its status file.
+
+        Returns:
+            Source signature after the run (the resize step rewrites sources)
+            and the source images uploaded while it ran
+        """
+        status = read_status(folder)
+        status.update(state=RUNNING, started_at=_now(), error=None)
+        status.pop("source_signature", None)
+        write_status(folder, status)
+        logger.info(f"▶️ Processing {folder} ({product_type})")
+
+        custom_settings = dict(self.custom_settings)
+        if self.concurrency > 1:
+            # Share the CPUs between folders instead of giving every folder's
+            # resize step a pool of its own
+            custom_settings.setdefault("resize_workers", max(1, (os.cpu_count() or 1) // self.concurrency))
+
+        started_ns = time.time_ns()
+        with recorded_writes(folder) as written:
+            outcome = run_folder(
+                folder,
+                product_type,
+                steps=self.steps,
+                skip_steps=self.skip_steps,
+                ai_provider=self.ai_provider,
+                custom_settings=custom_settings,
+            )
+        status.update(
+            state=DONE if outcome["success"] else FAILED,
+            steps=outcome["steps"],
+            error=outcome["error"],
+            report_file=outcome["report_file"],
+        )
+
+        signature = source_signature(folder)
+        uploaded = uploads_since(folder, started_ns, written)
+        status.update(finished_at=_now(), duration_s=outcome["duration_s"])
+        if not uploaded:
+            status["source_signature"] = signature
+        write_status(folder, status)
+        if status["state"] == DONE:
+            logger.info(f"✅ Finished {folder} in {status['duration_s']:.1f}s")
+        else:
+            logger.error(f"❌ {folder} failed: {status['error']}")
+        if uploaded:
+            logger.info(f"🆕 {len(uploaded)} image(s) uploaded to {folder} while it ran, processing again")
+        return signature, uploaded
@@ -0,0 +1,354 @@
+"""
+Lightweight instrumentation for processing workflows.
+
+``WorkflowMetrics.measure`` wraps a workflow step or one of its artifacts
+(a single mockup, a video, ...) and records:
+
+- wall time
+- CPU time of the whole process, including worker threads and child
+  processes (such as the resize pool) that exited during the block
+- peak memory above the RSS at the start of the block, from RSS samples
+  taken every ``RSS_SAMPLE_INTERVAL_S`` (Linux only)
+- images decoded (PIL loads and ``cv2.imread`` calls on any thread)
+- bytes written to the watched output folders
+
+CPU time and decodes are process-wide, so runs that overlap in the same
+process (``run_batch`` with thread concurrency, the web app) are included
+in each other's numbers.
+
+Measurements nest: an artifact measured while a step is running is stored
+under that step's ``artifacts``. Only steps scan the watched folders for
+bytes written; artifacts count the writes handed to ``count_writes``.
+``WorkflowProfiler`` optionally captures a cProfile or pyinstrument
+profile of a whole run.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.common import setup_logging
+
+logger = setup_logging(__name__)
+
+RUN_REPORT_FILENAME = "run_report.json"
+PROFILE_BASENAME = "run_profile"
+PROFILERS = ("cprofile", "pyinstrument")
+RSS_SAMPLE_INTERVAL_S = 0.05
+
+_images_decoded = 0
+_decode_lock = threading.Lock()
+_hooks_lock = threading.Lock()
+_pil_hooked = False
+_cv2_hooked = False
+
+
+def _count_decode() -> None:
+    global _images_decoded
+    with _decode_lock:
+        _images_decoded += 1
+
+
+def _process_cpu_time() -> float:
+    """CPU seconds used by this process and its reaped child processes."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _install_decode_hooks() -> None:
+    """Count image decodes by wrapping PIL's ImageFile.load and cv2.imread.
+
+    cv2 is only hooked once something else has imported it, so measuring
+    never pulls OpenCV into a process that does not use it.
+    """
+    global _pil_hooked, _cv2_hooked
+    if _pil_hooked and (_cv2_hooked or "cv2" not in sys.modules):
+        return
+
+    with _hooks_lock:
+        if not _pil_hooked:
+            from PIL import ImageFile
+
+            original_load = ImageFile.ImageFile.load
+
+            def load(self, *args, **kwargs):
+                # tile is only non-empty until the pixel data has been decoded
+                if getattr(self, "tile", None):
+                    _count_decode()
+                return original_load(self, *args, **kwargs)
+
+            ImageFile.ImageFile.load = load
+            _pil_hooked = True
+
+        if not _cv2_hooked and "cv2" in sys.modules:
+            cv2 = sys.modules["cv2"]
+            original_imread = cv2.imread
+
+            def imread(*args, **kwargs):
+                _count_decode()
+                return original_imread(*args, **kwargs)
+
+            cv2.imread = imread
+            _cv2_hooked = True
+
+
+def _read_proc_status_kb(field: str) -> Optional[int]:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _current_rss_mb() -> Optional[float]:
+    rss_kb = _read_proc_status_kb("VmRSS")
+    return rss_kb / 1024 if rss_kb is not None else None
+
+
+def _snapshot_files(folders: List[str]) -> Dict[str, Tuple[int, int]]:
+    files: Dict[str, Tuple[int, int]] = {}
+    for folder in folders:
+        for root, _, names in os.walk(folder):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files[path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def _bytes_written(before: Dict[str, Tuple[int, int]], after: Dict[str, Tuple[int, int]]) -> int:
+    """Total size of files in ``after`` that were created or modified since ``before``."""
+    return sum(size for path, (size, mtime) in after.items() if before.get(path) != (size, mtime))
+
+
+class WorkflowMetrics:
+    """Collects nested measurements for one workflow run.
+
+    Args:
+        watch_dirs: Folders whose new or modified files count as bytes written
+    """
+
+    def __init__(self, watch_dirs: Optional[List[str]] = None):
+        self.watch_dirs = [d for d in dict.fromkeys(watch_dirs or []) if d]
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.measurements: Dict[str, Dict[str, Any]] = {}
+        self._stack: List[Dict[str, Any]] = []
+        self._peaks: List[Optional[float]] = []
+        self._lock = threading.Lock()
+        self._files: Optional[Dict[str, Tuple[int, int]]] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampling = threading.Event()
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Measure the enclosed block and store the result under ``name``.
+
+        Yields:
+            The metrics dict, filled in when the block exits
+        """
+        _install_decode_hooks()
+        parent = self._stack[-1] if self._stack else None
+        if parent is None:
+            # The snapshot taken when the previous step ended is still current
+            if self._files is None:
+                self._files = _snapshot_files(self.watch_dirs)
+            files_before = self._files
+
+        metrics: Dict[str, Any] = {}
+        rss_start = _current_rss_mb()
+        self._stack.append(metrics)
+        with self._lock:
+            self._peaks.append(rss_start)
+        if parent is None:
+            self._start_sampler()
+        decoded_start = _images_decoded
+        wall_start = time.perf_counter()
+        cpu_start = _process_cpu_time()
+        try:
+            yield metrics
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = _process_cpu_time() - cpu_start
+            decoded = _images_decoded - decoded_start
+            if parent is None:
+                self._stop_sampler()
+            self._sample_rss()
+            self._stack.pop()
+            with self._lock:
+                peak = self._peaks.pop()
+
+            metrics.update({
+                "wall_time_s": round(wall, 4),
+                "cpu_time_s": round(cpu, 4),
+                "peak_memory_delta_mb": (
+                    round(max(peak - rss_start, 0.0), 1)
+                    if peak is not None and rss_start is not None
+                    else None
+                ),
+                "images_decoded": decoded,
+            })
+            if parent is not None:
+                with self._lock:
+                    metrics.setdefault("bytes_written", 0)
+                parent.setdefault("artifacts", {})[name] = metrics
+            else:
+                self._files = _snapshot_files(self.watch_dirs)
+                metrics["bytes_written"] = _bytes_written(files_before, self._files)
+                self.measurements[name] = metrics
+
+    def count_writes(self, metrics: Dict[str, Any], futures: Iterable["Future[int]"]) -> None:
+        """Add the bytes of background writes to an artifact's ``bytes_written``.
+
+        Writes that are still running are added when they finish, so call
+        this right after the artifact's block without waiting for them.
+
+        Args:
+            metrics: Metrics dict yielded by ``measure``
+            futures: Write futures resolving to the number of bytes written
+        """
+        with self._lock:
+            metrics.setdefault("bytes_written", 0)
+        for future in futures:
+            future.add_done_callback(partial(self._add_written, metrics))
+
+    def _add_written(self, metrics: Dict[str, Any], future: "Future[int]") -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            metrics["bytes_written"] = metrics.get("bytes_written", 0) + future.result()
+
+    def _sample_rss(self) -> None:
+        rss = _current_rss_mb()
+        if rss is None:
+            return
+        with self._lock:
+            # Every open measurement is still running, so the sample counts for all of them
+            self._peaks = [rss if peak is None else max(peak, rss) for peak in self._peaks]
+
+    def _start_sampler(self) -> None:
+        if _current_rss_mb() is None:
+            return
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="rss-sampler", daemon=True)
+        self._sampler.start()
+
+    def _stop_sampler(self) -> None:
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample_loop(self) -> None:
+        while not self._stop_sampling.wait(RSS_SAMPLE_INTERVAL_S):
+            self._sample_rss()
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals across the top-level measurements plus the measurements themselves."""
+        steps = self.measurements.values()
+        peaks = [m["peak_memory_delta_mb"] for m in steps if m["peak_memory_delta_mb"] is not None]
+        return {
+            "started_at": self.started_at,
+            "total": {
+                "wall_time_s": round(sum(m["wall_time_s"] for m in steps), 4),
+                "cpu_time_s": round(sum(m["cpu_time_s"] for m in steps), 4),
+                "peak_memory_delta_mb": max(peaks) if peaks else None,
+                "images_decoded": sum(m["images_decoded"] for m in steps),
+                "bytes_written": sum(m["bytes_written"] for m in steps),
+            },
+            "steps": self.measurements,
+        }
+
+
+class WorkflowProfiler:
+    """Optional cProfile/pyinstrument capture of a workflow run.
+
+    pyinstrument is optional; if it is not installed the profiler falls
+    back to cProfile with a warning.
+
+    Args:
+        kind: "cprofile" or "pyinstrument"
+        top: Number of functions by cumulative time to include in the summary
+    """
+
+    def __init__(self, kind: str = "cprofile", top: int = 20):
+        if kind not in PROFILERS:
+            raise ValueError(f"Unknown profiler: {kind}. Must be one of {', '.join(PROFILERS)}")
+        self.kind = kind
+        self.top = top
+        self._profiler: Any = None
+
+    def start(self) -> None:
+        if self.kind == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+                self._profiler = Profiler()
+                self._profiler.start()
+                return
+            except ImportError:
+                logger.warning("⚠️ pyinstrument not installed, falling back to cProfile")
+                self.kind = "cprofile"
+
+        import cProfile
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop(self, output_dir: str) -> Dict[str, Any]:
+        """Stop profiling and write the profile into ``output_dir``.
+
+        Returns:
+            Dict with the profiler used, the profile file and the top functions
+        """
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+            profile_file = os.path.join(output_dir, f"{PROFILE_BASENAME}.html")
+            with open(profile_file, "w") as f:
+                f.write(self._profiler.output_html())
+            top_text = self._profiler.output_text(unicode=False, color=False)
+            return {"profiler": self.kind, "file": profile_file, "top": top_text.splitlines()[: self.top * 2]}
+
+        import pstats
+        self._profiler.disable()
+        profile_file = os.path.join(output_dir, f"{PROFILE_BASENAME}.prof")
+        self._profiler.dump_stats(profile_file)
+
+        stats = pstats.Stats(self._profiler)
+        top = []
+        for (filename, line, func), (_, calls, tottime, cumtime, _) in sorted(
+            stats.stats.items(), key=lambda item: item[1][3], reverse=True
+        )[: self.top]:
+            top.append({
+                "function": f"{filename}:{line}({func})",
+                "calls": calls,
+                "tottime_s": round(tottime, 4),
+                "cumtime_s": round(cumtime, 4),
+            })
+        return {"profiler": self.kind, "file": profile_file, "top": top}
+
+
+def write_run_report(output_dir: str, report: Dict[str, Any]) -> Optional[str]:
+    """Write ``run_report.json`` into ``output_dir``.
+
+    Returns:
+        Path of the report, or None if it could not be written
+    """
+    report_file = os.path.join(output_dir, RUN_REPORT_FILENAME)
+    try:
+        with open(report_file, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        return report_file
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write run report: {e}")
+        return None
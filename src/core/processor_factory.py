@@ -3,33 +3,55 @@ Factory for creating product type processors.
 Centralizes processor creation and registration.
 """
 
+import importlib
 from typing import Dict, Type, List
 from .base_processor import BaseProcessor, ProcessingConfig
 
+# Built-in processors by entry-point name ("module:Class"). A processor
+# module, and the image and AI libraries it pulls in, is only imported when
+# a processor of that type is first created.
+BUILTIN_PROCESSORS = {
+    "pattern": "src.products.pattern.processor:PatternProcessor",
+    "clipart": "src.products.clipart.processor:ClipartProcessor",
+    "border_clipart": "src.products.border_clipart.processor:BorderClipartProcessor",
+    "journal_papers": "src.products.journal_papers.processor:JournalPapersProcessor",
+}
+
 
 class ProcessorRegistry:
     """Registry for product type processors."""
     
     def __init__(self):
         self._processors: Dict[str, Type[BaseProcessor]] = {}
+        self._entry_points: Dict[str, str] = {}
     
     def register(self, product_type: str, processor_class: Type[BaseProcessor]):
         """Register a processor for a product type."""
         self._processors[product_type] = processor_class
     
+    def register_lazy(self, product_type: str, entry_point: str):
+        """Register a processor by ``module:Class`` name, imported on first use."""
+        self._entry_points[product_type] = entry_point
+    
     def get_processor_class(self, product_type: str) -> Type[BaseProcessor]:
-        """Get processor class for a product type."""
-        if product_type not in self._processors:
+        """Get processor class for a product type, importing it if needed."""
+        if product_type in self._processors:
+            return self._processors[product_type]
+        if product_type not in self._entry_points:
             raise ValueError(f"Unknown product type: {product_type}")
-        return self._processors[product_type]
+
+        module_name, _, class_name = self._entry_points[product_type].partition(":")
+        processor_class = getattr(importlib.import_module(module_name), class_name)
+        self._processors[product_type] = processor_class
+        return processor_class
     
     def list_available_types(self) -> List[str]:
-        """List all registered product types."""
-        return list(self._processors.keys())
+        """List all registered product types without importing them."""
+        return list(dict.fromkeys([*self._entry_points, *self._processors]))
     
     def is_registered(self, product_type: str) -> bool:
         """Check if a product type is registered."""
-        return product_type in self._processors
+        return product_type in self._processors or product_type in self._entry_points
 
 
 class ProcessorFactory:
@@ -43,6 +65,11 @@ class ProcessorFactory:
         """Register a processor class for a product type."""
         cls._registry.register(product_type, processor_class)
     
+    @classmethod
+    def register_lazy_processor(cls, product_type: str, entry_point: str):
+        """Register a processor by ``module:Class`` entry-point name."""
+        cls._registry.register_lazy(product_type, entry_point)
+    
     @classmethod
     def create_processor(cls, config: ProcessingConfig) -> BaseProcessor:
         """Create a processor instance for the given configuration."""
@@ -65,4 +92,8 @@ def register_processor(product_type: str):
     def decorator(processor_class: Type[BaseProcessor]):
         ProcessorFactory.register_processor(product_type, processor_class)
         return processor_class
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+for _product_type, _entry_point in BUILTIN_PROCESSORS.items():
+    ProcessorFactory.register_lazy_processor(_product_type, _entry_point)
@@ -7,6 +7,7 @@ import random
 from src.utils.color_utils import extract_colors_from_images
 from src.utils.text_utils import draw_text, calculate_text_dimensions, create_text_backdrop
 from src.utils.common import get_font
+from src.utils.image_utils import composite_region
 import colorsys
 
 
@@ -41,6 +42,38 @@ def _generate_border_color_palette(base_colors):
     }
 
 
+def _render_seamless_row_strip(
+    tile: Image.Image, strip_width: int
+) -> Image.Image:
+    """
+    Tile a border horizontally into a single transparent row strip.
+    
+    Tiles start a quarter tile to the left of the strip so the repeat
+    looks continuous at the edge. Each tile is pasted with its own alpha
+    as mask, exactly as it would be on a full-size transparent layer, so
+    compositing the strip once gives the same pixels as compositing one
+    full canvas layer per tile.
+    
+    Args:
+        tile: RGBA border image, already scaled to the row height
+        strip_width: Width of the strip (usually the canvas width)
+        
+    Returns:
+        RGBA strip of size (strip_width, tile height)
+    """
+    tile_width, tile_height = tile.size
+    strip = Image.new("RGBA", (strip_width, tile_height), (255, 255, 255, 0))
+    
+    # Extra tiles to ensure full coverage
+    tiles_needed = (strip_width // tile_width) + 2
+    for tile_idx in range(tiles_needed):
+        tile_x = tile_idx * tile_width - (tile_width // 4)
+        if tile_x < strip_width:
+            strip.paste(tile, (tile_x, 0), tile)
+    
+    return strip
+
+
 def create_horizontal_seamless_mockup(
     input_image_paths: List[str],
     title: str,
@@ -115,26 +148,12 @@ def create_horizontal_seamless_mockup(
         # Resize the border
         resized_border = border_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
         
-        # Calculate how many times we need to tile horizontally to fill the canvas
-        tiles_needed = (canvas_width // new_width) + 2  # Extra tiles to ensure full coverage
-        
         # Create row position - evenly distribute rows in the available space
         row_y = start_y + (row_idx * row_height) + (row_height - new_height) // 2
         
-        # Tile the border horizontally across the canvas
-        for tile_idx in range(tiles_needed):
-            tile_x = tile_idx * new_width - (new_width // 4)  # Slight overlap to ensure seamless
-            
-            if tile_x < canvas_width:  # Only draw if within canvas bounds
-                # Create a temporary image for compositing with transparency
-                temp_canvas = Image.new("RGBA", canvas_size, (255, 255, 255, 0))
-                temp_canvas.paste(resized_border, (tile_x, row_y), resized_border)
-                
-                # Composite onto main canvas
-                canvas = Image.alpha_composite(
-                    canvas.convert("RGBA"), 
-                    temp_canvas
-                ).convert("RGB")
+        # Tile the border horizontally into a strip and composite it once
+        strip = _render_seamless_row_strip(resized_border, canvas_width)
+        composite_region(canvas, strip, (0, row_y))
     
     # Add text overlays using the same system as patterns
     draw = ImageDraw.Draw(canvas)
@@ -200,10 +219,9 @@ def create_horizontal_seamless_mockup(
     # Position and paste backdrop
     backdrop_x = (canvas_width - backdrop_width) // 2
     backdrop_y = (canvas_height - backdrop_height) // 2
-    canvas = canvas.convert("RGBA")
-    canvas.paste(text_backdrop, (backdrop_x, backdrop_y), text_backdrop)
+    composite_region(canvas, text_backdrop, (backdrop_x, backdrop_y))
     
-    # Create new draw object after conversion
+    # Create new draw object after compositing
     draw = ImageDraw.Draw(canvas)
     
     # Draw text elements
@@ -222,9 +240,6 @@ def create_horizontal_seamless_mockup(
     subtitle_bottom_y = backdrop_y + backdrop_height - subtitle_bottom_height - 30
     draw_text(draw, (subtitle_bottom_x, subtitle_bottom_y), subtitle_bottom, subtitle_font, color_palette["subtitle_text"])
     
-    # Convert back to RGB for final output
-    canvas = canvas.convert("RGB")
-    
     return canvas
 
 
@@ -298,18 +313,10 @@ def create_border_horizontal_rows(
                 if tile_x < grid_width:  # Only draw if within row bounds
                     row_canvas.paste(resized_border, (tile_x, tile_y), resized_border)
             
-            # Crop row canvas to exact row size
-            row_canvas = row_canvas.crop((0, 0, grid_width, row_height))
-            
-            # Create temp canvas for compositing
-            temp_canvas = Image.new("RGBA", grid_size, (255, 255, 255, 0))
-            temp_canvas.paste(row_canvas, (0, row_y), row_canvas)
-            
-            # Composite onto main canvas
-            canvas = Image.alpha_composite(
-                canvas.convert("RGBA"), 
-                temp_canvas
-            ).convert("RGB")
+            # Composite the row strip onto the main canvas
+            strip = Image.new("RGBA", row_canvas.size, (255, 255, 255, 0))
+            strip.paste(row_canvas, (0, 0), row_canvas)
+            composite_region(canvas, strip, (0, row_y))
             
         except Exception as e:
             print(f"Error processing image {img_path}: {e}")
@@ -9,6 +9,8 @@ from src.core.processor_factory import register_processor
 from src.utils.ai_utils import generate_content_with_ai
 from src.utils.file_operations import find_files_by_extension
 from src.utils.common import ensure_dir_exists
+from src.utils.image_encoding import save_image
+from src.utils.image_writer import write_image
 
 
 @register_processor("border_clipart")
@@ -24,7 +26,11 @@ class BorderClipartProcessor(BaseProcessor):
         from src.utils.resize_utils import ImageResizer
         
         try:
-            resizer = ImageResizer(max_size=1500, dpi=(300, 300))
+            resizer = ImageResizer(
+                max_size=1500,
+                dpi=(300, 300),
+                workers=self.config.custom_settings.get("resize_workers"),
+            )
             result = resizer.resize_clipart_style(self.config.input_dir)
             
             self.logger.info(f"Resized {result.get('processed', 0)} border clipart images")
@@ -40,14 +46,17 @@ class BorderClipartProcessor(BaseProcessor):
             results = {}
             
             # Create horizontal seamless mockup (main mockup)
-            results["main_mockup"] = self._create_horizontal_seamless_mockup()
+            with self.measure("main_mockup"):
+                results["main_mockup"] = self._create_horizontal_seamless_mockup()
             
             # Create grid mockup showing individual borders
-            results["grid_mockup"] = self._create_grid_mockup()
+            with self.measure("grid_mockup"):
+                results["grid_mockup"] = self._create_grid_mockup()
             
             # Create transparency demo
             if self.config.custom_settings.get("create_transparency_demo", True):
-                results["transparency_demo"] = self._create_transparency_demo()
+                with self.measure("transparency_demo"):
+                    results["transparency_demo"] = self._create_transparency_demo()
             
             return results
             
@@ -100,7 +109,7 @@ class BorderClipartProcessor(BaseProcessor):
             
             # Save the mockup
             output_path = os.path.join(mockup_dir, "main.png")
-            mockup_image.save(output_path)
+            write_image(mockup_image, output_path)
             
             return {"success": True, "file": output_path, "output_folder": mockup_dir}
             
@@ -163,7 +172,7 @@ class BorderClipartProcessor(BaseProcessor):
                 )
                 
                 # Save the grid
-                grid_image.save(output_path, "PNG")
+                save_image(grid_image, output_path, "PNG")
                 result_path = output_path
                 
                 if result_path:
@@ -211,7 +220,7 @@ class BorderClipartProcessor(BaseProcessor):
             )
             
             # Save watermarked version (overwrite original)
-            watermarked_image.convert("RGB").save(demo_path, "PNG", quality=95, optimize=True)
+            write_image(watermarked_image.convert("RGB"), demo_path, "PNG")
             
             self.logger.info(f"Applied watermark to transparency demo: {demo_path}")
             return demo_path
@@ -253,7 +262,7 @@ class BorderClipartProcessor(BaseProcessor):
             
             # Save the demo
             output_path = os.path.join(mockup_dir, "transparency.png")
-            demo_image.save(output_path)
+            save_image(demo_image, output_path)
             
             # Apply watermark to the transparency demo
             watermarked_path = self._apply_watermark_to_transparency_demo(output_path)
@@ -16,4 +16,9 @@ DEFAULT_BG_COLOR = (255, 255, 255)
 # Checkerboard pattern
 CHECKERBOARD_SIZE = 30
 CHECKERBOARD_COLOR1 = (255, 255, 255)
-CHECKERBOARD_COLOR2 = (200, 200, 200)
\ No newline at end of file
+CHECKERBOARD_COLOR2 = (200, 200, 200)
+
+# Sprite sheet extraction
+EXTRACT_MIN_AREA = 100  # Minimum opaque pixels for an extracted element
+EXTRACT_PADDING = 10  # Margin kept around each element
+EXTRACT_MERGE_DISTANCE = 0  # Merge fragments at most this many pixels apart
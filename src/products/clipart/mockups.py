@@ -5,9 +5,10 @@ Module for creating square mockups with a 2x3 grid (2 columns, 3 rows) and title
 import random
 import colorsys
 from typing import List, Tuple, Optional
-from PIL import Image, ImageStat
+from PIL import Image
 
 from src.utils.common import setup_logging, get_resampling_filter, safe_load_image
+from src.utils.color_utils import extract_palette
 from src.products.clipart.title import add_title_bar_and_text, DEFAULT_FONT_CONFIG, DEFAULT_TITLE_FONT_STEP
 
 # Set up logging
@@ -235,28 +236,18 @@ def extract_colors_from_images(
     colors = []
 
     for img_path in sample_paths:
-        try:
-            # Load image
-            img = safe_load_image(img_path, "RGB")
-            if not img:
-                continue
-
-            # Resize for faster processing
-            img_small = img.resize((50, 50), get_resampling_filter())
-
-            # Get image stats
-            stat = ImageStat.Stat(img_small)
-            avg_color = tuple(map(int, stat.mean))
-
-            # Convert to HSV to check if it's a good color for text
-            r, g, b = avg_color
+        palette = extract_palette(img_path)
+        if not palette:
+            continue
+
+        # Take the most represented color that works as text: darker
+        # colors (lower value) with some saturation
+        for color, _ in palette:
+            r, g, b = color
             _, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)  # h is unused
-
-            # We want darker colors (lower value) with some saturation
             if v < 0.7 and v > 0.2 and s > 0.2:
-                colors.append((*avg_color, 255))  # Add alpha channel
-        except Exception as e:
-            logger.error(f"Error extracting colors from {img_path}: {e}")
+                colors.append((*color, 255))  # Add alpha channel
+                break
 
     # If we couldn't extract any suitable colors, return default
     if not colors:
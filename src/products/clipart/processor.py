@@ -9,6 +9,8 @@ from src.core.processor_factory import register_processor
 from src.utils.ai_utils import generate_content_with_ai
 from src.utils.file_operations import find_files_by_extension
 from src.utils.common import ensure_dir_exists
+from src.utils.image_encoding import save_image
+from src.utils.image_writer import write_image
 
 
 @register_processor("clipart")
@@ -24,7 +26,11 @@ class ClipartProcessor(BaseProcessor):
         from src.utils.resize_utils import ImageResizer
 
         try:
-            resizer = ImageResizer(max_size=1500, dpi=(300, 300))
+            resizer = ImageResizer(
+                max_size=1500,
+                dpi=(300, 300),
+                workers=self.config.custom_settings.get("resize_workers"),
+            )
             result = resizer.resize_clipart_style(self.config.input_dir)
 
             self.logger.info(f"Resized {result.get('processed', 0)} clipart images")
@@ -41,19 +47,23 @@ class ClipartProcessor(BaseProcessor):
 
             # Create square mockup
             self.logger.info("About to create square mockup...")
-            results["square_mockup"] = self._create_square_mockup()
+            with self.measure("square_mockup"):
+                results["square_mockup"] = self._create_square_mockup()
             self.logger.info(f"Square mockup result: {results['square_mockup']}")
 
             # Create grid mockup (2x2)
             self.logger.info("About to create grid mockup...")
-            results["grid_mockup"] = self._create_grid_mockup()
+            with self.measure("grid_mockup"):
+                results["grid_mockup"] = self._create_grid_mockup()
 
             # Create transparency demo
             if self.config.custom_settings.get("create_transparency_demo", True):
-                results["transparency_demo"] = self._create_transparency_demo()
+                with self.measure("transparency_demo"):
+                    results["transparency_demo"] = self._create_transparency_demo()
 
             # Create Pinterest mockup
-            results["pinterest_mockup"] = self._create_pinterest_mockup()
+            with self.measure("pinterest_mockup"):
+                results["pinterest_mockup"] = self._create_pinterest_mockup()
 
             return results
 
@@ -127,7 +137,7 @@ class ClipartProcessor(BaseProcessor):
 
             # Save the mockup
             output_path = os.path.join(mockup_dir, "main.png")
-            mockup_image.save(output_path)
+            write_image(mockup_image, output_path)
             self.logger.info(f"Saved main mockup to: {output_path}")
 
             return {"success": True, "file": output_path, "output_folder": mockup_dir}
@@ -205,7 +215,7 @@ class ClipartProcessor(BaseProcessor):
                 )
 
                 # Save the grid
-                grid_image.save(output_path, "PNG")
+                save_image(grid_image, output_path, "PNG")
                 result_path = output_path
 
                 if result_path:
@@ -282,7 +292,7 @@ class ClipartProcessor(BaseProcessor):
 
             # Save the demo
             output_path = os.path.join(mockup_dir, "transparency.png")
-            watermarked_demo.save(output_path)
+            write_image(watermarked_demo, output_path)
 
             return {"success": True, "file": output_path, "output_folder": mockup_dir}
 
@@ -329,14 +339,22 @@ class ClipartProcessor(BaseProcessor):
             self.logger.info(
                 f"🔍 Starting clipart extraction from: {self.config.input_dir}"
             )
+            from src.products.clipart import config as clipart_config
             from src.products.clipart.utils import extract_clipart_from_sheets
 
             extracted_dir = os.path.join(self.config.output_dir, "extracted")
             ensure_dir_exists(extracted_dir)
             self.logger.info(f"📁 Created extraction directory: {extracted_dir}")
 
+            settings = self.config.custom_settings
             result = extract_clipart_from_sheets(
-                input_folder=self.config.input_dir, output_folder=extracted_dir
+                input_folder=self.config.input_dir,
+                output_folder=extracted_dir,
+                min_area=settings.get("extract_min_area", clipart_config.EXTRACT_MIN_AREA),
+                padding=settings.get("extract_padding", clipart_config.EXTRACT_PADDING),
+                merge_distance=settings.get(
+                    "extract_merge_distance", clipart_config.EXTRACT_MERGE_DISTANCE
+                ),
             )
 
             if result.get("success"):
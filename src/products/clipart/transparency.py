@@ -4,9 +4,10 @@ Module for creating transparency demonstrations.
 
 import os
 from typing import Tuple, Optional
-from PIL import Image, ImageDraw
+from PIL import Image
 
-from src.utils.common import setup_logging, get_resampling_filter, safe_load_image
+from src.utils.asset_cache import load_asset
+from src.utils.common import setup_logging, get_resampling_filter, load_image_for_size
 
 # Set up logging
 logger = setup_logging(__name__)
@@ -27,27 +28,22 @@ def create_transparency_demo(
         image_path: Path to the image
         canvas_path: Path to the canvas image
         scale: Scale factor for the image
-        checkerboard_size: Size of the checkerboard squares
-        checkerboard_color1: First color of the checkerboard
-        checkerboard_color2: Second color of the checkerboard
+        checkerboard_size: Size of the checkerboard squares (unused; the
+            demo shows the image on white)
+        checkerboard_color1: First color of the checkerboard (unused)
+        checkerboard_color2: Second color of the checkerboard (unused)
 
     Returns:
         The transparency demo image, or None if creation failed
     """
     logger.info(f"Creating transparency demo for {os.path.basename(image_path)}...")
 
-    # Load canvas
-    canvas = safe_load_image(canvas_path, "RGBA")
+    # Load canvas (shared across demos; pasting into it copies the pixels)
+    canvas = load_asset(canvas_path, "RGBA")
     if not canvas:
         logger.error(f"Failed to load canvas {canvas_path}")
         return None
 
-    # Load image
-    img = safe_load_image(image_path, "RGBA")
-    if not img:
-        logger.warning(f"Could not load image {image_path}")
-        return canvas.copy()
-
     # Calculate maximum dimensions
     canvas_w, canvas_h = canvas.size
     # Increase the scale by 15% to make the image larger
@@ -59,27 +55,16 @@ def create_transparency_demo(
         logger.warning("Invalid scale/canvas size.")
         return canvas.copy()
 
+    # Load image, decoded no larger than the demo needs
+    img = load_image_for_size(image_path, (max_w, max_h), "RGBA")
+    if not img:
+        logger.warning(f"Could not load image {image_path}")
+        return canvas.copy()
+
     try:
         # Resize image
-        img_copy = img.copy()
-        img_copy.thumbnail((max_w, max_h), get_resampling_filter())
-        img_w, img_h = img_copy.size
-
-        # Create checkerboard pattern
-        checkerboard = Image.new("RGBA", (img_w, img_h), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(checkerboard)
-
-        for y in range(0, img_h, checkerboard_size):
-            for x in range(0, img_w, checkerboard_size):
-                color = (
-                    checkerboard_color1
-                    if ((x // checkerboard_size) + (y // checkerboard_size)) % 2 == 0
-                    else checkerboard_color2
-                )
-                draw.rectangle(
-                    [(x, y), (x + checkerboard_size - 1, y + checkerboard_size - 1)],
-                    fill=color,
-                )
+        img.thumbnail((max_w, max_h), get_resampling_filter())
+        img_w, img_h = img.size
 
         # Calculate positions
         center_x = canvas_w // 2
@@ -87,10 +72,7 @@ def create_transparency_demo(
 
         # Left side: image on white background
         white_bg = Image.new("RGBA", (img_w, img_h), (255, 255, 255, 255))
-        white_composite = Image.alpha_composite(white_bg, img_copy)
-
-        # Create checkerboard composite (for potential future use)
-        # We're keeping the checkerboard creation code for future enhancements
+        white_composite = Image.alpha_composite(white_bg, img)
 
         # Paste only onto the left side of the canvas
         # Move the image more to the left by increasing the offset
@@ -105,7 +87,7 @@ def create_transparency_demo(
 
         # Use the alpha channel from the original image as a mask when pasting
         # This ensures transparency is preserved
-        canvas.paste(white_composite, (left_x, top_y), img_copy)
+        canvas.paste(white_composite, (left_x, top_y), img)
         # We don't paste the right side image anymore
 
         return canvas
@@ -3,7 +3,7 @@
 import os
 from typing import Dict, List, Any, Tuple, Optional
 from pathlib import Path
-from PIL import Image, ImageDraw
+from PIL import Image
 
 from src.core.base_processor import BaseProcessor
 from src.core.processor_factory import register_processor
@@ -11,6 +11,9 @@ from src.utils.ai_utils import generate_content_with_ai
 from src.utils.file_operations import find_files_by_extension
 from src.utils.common import ensure_dir_exists
 from src.utils.common import apply_watermark
+from src.utils.image_encoding import save_image
+from src.utils.image_utils import fill_region
+from src.utils.image_writer import write_image
 
 
 @register_processor("journal_papers")
@@ -141,8 +144,13 @@ class JournalPapersProcessor(BaseProcessor):
                                 )
 
                             # Save the processed image
-                            img_final.save(
-                                output_path, format="JPEG", quality=95, dpi=DPI
+                            save_image(
+                                img_final,
+                                output_path,
+                                "JPEG",
+                                purpose="delivery",
+                                quality=95,
+                                dpi=DPI,
                             )
 
                             # Remove original if different from output
@@ -202,7 +210,8 @@ class JournalPapersProcessor(BaseProcessor):
             results = {}
 
             # Create main mockup (pattern-style with journal papers branding)
-            main_result = self._create_main_mockup()
+            with self.measure("main_mockup"):
+                main_result = self._create_main_mockup()
             results["main_mockup"] = main_result
             
             # Check if main mockup creation failed
@@ -211,7 +220,8 @@ class JournalPapersProcessor(BaseProcessor):
                 return {"success": False, "error": f"Main mockup failed: {main_result.get('error', 'Unknown error')}"}
 
             # Create 2x2 grid mockups (multiple grids if >4 images)
-            grid_result = self._create_grid_mockups()
+            with self.measure("grid_mockups"):
+                grid_result = self._create_grid_mockups()
             results["grid_mockups"] = grid_result
             
             # Return success with results
@@ -366,7 +376,7 @@ class JournalPapersProcessor(BaseProcessor):
         # Save the grid
         output_filename = f"journal_papers_grid_{grid_num}.jpg"
         output_path = os.path.join(mockup_dir, output_filename)
-        grid_canvas.save(output_path, format="JPEG", quality=95)
+        write_image(grid_canvas, output_path, "JPEG", quality=95)
 
         self.logger.info(f"Created 2x2 grid {grid_num}: {output_filename}")
         return output_path
@@ -379,30 +389,23 @@ class JournalPapersProcessor(BaseProcessor):
         paper_height: int,
     ):
         """Add subtle drop shadows to journal papers in the grid."""
-        # Create a semi-transparent overlay for shadows
-        shadow_overlay = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
-        shadow_draw = ImageDraw.Draw(shadow_overlay)
-
         shadow_offset = 8
         shadow_color = (0, 0, 0, 40)  # Semi-transparent black
 
+        # Blend each shadow rectangle in place instead of compositing a
+        # full-canvas overlay
         for x, y in positions:
-            # Draw shadow rectangle slightly offset
-            shadow_draw.rectangle(
-                [
+            fill_region(
+                canvas,
+                (
                     x + shadow_offset,
                     y + shadow_offset,
-                    x + paper_width + shadow_offset,
-                    y + paper_height + shadow_offset,
-                ],
-                fill=shadow_color,
+                    x + paper_width + shadow_offset + 1,
+                    y + paper_height + shadow_offset + 1,
+                ),
+                shadow_color,
             )
 
-        # Composite the shadow with the main canvas
-        canvas_rgba = canvas.convert("RGBA")
-        canvas_with_shadow = Image.alpha_composite(canvas_rgba, shadow_overlay)
-        canvas.paste(canvas_with_shadow.convert("RGB"))
-
     def _get_etsy_categories(self) -> tuple[str, Optional[str]]:
         """Override to use 'Journal Pages' as subcategory."""
         return ("Digital", "Journal Pages")
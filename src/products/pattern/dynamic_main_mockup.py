@@ -3,14 +3,12 @@ Module for creating a dynamic main pattern mockup with colors extracted from the
 """
 
 import os
-import glob
 from typing import Optional, Tuple, List, Dict
 import colorsys
 from PIL import Image, ImageDraw
 
 from utils.common import (
     setup_logging,
-    get_asset_path,
     ensure_dir_exists,
     get_font,
 )
@@ -20,18 +18,23 @@ from utils.color_utils import (
     adjust_color_for_contrast,
 )
 from utils.text_utils import draw_text, calculate_text_dimensions, create_text_backdrop
+from src.utils.asset_cache import load_asset
+from src.utils.folder_inventory import list_files
+from src.utils.image_writer import write_image
 
-# Import unified configuration
-from core.config_manager import get_config_manager
 
-# Get configuration manager
-config_manager = get_config_manager()
-pattern_config = config_manager.get_config("pattern")
+def _get_pattern_config():
+    """Look up the pattern configuration on first use instead of at import."""
+    from core.config_manager import get_config_manager
+
+    return get_config_manager().get_config("pattern")
+
 
 # Legacy compatibility wrapper
 class PatternConfig:
     @property
     def FONT_CONFIG(self):
+        pattern_config = _get_pattern_config()
         if pattern_config:
             font_settings = pattern_config.font_settings
             layout_settings = pattern_config.layout_settings
@@ -475,7 +478,7 @@ def create_main_mockup(
     grid_height = 2250
 
     # Find all images in the input folder
-    images = sorted(glob.glob(os.path.join(input_folder, "*.[jp][pn][g]")))
+    images = list_files(input_folder, [".jpg", ".png"])
     if not images:
         logger.warning(f"No images found in {input_folder} for main mockup.")
         return None
@@ -497,23 +500,24 @@ def create_main_mockup(
     total_spacing_x = grid_width - (avg_cell_width * GRID_COLS)
     spacing_between_x = total_spacing_x / (GRID_COLS + 1) if GRID_COLS > 0 else 0
 
-    # Load shadow
-    shadow_path = get_asset_path("shadow.png")
+    # Load shadow (cached per process, with one variant per cell height)
     shadow = None
     shadow_new_width = 0
+    shadow_img = load_asset("shadow.png")
 
-    if shadow_path:
+    if shadow_img is not None:
         try:
-            shadow_img = Image.open(shadow_path).convert("RGBA")
             scale_factor = (
                 cell_height / shadow_img.height if shadow_img.height > 0 else 1
             )
             shadow_new_width = int(shadow_img.width * scale_factor)
 
             if shadow_new_width > 0 and cell_height > 0:
-                shadow = resize_image(shadow_img, shadow_new_width, cell_height)
+                shadow = load_asset(
+                    "shadow.png", size=(shadow_new_width, cell_height), fit=True
+                )
         except Exception as e:
-            logger.warning(f"Error loading or resizing shadow: {e}. Skipping shadow.")
+            logger.warning(f"Error resizing shadow: {e}. Skipping shadow.")
 
     # First pass: Draw images
     image_positions_for_shadow = []
@@ -608,7 +612,7 @@ def create_main_mockup(
     try:
         grid_filename = "main.png"
         save_path = os.path.join(output_folder, grid_filename)
-        final_image.save(save_path, "PNG")
+        write_image(final_image, save_path, "PNG")
         logger.info(f"Dynamic main mockup saved: {save_path}")
         return save_path
     except Exception as e:
@@ -2,15 +2,17 @@
 Module for creating layered mockups.
 """
 import os
-import glob
 from typing import Optional, Tuple, List
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageOps
+from PIL import Image, ImageDraw, ImageFont, ImageOps
 
 from src.utils.common import (
     setup_logging, 
     get_resampling_filter, 
     ensure_dir_exists
 )
+from src.utils.folder_inventory import list_files
+from src.utils.image_utils import rect_shadow_mask, shadow_mask
+from src.utils.image_writer import write_image
 
 # Set up logging
 logger = setup_logging(__name__)
@@ -29,7 +31,7 @@ def create_large_grid(input_folder: str) -> List[str]:
     output_folder = os.path.join(input_folder, "mocks")
     ensure_dir_exists(output_folder)
     
-    images = sorted(glob.glob(os.path.join(input_folder, "*.jpg")))
+    images = list_files(input_folder, [".jpg"])
     
     num_images = len(images)
     if num_images < 3:
@@ -102,33 +104,35 @@ def create_large_grid(input_folder: str) -> List[str]:
                     - (center_img_rotated.height - center_target_size[1]) // 2
                 )
                 
-                # Create and apply shadows
-                center_shadow = Image.new("RGBA", center_img_rotated.size, (0, 0, 0, 0))
+                # Create and apply shadows: the fitted image is opaque, so
+                # its shadow only depends on the size and rotation
                 try:
-                    center_alpha = center_img_rotated.split()[3]
-                    center_shadow.paste((0, 0, 0, shadow_opacity), mask=center_alpha)
-                    center_shadow_blurred = center_shadow.filter(
-                        ImageFilter.GaussianBlur(shadow_blur)
+                    center_shadow = rect_shadow_mask(
+                        center_target_size, center_rotation, shadow_blur, shadow_opacity
                     )
+                    if center_shadow.size != center_img_rotated.size:
+                        center_shadow = shadow_mask(
+                            center_img_rotated.getchannel("A"), shadow_blur, shadow_opacity
+                        )
                     
                     # Shadow 1 (top-right offset)
                     canvas.paste(
-                        center_shadow_blurred,
+                        (0, 0, 0),
                         (
                             center_offset_x + shadow_offset,
                             center_offset_y + shadow_offset,
                         ),
-                        center_shadow_blurred,
+                        center_shadow,
                     )
                     
                     # Shadow 2 (top-left offset)
                     canvas.paste(
-                        center_shadow_blurred,
+                        (0, 0, 0),
                         (
                             center_offset_x - shadow_offset,
                             center_offset_y - shadow_offset,
                         ),
-                        center_shadow_blurred,
+                        center_shadow,
                     )
                     
                 except Exception as e:
@@ -171,33 +175,35 @@ def create_large_grid(input_folder: str) -> List[str]:
                     - (bottom_left_img_rotated.height - bottom_left_target_size[1]) // 2
                 )
                 
-                # Create and apply shadows
-                bottom_left_shadow = Image.new("RGBA", bottom_left_img_rotated.size, (0, 0, 0, 0))
+                # Create and apply shadows: the fitted image is opaque, so
+                # its shadow only depends on the size and rotation
                 try:
-                    bottom_left_alpha = bottom_left_img_rotated.split()[3]
-                    bottom_left_shadow.paste((0, 0, 0, shadow_opacity), mask=bottom_left_alpha)
-                    bottom_left_shadow_blurred = bottom_left_shadow.filter(
-                        ImageFilter.GaussianBlur(shadow_blur)
+                    bottom_left_shadow = rect_shadow_mask(
+                        bottom_left_target_size, bottom_left_rotation, shadow_blur, shadow_opacity
                     )
+                    if bottom_left_shadow.size != bottom_left_img_rotated.size:
+                        bottom_left_shadow = shadow_mask(
+                            bottom_left_img_rotated.getchannel("A"), shadow_blur, shadow_opacity
+                        )
                     
                     # Shadow 1 (bottom-right offset)
                     canvas.paste(
-                        bottom_left_shadow_blurred,
+                        (0, 0, 0),
                         (
                             bottom_left_offset_x + shadow_offset,
                             bottom_left_offset_y + shadow_offset,
                         ),
-                        bottom_left_shadow_blurred,
+                        bottom_left_shadow,
                     )
                     
                     # Shadow 2 (top-left offset)
                     canvas.paste(
-                        bottom_left_shadow_blurred,
+                        (0, 0, 0),
                         (
                             bottom_left_offset_x - shadow_offset,
                             bottom_left_offset_y - shadow_offset,
                         ),
-                        bottom_left_shadow_blurred,
+                        bottom_left_shadow,
                     )
                     
                 except Exception as e:
@@ -217,7 +223,7 @@ def create_large_grid(input_folder: str) -> List[str]:
         try:
             output_filename = f"layered_mockup_{set_index + 1}.jpg"
             save_path = os.path.join(output_folder, output_filename)
-            canvas.save(save_path, "JPEG", quality=95, optimize=True)
+            write_image(canvas, save_path, "JPEG", quality=95)
             logger.info(f"Layered mockup saved: {save_path}")
             output_files.append(save_path)
         except Exception as e:
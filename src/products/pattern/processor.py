@@ -24,7 +24,11 @@ class PatternProcessor(BaseProcessor):
         from src.utils.resize_utils import ImageResizer
         
         try:
-            resizer = ImageResizer(max_size=3600, dpi=(300, 300))
+            resizer = ImageResizer(
+                max_size=3600,
+                dpi=(300, 300),
+                workers=self.config.custom_settings.get("resize_workers"),
+            )
             result = resizer.resize_pattern_style(self.config.input_dir)
             
             self.logger.info(f"Resized {result.get('processed', 0)} pattern images")
@@ -40,20 +44,25 @@ class PatternProcessor(BaseProcessor):
             results = {}
             
             # Create main mockup
-            results["main_mockup"] = self._create_main_mockup()
+            with self.measure("main_mockup"):
+                results["main_mockup"] = self._create_main_mockup()
             
             # Create grid mockup
-            results["grid_mockup"] = self._create_grid_mockup()
+            with self.measure("grid_mockup"):
+                results["grid_mockup"] = self._create_grid_mockup()
             
             # Create layered mockup if enabled
             if self.config.custom_settings.get("create_layered", True):
-                results["layered_mockup"] = self._create_layered_mockup()
+                with self.measure("layered_mockup"):
+                    results["layered_mockup"] = self._create_layered_mockup()
             
             # Create seamless tiling mockup
-            results["seamless_tiling_mockup"] = self._create_seamless_tiling_mockup()
+            with self.measure("seamless_tiling_mockup"):
+                results["seamless_tiling_mockup"] = self._create_seamless_tiling_mockup()
             
             # Create Pinterest mockup
-            results["pinterest_mockup"] = self._create_pinterest_mockup()
+            with self.measure("pinterest_mockup"):
+                results["pinterest_mockup"] = self._create_pinterest_mockup()
             
             return results
             
@@ -1,17 +1,19 @@
 """Module for creating seamless pattern mockups."""
 
 import os
-import glob
 from typing import Optional
 from PIL import Image, ImageDraw
 
 from src.utils.common import (
     setup_logging,
     get_resampling_filter,
-    get_asset_path,
     ensure_dir_exists,
     get_font,
 )
+from src.utils.asset_cache import load_asset
+from src.utils.image_utils import tile_image
+from src.utils.folder_inventory import list_files
+from src.utils.image_writer import write_image
 
 # Set up logging
 logger = setup_logging(__name__)
@@ -32,7 +34,7 @@ def create_pattern(input_folder: str) -> Optional[str]:
     ensure_dir_exists(output_folder)
 
     # Find JPG images in the input folder
-    images = sorted(glob.glob(os.path.join(input_folder, "*.jpg")))
+    images = list_files(input_folder, [".jpg"])
     if not images:
         logger.warning("No JPG images found for seamless pattern.")
         return None
@@ -62,11 +64,8 @@ def create_pattern(input_folder: str) -> Optional[str]:
         )
 
         # Create 2x2 grid
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                output_image.paste(
-                    source_image, (col * cell_size, row * cell_size), source_image
-                )
+        tiled = tile_image(source_image, (IMAGE_SIZE, IMAGE_SIZE))
+        output_image.paste(tiled, (0, 0), tiled)
 
         # Add text overlay
         txt_layer = Image.new("RGBA", output_image.size, (255, 255, 255, 0))
@@ -123,11 +122,11 @@ def create_pattern(input_folder: str) -> Optional[str]:
         # Save the result
         filename = "seamless_1.jpg"
         save_path = os.path.join(output_folder, filename)
-        combined.convert("RGB").save(
+        write_image(
+            combined.convert("RGB"),
             save_path,
             "JPEG",
             quality=85,
-            optimize=True,
             subsampling="4:2:0",
         )
 
@@ -153,7 +152,7 @@ def create_seamless_mockup(input_folder: str) -> Optional[str]:
     output_folder = os.path.join(input_folder, "mocks")
     ensure_dir_exists(output_folder)
 
-    input_files = sorted(glob.glob(os.path.join(input_folder, "*.[jp][pn][g]")))
+    input_files = list_files(input_folder, [".jpg", ".png"])
     if not input_files:
         logger.warning("No image files found in input folder for seamless mockup.")
         return None
@@ -175,14 +174,10 @@ def create_seamless_mockup(input_folder: str) -> Optional[str]:
         cell_width, cell_height = scaled_img.size
 
         # Load or create canvas
-        canvas_path = get_asset_path("canvas2.png")
-        if canvas_path:
-            canvas = Image.open(canvas_path).convert("RGBA")
-            canvas_target_size = (2000, 2000)
-            canvas = canvas.resize(canvas_target_size, get_resampling_filter())
-        else:
+        canvas_target_size = (2000, 2000)
+        canvas = load_asset("canvas2.png", "RGBA", canvas_target_size)
+        if canvas is None:
             logger.warning("Canvas background 'canvas2.png' not found. Using white.")
-            canvas_target_size = (2000, 2000)
             canvas = Image.new("RGBA", canvas_target_size, (255, 255, 255, 255))
 
         _, canvas_height = canvas.size  # Only need canvas_height
@@ -202,7 +197,7 @@ def create_seamless_mockup(input_folder: str) -> Optional[str]:
 
         # Save the result
         output_image_path = os.path.join(output_folder, "output_mockup.png")
-        canvas.save(output_image_path, "PNG")
+        write_image(canvas, output_image_path, "PNG")
 
         logger.info(f"Original seamless comparison mockup saved: {output_image_path}")
         return output_image_path
@@ -229,7 +224,7 @@ def create_seamless_tiling_mockup(input_folder: str) -> Optional[str]:
     ensure_dir_exists(output_folder)
     
     # Find images in the input folder
-    images = sorted(glob.glob(os.path.join(input_folder, "*.jpg")))
+    images = list_files(input_folder, [".jpg"])
     if not images:
         logger.warning("No JPG images found for seamless tiling mockup.")
         return None
@@ -251,11 +246,8 @@ def create_seamless_tiling_mockup(input_folder: str) -> Optional[str]:
         source_image = source_image.resize((cell_size, cell_size), get_resampling_filter())
         
         # Create 2x2 grid
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                output_image.paste(
-                    source_image, (col * cell_size, row * cell_size), source_image
-                )
+        tiled = tile_image(source_image, (IMAGE_SIZE, IMAGE_SIZE))
+        output_image.paste(tiled, (0, 0), tiled)
         
         # Add text overlay
         txt_layer = Image.new("RGBA", output_image.size, (255, 255, 255, 0))
@@ -312,12 +304,7 @@ def create_seamless_tiling_mockup(input_folder: str) -> Optional[str]:
         # Save the result
         filename = "seamless_mockup.jpg"
         save_path = os.path.join(output_folder, filename)
-        combined.convert("RGB").save(
-            save_path,
-            "JPEG",
-            quality=90,
-            optimize=True,
-        )
+        write_image(combined.convert("RGB"), save_path, "JPEG", quality=90)
         
         logger.info(f"Seamless tiling mockup saved: {save_path}")
         return save_path
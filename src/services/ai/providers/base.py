@@ -3,12 +3,17 @@ Base class for AI providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Callable, Dict, Any
+
+from src.utils.metrics import AI_ERRORS, AI_REQUEST_SECONDS
 
 
 class AIProvider(ABC):
     """Base class for AI providers."""
 
+    # Label used for this provider in /metrics
+    provider_name = "unknown"
+
     def __init__(self, api_key: str, model_name: str):
         """
         Initialize the AI provider.
@@ -20,6 +25,24 @@ class AIProvider(ABC):
         self.api_key = api_key
         self.model_name = model_name
 
+    def _call_api(self, operation: str, call: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call the provider API, recording latency and errors for /metrics.
+
+        Args:
+            operation: Name of the provider method making the call
+            call: SDK function to call with the remaining arguments
+
+        Returns:
+            Whatever the SDK call returns (exceptions are re-raised)
+        """
+        try:
+            with AI_REQUEST_SECONDS.time(provider=self.provider_name, operation=operation):
+                return call(*args, **kwargs)
+        except Exception:
+            AI_ERRORS.inc(provider=self.provider_name, operation=operation)
+            raise
+
     @abstractmethod
     def generate_content_from_image(
         self, image_path: str, instructions: str
@@ -34,6 +34,8 @@ except ImportError:
 class GeminiProvider(AIProvider):
     """Gemini AI provider implementation."""
 
+    provider_name = "gemini"
+
     def __init__(self, api_key: str, model_name: str = "gemini-3-flash-preview"):
         """
         Initialize the Gemini provider.
@@ -142,7 +144,9 @@ class GeminiProvider(AIProvider):
             ]
 
             # Generate content
-            response = self.gemini_model.generate_content(parts)
+            response = self._call_api(
+                "generate_content_from_image", self.gemini_model.generate_content, parts
+            )
 
             # Check if the response is valid
             if not hasattr(response, "text"):
@@ -314,7 +318,9 @@ class GeminiProvider(AIProvider):
             ]
 
             # Generate content
-            response = self.gemini_model.generate_content(parts)
+            response = self._call_api(
+                "analyze_image_with_prompt", self.gemini_model.generate_content, parts
+            )
 
             # Check if the response is valid
             if not hasattr(response, "text"):
@@ -353,7 +359,9 @@ class GeminiProvider(AIProvider):
 
         try:
             # Generate content
-            response = self.gemini_model.generate_content(prompt)
+            response = self._call_api(
+                "generate_text", self.gemini_model.generate_content, prompt
+            )
 
             # Check if the response is valid
             if not hasattr(response, "text"):
@@ -31,6 +31,8 @@ except ImportError:
 class OpenAIProvider(AIProvider):
     """OpenAI AI provider implementation."""
 
+    provider_name = "openai"
+
     def __init__(self, api_key: str, model_name: str):
         """
         Initialize the OpenAI provider.
@@ -98,7 +100,9 @@ class OpenAIProvider(AIProvider):
 
             # Create the content for OpenAI API
             # Using the Chat Completions API for image analysis
-            response = self.client.chat.completions.create(
+            response = self._call_api(
+                "generate_content_from_image",
+                self.client.chat.completions.create,
                 model=self.model_name,
                 messages=[
                     {
@@ -274,7 +278,9 @@ class OpenAIProvider(AIProvider):
             base64_image = base64.b64encode(img_bytes).decode("utf-8")
 
             # Create the content for OpenAI API
-            response = self.client.chat.completions.create(
+            response = self._call_api(
+                "analyze_image_with_prompt",
+                self.client.chat.completions.create,
                 model=self.model_name,
                 messages=[
                     {
@@ -322,7 +328,9 @@ class OpenAIProvider(AIProvider):
 
         try:
             # Generate content
-            response = self.client.chat.completions.create(
+            response = self._call_api(
+                "generate_text",
+                self.client.chat.completions.create,
                 model=self.model_name,
                 messages=[
                     {
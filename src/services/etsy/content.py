@@ -40,10 +40,10 @@ class ContentGenerator:
         
         # Get the AI provider
         if provider_type:
-            self.provider = get_ai_provider(provider_type, api_key)
+            self.provider = get_ai_provider(provider_type, api_key, model_name)
             logger.info(f"Attempting to initialize {provider_type} provider with API key: {'***' + api_key[-4:] if api_key else 'None'}")
         else:
-            self.provider = get_ai_provider("gemini", api_key)
+            self.provider = get_ai_provider("gemini", api_key, model_name)
             logger.info(f"Defaulting to Gemini provider with API key: {'***' + api_key[-4:] if api_key else 'None'}")
 
         if self.provider:
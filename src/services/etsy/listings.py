@@ -3,10 +3,12 @@ Etsy listings module for creating and managing Etsy listings.
 """
 
 import os
+import re
 import requests
 from typing import Dict, List, Optional, Any
 
 from src.utils.common import setup_logging
+from src.utils.metrics import ETSY_BYTES_UPLOADED, ETSY_REQUEST_SECONDS, ETSY_RESPONSES
 from src.services.etsy.auth import EtsyAuth
 
 # Set up logging
@@ -38,6 +40,42 @@ class EtsyListings:
         if not self.shop_id:
             logger.error("No shop ID available - cannot proceed with Etsy operations")
 
+    def _request(
+        self,
+        method: str,
+        url: str,
+        upload_kind: Optional[str] = None,
+        upload_path: Optional[str] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request to the Etsy API, recording latency, status codes and
+        uploaded bytes for /metrics.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            upload_kind: "image", "video" or "file" for uploads
+            upload_path: Path of the uploaded file, counted on success
+            **kwargs: Passed through to ``requests.request``
+
+        Returns:
+            The response (exceptions are re-raised)
+        """
+        # Collapse ids so the endpoint label stays low-cardinality
+        endpoint = re.sub(r"/\d+(?=/|$)", "/{id}", url.replace(self.base_url, "", 1))
+        try:
+            with ETSY_REQUEST_SECONDS.time(method=method, endpoint=endpoint):
+                response = requests.request(method, url, **kwargs)
+        except Exception:
+            ETSY_RESPONSES.inc(endpoint=endpoint, status_code="error")
+            raise
+
+        ETSY_RESPONSES.inc(endpoint=endpoint, status_code=str(response.status_code))
+        if upload_kind and upload_path and response.ok:
+            ETSY_BYTES_UPLOADED.inc(os.path.getsize(upload_path), kind=upload_kind)
+        return response
+
     def _get_shop_id(self) -> Optional[str]:
         """
         Get the shop ID for the authenticated user.
@@ -52,7 +90,7 @@ class EtsyListings:
         try:
             url = f"{self.base_url}/application/users/me/shops"
             headers = self.auth.get_headers()
-            response = requests.get(url, headers=headers)
+            response = self._request("GET", url, headers=headers)
 
             if response.status_code == 200:
                 shops = response.json().get("results", [])
@@ -87,7 +125,7 @@ class EtsyListings:
         try:
             url = f"{self.base_url}/application/shops/{self.shop_id}/shipping-profiles"
             headers = self.auth.get_headers()
-            response = requests.get(url, headers=headers)
+            response = self._request("GET", url, headers=headers)
 
             if response.status_code == 200:
                 return response.json().get("results", [])
@@ -186,7 +224,7 @@ class EtsyListings:
                 data["type"] = "download"
 
             # Make the request
-            response = requests.post(url, headers=headers, json=data)
+            response = self._request("POST", url, headers=headers, json=data)
 
             # Check if the request was successful
             if response.status_code == 201:
@@ -217,7 +255,7 @@ class EtsyListings:
         try:
             url = f"{self.base_url}/application/listings/{listing_id}"
             headers = self.auth.get_headers()
-            response = requests.get(url, headers=headers)
+            response = self._request("GET", url, headers=headers)
 
             if response.status_code == 200:
                 return response.json()
@@ -244,7 +282,7 @@ class EtsyListings:
         try:
             url = f"{self.base_url}/application/shops/{self.shop_id}/sections"
             headers = self.auth.get_headers()
-            response = requests.get(url, headers=headers)
+            response = self._request("GET", url, headers=headers)
 
             if response.status_code == 200:
                 return response.json().get("results", [])
@@ -289,7 +327,15 @@ class EtsyListings:
                 data = {
                     "rank": str(rank)
                 }  # Convert to string to ensure proper form encoding
-                response = requests.post(url, headers=headers, files=files, data=data)
+                response = self._request(
+                    "POST",
+                    url,
+                    upload_kind="image",
+                    upload_path=image_path,
+                    headers=headers,
+                    files=files,
+                    data=data,
+                )
 
             # Check if the request was successful
             if response.status_code == 201:
@@ -333,7 +379,15 @@ class EtsyListings:
                 files = {"file": (os.path.basename(file_path), f, "application/zip")}
                 data = {"name": os.path.basename(file_path), "rank": rank}
                 
-                response = requests.post(url, headers=upload_headers, files=files, data=data)
+                response = self._request(
+                    "POST",
+                    url,
+                    upload_kind="file",
+                    upload_path=file_path,
+                    headers=upload_headers,
+                    files=files,
+                    data=data,
+                )
 
                 if response.status_code == 201:
                     file_data = response.json()
@@ -392,7 +446,15 @@ class EtsyListings:
             with open(video_path, "rb") as f:
                 files = {"video": (os.path.basename(video_path), f, "video/mp4")}
                 data = {"name": os.path.basename(video_path)}
-                response = requests.post(url, headers=headers, files=files, data=data)
+                response = self._request(
+                    "POST",
+                    url,
+                    upload_kind="video",
+                    upload_path=video_path,
+                    headers=headers,
+                    files=files,
+                    data=data,
+                )
 
             # Check if the request was successful
             if response.status_code == 201:
@@ -422,7 +484,7 @@ class EtsyListings:
         try:
             url = f"{self.base_url}/application/seller-taxonomy/nodes/{taxonomy_id}/properties"
             headers = self.auth.get_headers()
-            response = requests.get(url, headers=headers)
+            response = self._request("GET", url, headers=headers)
 
             if response.status_code == 200:
                 return response.json().get("results", [])
@@ -460,7 +522,7 @@ class EtsyListings:
             data = {"products": products}
 
             # Make the request
-            response = requests.put(url, headers=headers, json=data)
+            response = self._request("PUT", url, headers=headers, json=data)
 
             # Check if the request was successful
             if response.status_code == 200:
@@ -492,7 +554,7 @@ class EtsyListings:
         try:
             url = f"{self.base_url}/application/shops/{self.shop_id}/listings/{listing_id}/files"
             headers = self.auth.get_headers()
-            response = requests.get(url, headers=headers)
+            response = self._request("GET", url, headers=headers)
 
             if response.status_code == 200:
                 files_data = response.json().get("results", [])
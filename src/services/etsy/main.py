@@ -3,7 +3,7 @@ Main module for Etsy integration.
 """
 
 import os
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 from src.utils.common import setup_logging
 from src.services.etsy.auth import EtsyAuth
@@ -11,6 +11,7 @@ from src.services.etsy.listings import EtsyListings
 from src.services.etsy.templates import ListingTemplate
 from src.services.etsy.content import ContentGenerator
 from src.services.etsy.constants import DEFAULT_ETSY_INSTRUCTIONS
+from src.utils.image_encoding import save_image
 
 # Set up logging
 logger = setup_logging(__name__)
@@ -496,6 +497,8 @@ class EtsyIntegration:
         skip_mockups: bool = False,
         skip_zips: bool = False,
         skip_resize: bool = False,
+        should_stop: Optional[Callable[[], bool]] = None,
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
     ) -> List[Dict]:
         """
         Prepare Etsy listings for all subfolders in the input directory without uploading.
@@ -506,6 +509,9 @@ class EtsyIntegration:
             skip_mockups: Whether to skip creating mockups (use existing ones)
             skip_zips: Whether to skip creating zip files (use existing ones)
             skip_resize: Whether to skip resizing and renaming images (use existing ones)
+            should_stop: Optional callable checked before each folder; when it
+                returns True the listings prepared so far are returned
+            on_progress: Optional callable receiving (folders done, total, next folder)
 
         Returns:
             List of prepared listings data
@@ -531,7 +537,15 @@ class EtsyIntegration:
         prepared_listings = []
         failed_folders = []
 
-        for subfolder in subfolders:
+        for index, subfolder in enumerate(subfolders):
+            if should_stop is not None and should_stop():
+                logger.warning(
+                    f"Stopping bulk preparation after {index}/{len(subfolders)} folders"
+                )
+                break
+            if on_progress is not None:
+                on_progress(index, len(subfolders), subfolder)
+
             folder_path = os.path.join(input_dir, subfolder)
             logger.info(f"Processing folder: {folder_path}")
 
@@ -871,8 +885,12 @@ class EtsyIntegration:
                                     f"  Saving clipart image (trimming handled by processor)"
                                 )
 
-                                img_to_save.save(
-                                    new_file_path, format="PNG", dpi=(300, 300)
+                                save_image(
+                                    img_to_save,
+                                    new_file_path,
+                                    "PNG",
+                                    purpose="delivery",
+                                    dpi=(300, 300),
                                 )
                             else:
                                 # For patterns and journal_papers, save as JPEG
@@ -892,12 +910,13 @@ class EtsyIntegration:
                                 elif img_to_save.mode != "RGB":
                                     img_to_save = img_to_save.convert("RGB")
 
-                                img_to_save.save(
+                                save_image(
+                                    img_to_save,
                                     new_file_path,
-                                    format="JPEG",
+                                    "JPEG",
+                                    purpose="delivery",
                                     dpi=(300, 300),
                                     quality=95,
-                                    optimize=True,
                                 )
                             logger.info(f"  Saved as: {new_filename}")
 
@@ -1242,12 +1261,6 @@ class EtsyIntegration:
             Generated content with title, description, and tags
         """
         try:
-            # Import processors to register them
-            from src.products.pattern.processor import PatternProcessor
-            from src.products.clipart.processor import ClipartProcessor
-            from src.products.border_clipart.processor import BorderClipartProcessor
-            from src.products.journal_papers.processor import JournalPapersProcessor
-
             from src.core.processor_factory import ProcessorFactory
             from src.core.base_processor import ProcessingConfig
 
@@ -7,6 +7,8 @@ from typing import List, Tuple, Optional, Dict, Any
 from PIL import Image
 
 from src.utils.common import setup_logging, ensure_dir_exists
+from src.utils.folder_inventory import IMAGE_EXTENSIONS, list_files
+from src.utils.image_writer import write_image
 
 logger = setup_logging(__name__)
 
@@ -61,13 +63,7 @@ class MockupProcessor:
             })
             
             # Find images in input folder
-            image_files = []
-            for ext in ['.png', '.jpg', '.jpeg']:
-                image_files.extend([
-                    os.path.join(input_folder, f)
-                    for f in os.listdir(input_folder)
-                    if f.lower().endswith(ext) and os.path.isfile(os.path.join(input_folder, f))
-                ])
+            image_files = list_files(input_folder, IMAGE_EXTENSIONS)
             
             if not image_files:
                 logger.warning("No images found for Pinterest mockup")
@@ -101,13 +97,7 @@ class MockupProcessor:
             ensure_dir_exists(mockup_dir)
             
             # Find images
-            image_files = []
-            for ext in ['.png', '.jpg', '.jpeg']:
-                image_files.extend([
-                    os.path.join(input_folder, f)
-                    for f in os.listdir(input_folder)
-                    if f.lower().endswith(ext) and os.path.isfile(os.path.join(input_folder, f))
-                ])
+            image_files = list_files(input_folder, IMAGE_EXTENSIONS)
             
             if not image_files:
                 logger.warning("No images found for clipart main mockup")
@@ -139,7 +129,7 @@ class MockupProcessor:
             
             # Save the mockup
             output_path = os.path.join(mockup_dir, "main.png")
-            mockup_image.save(output_path)
+            write_image(mockup_image, output_path)
             
             logger.info(f"Clipart main mockup created: {output_path}")
             return output_path
@@ -169,13 +159,7 @@ class MockupProcessor:
             ensure_dir_exists(mockup_dir)
             
             # Find images
-            image_files = []
-            for ext in ['.png', '.jpg', '.jpeg']:
-                image_files.extend([
-                    os.path.join(input_folder, f)
-                    for f in os.listdir(input_folder)
-                    if f.lower().endswith(ext) and os.path.isfile(os.path.join(input_folder, f))
-                ])
+            image_files = list_files(input_folder, IMAGE_EXTENSIONS)
             
             if not image_files:
                 logger.warning("No images found for generic main mockup")
@@ -194,7 +178,7 @@ class MockupProcessor:
                 grid_size=(2000, 2000),
                 background=background
             )
-            grid_image.save(output_path, "PNG")
+            write_image(grid_image, output_path, "PNG")
             return output_path
             
         except Exception as e:
@@ -7,11 +7,13 @@ from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
 
-from src.utils.common import setup_logging, get_font
+from src.utils.common import setup_logging, get_font, load_image_for_size
 
 logger = setup_logging(__name__)
+from src.utils.asset_cache import load_asset
 from src.utils.color_utils import extract_colors_from_images
-from src.utils.image_utils import resize_image
+from src.utils.image_utils import composite_region, fill_region, resize_image, tile_image
+from src.utils.image_writer import write_image
 
 
 class PinterestMockupGenerator:
@@ -44,43 +46,16 @@ class PinterestMockupGenerator:
         self._load_logo()
 
     def _load_background_assets(self):
-        """Load and prepare background assets"""
-        try:
-            # Load main background
-            canvas_path = self.assets_dir / "canvas.png"
-            if canvas_path.exists():
-                self.canvas_bg = Image.open(canvas_path).convert("RGBA")
-            else:
-                self.canvas_bg = None
-
-            # Load overlay assets
-            overlay_path = self.assets_dir / "overlay.png"
-            if overlay_path.exists():
-                self.overlay = Image.open(overlay_path).convert("RGBA")
-            else:
-                self.overlay = None
-
-            logger.info("📱 Pinterest mockup assets loaded")
-
-        except Exception as e:
-            logger.warning(f"⚠️ Pinterest background assets not loaded: {e}")
-            self.canvas_bg = None
-            self.overlay = None
+        """Load background assets from the shared asset cache"""
+        self.canvas_bg = load_asset("canvas.png")
+        self.overlay = load_asset("overlay.png")
+        logger.info("📱 Pinterest mockup assets loaded")
 
     def _load_logo(self):
-        """Load and prepare logo for branding"""
-        try:
-            logo_path = self.assets_dir / "logo.png"
-            if logo_path.exists():
-                self.logo = Image.open(logo_path).convert("RGBA")
-                logger.info("📱 Digital Veil logo loaded")
-            else:
-                self.logo = None
-                logger.warning("⚠️ Logo not found at assets/logo.png")
-
-        except Exception as e:
-            logger.warning(f"⚠️ Logo loading failed: {e}")
-            self.logo = None
+        """Load logo for branding from the shared asset cache"""
+        self.logo = load_asset("logo.png")
+        if self.logo is None:
+            logger.warning("⚠️ Logo not found at assets/logo.png")
 
     def create_pinterest_mockup(
         self, product_images: List[str], product_data: Dict[str, Any], output_path: str
@@ -132,7 +107,7 @@ class PinterestMockupGenerator:
 
             # Save final mockup
             canvas = canvas.convert("RGB")  # Convert to RGB for saving as JPEG/PNG
-            canvas.save(output_path, "PNG", quality=95, optimize=True)
+            write_image(canvas, output_path, "PNG")
 
             logger.info(f"✅ Pinterest mockup created: {output_path}")
             return True
@@ -276,45 +251,37 @@ class PinterestMockupGenerator:
             if not pattern_image_path:
                 return self._create_solid_background(canvas, colors)
 
-            # Load pattern image
-            pattern_img = Image.open(pattern_image_path).convert("RGBA")
-
             # Create a tiled background with subtle opacity
             tile_size = 200  # Smaller tiles for background
 
-            # Calculate how many tiles we need
-            tiles_x = (self.PINTEREST_WIDTH // tile_size) + 2
-            tiles_y = (self.PINTEREST_HEIGHT // tile_size) + 2
+            # Load pattern image, decoded close to tile size
+            pattern_img = load_image_for_size(
+                pattern_image_path, (tile_size, tile_size), "RGBA"
+            )
+            if pattern_img is None:
+                return self._create_solid_background(canvas, colors)
 
             # Resize pattern to tile size
             pattern_tile = resize_image(pattern_img, tile_size, tile_size)
 
-            # Create lighter overlay for better pattern visibility
-            overlay = Image.new(
-                "RGBA",
+            # Make pattern tiles more visible (prepared once, not per tile)
+            pattern_tile.putalpha(140)
+
+            # Tile the pattern across the background, offset for seamless look
+            tiled = tile_image(
+                pattern_tile,
                 (self.PINTEREST_WIDTH, self.PINTEREST_HEIGHT),
-                (255, 255, 255, 120),
+                offset=(-(tile_size // 2), -(tile_size // 2)),
+                step=(tile_size, tile_size),
             )
-
-            # Tile the pattern across the background
-            for row in range(tiles_y):
-                for col in range(tiles_x):
-                    x = col * tile_size - tile_size // 2  # Offset for seamless look
-                    y = row * tile_size - tile_size // 2
-
-                    if x < self.PINTEREST_WIDTH and y < self.PINTEREST_HEIGHT:
-                        # Make pattern tiles more visible
-                        pattern_copy = pattern_tile.copy()
-                        alpha = Image.new(
-                            "L", pattern_copy.size, 140
-                        )  # Much more visible
-                        pattern_copy.putalpha(alpha)
-
-                        # Paste the tile
-                        canvas.paste(pattern_copy, (x, y), pattern_copy)
+            canvas.paste(tiled, (0, 0), tiled)
 
             # Add lighter overlay to maintain text readability
-            canvas = Image.alpha_composite(canvas.convert("RGBA"), overlay)
+            fill_region(
+                canvas,
+                (0, 0, self.PINTEREST_WIDTH, self.PINTEREST_HEIGHT),
+                (255, 255, 255, 120),
+            )
 
             return canvas
 
@@ -339,20 +306,16 @@ class PinterestMockupGenerator:
             # Add subtle texture overlay if available
             if self.canvas_bg:
                 try:
-                    texture = resize_image(
-                        self.canvas_bg, self.PINTEREST_WIDTH, self.PINTEREST_HEIGHT
+                    # Cached at exactly the canvas size
+                    texture = load_asset(
+                        "canvas.png", size=(self.PINTEREST_WIDTH, self.PINTEREST_HEIGHT)
                     )
-                    texture = texture.convert("RGBA")
-
-                    # Ensure texture is exactly the same size as canvas
-                    if texture.size != (self.PINTEREST_WIDTH, self.PINTEREST_HEIGHT):
-                        texture = texture.resize((self.PINTEREST_WIDTH, self.PINTEREST_HEIGHT))
 
                     # Very subtle texture
                     alpha = Image.new("L", texture.size, 20)
                     texture.putalpha(alpha)
 
-                    canvas = Image.alpha_composite(canvas.convert("RGBA"), texture)
+                    composite_region(canvas, texture)
                 except Exception as tex_e:
                     logger.warning(f"⚠️ Texture overlay error: {tex_e}. Skipping texture.")
                     # Continue with plain background if texture fails
@@ -535,18 +498,18 @@ class PinterestMockupGenerator:
                 )
 
                 # Add larger white background frame
-                frame = Image.new(
-                    "RGBA", (grid_size + 16, grid_size + 16), (255, 255, 255, 255)
+                fill_region(
+                    canvas,
+                    (x - 8, y - 8, x + grid_size + 8, y + grid_size + 8),
+                    (255, 255, 255, 255),
                 )
-                frame_x = x - 8
-                frame_y = y - 8
-                canvas.paste(frame, (frame_x, frame_y), frame)
 
                 # Add larger shadow
-                shadow = Image.new(
-                    "RGBA", (grid_size + 12, grid_size + 12), (0, 0, 0, 60)
+                fill_region(
+                    canvas,
+                    (x + 6, y + 6, x + grid_size + 18, y + grid_size + 18),
+                    (0, 0, 0, 60),
                 )
-                canvas.paste(shadow, (x + 6, y + 6), shadow)
 
                 # Paste variation
                 canvas.paste(var_pattern, (x, y), var_pattern)
@@ -604,20 +567,24 @@ class PinterestMockupGenerator:
                 y = start_y + (row * (grid_size + grid_padding))
 
                 # Load and resize pattern
-                pattern_img = Image.open(pattern_path).convert("RGBA")
+                pattern_img = load_image_for_size(
+                    pattern_path, (grid_size, grid_size), "RGBA"
+                )
                 pattern_resized = resize_image(pattern_img, grid_size, grid_size)
 
                 # Add larger white frame
-                frame = Image.new(
-                    "RGBA", (grid_size + 12, grid_size + 12), (255, 255, 255, 255)
+                fill_region(
+                    canvas,
+                    (x - 6, y - 6, x + grid_size + 6, y + grid_size + 6),
+                    (255, 255, 255, 255),
                 )
-                canvas.paste(frame, (x - 6, y - 6), frame)
 
                 # Add larger shadow
-                shadow = Image.new(
-                    "RGBA", (grid_size + 8, grid_size + 8), (0, 0, 0, 50)
+                fill_region(
+                    canvas,
+                    (x + 4, y + 4, x + grid_size + 12, y + grid_size + 12),
+                    (0, 0, 0, 50),
                 )
-                canvas.paste(shadow, (x + 4, y + 4), shadow)
 
                 # Paste pattern
                 canvas.paste(pattern_resized, (x, y), pattern_resized)
@@ -647,12 +614,8 @@ class PinterestMockupGenerator:
             tiled = Image.new("RGBA", (size, size), (255, 255, 255, 0))
 
             # Tile the scaled pattern
-            for y in range(0, size, scaled_pattern.height):
-                for x in range(0, size, scaled_pattern.width):
-                    tiled.paste(scaled_pattern, (x, y), scaled_pattern)
-
-            # Crop to exact size
-            tiled = tiled.crop((0, 0, size, size))
+            pattern_layer = tile_image(scaled_pattern, (size, size))
+            tiled.paste(pattern_layer, (0, 0), pattern_layer)
 
             return tiled
 
@@ -722,7 +685,9 @@ class PinterestMockupGenerator:
                     y = start_y + (row * (item_size + grid_spacing))
 
                     # Load and resize clipart
-                    clipart_img = Image.open(img_path).convert("RGBA")
+                    clipart_img = load_image_for_size(
+                        img_path, (item_size, item_size), "RGBA"
+                    )
                     clipart_resized = resize_image(clipart_img, item_size, item_size)
 
                     # No background - just paste the clipart directly for clean look
@@ -819,11 +784,15 @@ class PinterestMockupGenerator:
             if not main_image_path:
                 return canvas
 
-            # Load and center main image
-            main_img = Image.open(main_image_path).convert("RGBA")
-
             # Resize to fit hero section
             max_size = min(600, self.HERO_HEIGHT - 100)
+
+            # Load and center main image
+            main_img = load_image_for_size(
+                main_image_path, (max_size, max_size), "RGBA"
+            )
+            if main_img is None:
+                return canvas
             main_resized = resize_image(main_img, max_size, max_size)
 
             # Center in hero section
@@ -832,8 +801,16 @@ class PinterestMockupGenerator:
 
             # Add shadow
             shadow_offset = 5
-            shadow = Image.new("RGBA", main_resized.size, (0, 0, 0, 80))
-            canvas.paste(shadow, (x + shadow_offset, y + shadow_offset), shadow)
+            fill_region(
+                canvas,
+                (
+                    x + shadow_offset,
+                    y + shadow_offset,
+                    x + shadow_offset + main_resized.width,
+                    y + shadow_offset + main_resized.height,
+                ),
+                (0, 0, 0, 80),
+            )
 
             # Paste main image
             canvas.paste(main_resized, (x, y), main_resized)
@@ -951,7 +928,7 @@ class PinterestMockupGenerator:
 
             if self.logo:
                 # Resize logo to fit footer
-                logo_resized = resize_image(self.logo, logo_size, logo_size)
+                logo_resized = load_asset("logo.png", size=(logo_size, logo_size), fit=True)
 
                 # Calculate positions for logo + text layout - use GreatVibes-Regular LARGER
                 try:
@@ -7,6 +7,7 @@ from typing import List, Tuple, Dict, Optional, Any
 import logging
 
 from src.utils.common import setup_logging, safe_load_image, ensure_dir_exists
+from src.utils.image_buffer import ImageBuffer
 
 # Set up logging
 logger = setup_logging(__name__)
@@ -81,7 +82,7 @@ def create_video_mockup(
             pil_img = pil_img.resize(target_size, resample=1)  # LANCZOS
 
             # Convert to OpenCV format
-            cv_img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+            cv_img = ImageBuffer.from_pil(pil_img).to_cv2()
             cv_images.append(cv_img)
 
         except Exception as e:
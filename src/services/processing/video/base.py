@@ -6,6 +6,7 @@ import os
 from typing import List, Optional
 
 from src.utils.common import setup_logging, ensure_dir_exists
+from src.utils.folder_inventory import IMAGE_EXTENSIONS, list_files
 from src.utils.video_utils import VideoCreator
 
 logger = setup_logging(__name__)
@@ -52,17 +53,17 @@ class VideoProcessor:
             return None
         
         # Find grid mockups
-        grid_files = []
-        for filename in os.listdir(mocks_folder):
-            if "grid" in filename.lower() and filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-                grid_files.append(os.path.join(mocks_folder, filename))
+        grid_files = [
+            path for path in list_files(mocks_folder, IMAGE_EXTENSIONS)
+            if "grid" in os.path.basename(path).lower()
+        ]
         
         if not grid_files:
             logger.warning("No grid mockups found for clipart showcase")
             return None
         
         output_path = os.path.join(videos_folder, "clipart_showcase.mp4")
-        success = self.video_creator.create_slideshow_video(sorted(grid_files), output_path)
+        success = self.video_creator.create_slideshow_video(grid_files, output_path)
         return output_path if success else None
     
     def _create_border_clipart_showcase(self, input_folder: str, videos_folder: str) -> Optional[str]:
@@ -75,11 +76,10 @@ class VideoProcessor:
         
         # Find grid mockups (exclude main mockup)
         grid_files = []
-        for filename in os.listdir(mocks_folder):
-            if ("grid" in filename.lower() and 
-                not filename.lower().startswith("main") and
-                filename.lower().endswith(('.png', '.jpg', '.jpeg'))):
-                grid_files.append(os.path.join(mocks_folder, filename))
+        for path in list_files(mocks_folder, IMAGE_EXTENSIONS):
+            filename = os.path.basename(path).lower()
+            if "grid" in filename and not filename.startswith("main"):
+                grid_files.append(path)
         
         if not grid_files:
             logger.warning("No grid mockups found for border clipart showcase")
@@ -87,16 +87,13 @@ class VideoProcessor:
         
         logger.info(f"Creating border clipart showcase video from {len(grid_files)} grid mockups")
         output_path = os.path.join(videos_folder, "product_showcase.mp4")
-        success = self.video_creator.create_slideshow_video(sorted(grid_files), output_path)
+        success = self.video_creator.create_slideshow_video(grid_files, output_path)
         return output_path if success else None
     
     def _create_pattern_showcase(self, input_folder: str, videos_folder: str) -> Optional[str]:
         """Create a pattern showcase video using progressive tiling animation."""
-        # Look for a pattern image to tile
-        import glob
-        
         # Try to find pattern images in input folder
-        pattern_files = glob.glob(os.path.join(input_folder, "*.jpg"))
+        pattern_files = list_files(input_folder, [".jpg"])
         if not pattern_files:
             logger.warning(f"No pattern images found in {input_folder}")
             return None
@@ -112,19 +109,14 @@ class VideoProcessor:
     def _create_generic_showcase(self, input_folder: str, videos_folder: str) -> Optional[str]:
         """Create a generic showcase video from available images."""
         # Get all image files
-        image_extensions = ["*.png", "*.jpg", "*.jpeg"]
-        image_paths = []
-        
-        import glob
-        for ext in image_extensions:
-            image_paths.extend(glob.glob(os.path.join(input_folder, ext)))
+        image_paths = list_files(input_folder, IMAGE_EXTENSIONS)
         
         if not image_paths:
             logger.warning(f"No images found in {input_folder}")
             return None
         
         output_path = os.path.join(videos_folder, "product_showcase.mp4")
-        success = self.video_creator.create_slideshow_video(sorted(image_paths)[:8], output_path)
+        success = self.video_creator.create_slideshow_video(image_paths[:8], output_path)
         return output_path if success else None
     
     def _create_journal_papers_showcase(self, input_folder: str, videos_folder: str) -> Optional[str]:
@@ -136,11 +128,10 @@ class VideoProcessor:
             return None
         
         # Find grid mockups (exclude main mockup)
-        grid_files = []
-        for filename in os.listdir(mocks_folder):
-            if (filename.lower().startswith("journal_papers_grid") and 
-                filename.lower().endswith(('.png', '.jpg', '.jpeg'))):
-                grid_files.append(os.path.join(mocks_folder, filename))
+        grid_files = [
+            path for path in list_files(mocks_folder, IMAGE_EXTENSIONS)
+            if os.path.basename(path).lower().startswith("journal_papers_grid")
+        ]
         
         if not grid_files:
             logger.warning("No grid mockups found for journal papers showcase")
@@ -149,7 +140,7 @@ class VideoProcessor:
         logger.info(f"Creating journal papers collage video from {len(grid_files)} grid mockups")
         output_path = os.path.join(videos_folder, "journal_papers_showcase.mp4")
         success = self.video_creator.create_collage_video(
-            sorted(grid_files), 
+            grid_files, 
             output_path,
             display_duration=10  # Show collage for 10 seconds
         )
@@ -2,77 +2,109 @@
 
 import os
 import re
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Tuple
 
 # Set up logging
 from src.utils.common import setup_logging
 from src.utils.env_loader import load_environment
+from src.utils.metrics import record_cache_lookup
 
 logger = setup_logging(__name__)
 
-# Load environment variables
-load_environment()
+_environment_loaded = False
+
+
+def _ensure_environment() -> None:
+    """Load .env the first time provider settings are needed, not at import."""
+    global _environment_loaded
+    if not _environment_loaded:
+        load_environment()
+        _environment_loaded = True
+
+
+# Provider settings: API key env var, model env var, default model
+_PROVIDER_SETTINGS = {
+    "gemini": ("GEMINI_API_KEY", "GEMINI_MODEL", "gemini-3-flash-preview"),
+    "openai": ("OPENAI_API_KEY", "OPENAI_MODEL", "gpt-4.1-mini"),
+}
+
+# Process-wide provider pool keyed by (provider, model, api key)
+_provider_pool: Dict[Tuple[str, str, str], Any] = {}
+_provider_pool_lock = threading.Lock()
 
 
 def get_ai_provider(
-    provider_name: str = "gemini", api_key: Optional[str] = None
+    provider_name: str = "gemini",
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None,
 ) -> Optional[Any]:
-    """Get an AI provider instance.
+    """Get the shared AI provider instance for a provider, model and key.
+
+    Providers are created on first use and then reused by every caller in
+    the process, so the underlying client (and its HTTP connections) is
+    built once rather than per processor. Creation is serialized with a
+    lock so concurrent job workers end up sharing one instance.
 
     Args:
         provider_name: Name of the AI provider ("gemini" or "openai")
         api_key: Optional API key to use (if not provided, will try environment)
+        model_name: Optional model name (if not provided, uses GEMINI_MODEL /
+            OPENAI_MODEL or the provider default)
 
     Returns:
         AI provider instance or None if not available
     """
-    try:
-        logger.info(
-            f"Attempting to create AI provider: {provider_name}, API key provided: {api_key is not None}"
-        )
+    _ensure_environment()
+    provider_name = provider_name.lower()
 
-        if provider_name.lower() == "gemini":
-            if not api_key:
-                api_key = os.getenv("GEMINI_API_KEY")
-                logger.info(
-                    f"Retrieved Gemini API key from environment: {api_key is not None}"
-                )
-            if not api_key:
-                logger.warning("GEMINI_API_KEY not found in environment or provided")
-                return None
+    if provider_name not in _PROVIDER_SETTINGS:
+        logger.error(f"Unknown AI provider: {provider_name}")
+        return None
+
+    key_var, model_var, default_model = _PROVIDER_SETTINGS[provider_name]
+    api_key = api_key or os.getenv(key_var)
+    if not api_key:
+        logger.warning(f"{key_var} not found in environment or provided")
+        return None
+    model_name = model_name or os.getenv(model_var) or default_model
 
-            from src.services.ai.providers.gemini_provider import GeminiProvider
+    pool_key = (provider_name, model_name, api_key)
+    provider = _provider_pool.get(pool_key)
+    record_cache_lookup("ai_provider", provider is not None)
+    if provider is not None:
+        return provider
 
-            provider = GeminiProvider(api_key=api_key)
-            logger.info(f"Created Gemini provider successfully: {provider is not None}")
+    with _provider_pool_lock:
+        provider = _provider_pool.get(pool_key)
+        if provider is not None:
             return provider
 
-        elif provider_name.lower() == "openai":
-            if not api_key:
-                api_key = os.getenv("OPENAI_API_KEY")
-                logger.info(
-                    f"Retrieved OpenAI API key from environment: {api_key is not None}"
-                )
-            if not api_key:
-                logger.warning("OPENAI_API_KEY not found in environment or provided")
-                return None
-
-            from src.services.ai.providers.openai_provider import OpenAIProvider
+        try:
+            if provider_name == "gemini":
+                from src.services.ai.providers.gemini_provider import GeminiProvider
 
-            provider = OpenAIProvider(api_key=api_key)
-            logger.info(f"Created OpenAI provider successfully: {provider is not None}")
-            return provider
+                provider = GeminiProvider(api_key=api_key, model_name=model_name)
+            else:
+                from src.services.ai.providers.openai_provider import OpenAIProvider
 
-        else:
-            logger.error(f"Unknown AI provider: {provider_name}")
+                provider = OpenAIProvider(api_key=api_key, model_name=model_name)
+        except ImportError as e:
+            logger.error(f"Failed to import AI provider {provider_name}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to create AI provider {provider_name}: {e}")
             return None
 
-    except ImportError as e:
-        logger.error(f"Failed to import AI provider {provider_name}: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Failed to create AI provider {provider_name}: {e}")
-        return None
+        _provider_pool[pool_key] = provider
+        logger.info(f"Created shared {provider_name} provider ({model_name})")
+        return provider
+
+
+def clear_ai_provider_pool() -> None:
+    """Drop all shared provider instances (e.g. after changing API keys)."""
+    with _provider_pool_lock:
+        _provider_pool.clear()
 
 
 def get_available_providers() -> Dict[str, bool]:
@@ -81,6 +113,7 @@ def get_available_providers() -> Dict[str, bool]:
     Returns:
         Dict mapping provider names to availability status
     """
+    _ensure_environment()
     providers = {}
 
     # Check Gemini
@@ -0,0 +1,121 @@
+"""
+Process-wide cache of static mockup assets.
+
+Canvases, overlays, shadows and the logo never change between mockups, yet
+every grid, demo and Pinterest generator decoded them from disk again and
+usually resized them to the same size as the previous call. ``load_asset``
+decodes each asset once per process and keeps resized variants keyed by
+their target size:
+
+- entries are keyed by path, mtime and file size, so an edited asset is
+  picked up without a restart
+- resized variants are derived from the cached original and kept in a
+  small LRU (``ASSET_CACHE_SIZE`` entries)
+- callers get a copy-on-write view: drawing on it, pasting into it or
+  ``putalpha`` copies the pixels first, so the cached image is never
+  modified and a view that is only read costs nothing
+
+Always import this module as ``src.utils.asset_cache`` so the cache is
+shared.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from src.utils.common import get_asset_path, get_resampling_filter, safe_load_image, setup_logging
+from src.utils.image_utils import readonly_view, resize_image
+from src.utils.metrics import record_cache_lookup
+
+logger = setup_logging(__name__)
+
+ASSET_CACHE_SIZE = 32
+
+_asset_cache: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+_asset_cache_lock = threading.Lock()
+
+
+def _resolve(name: str) -> Optional[str]:
+    # Bare names are looked up in assets/, anything with a folder is a path
+    if os.path.dirname(name):
+        return name if os.path.exists(name) else None
+    return get_asset_path(name)
+
+
+def _get(key: Tuple) -> Optional[Image.Image]:
+    with _asset_cache_lock:
+        image = _asset_cache.get(key)
+        if image is not None:
+            _asset_cache.move_to_end(key)
+        return image
+
+
+def _put(key: Tuple, image: Image.Image) -> None:
+    with _asset_cache_lock:
+        _asset_cache[key] = image
+        _asset_cache.move_to_end(key)
+        while len(_asset_cache) > ASSET_CACHE_SIZE:
+            _asset_cache.popitem(last=False)
+
+
+def load_asset(
+    name: str,
+    mode: str = "RGBA",
+    size: Optional[Tuple[int, int]] = None,
+    fit: bool = False,
+) -> Optional[Image.Image]:
+    """Load a static asset through the process-wide cache.
+
+    Args:
+        name: Asset file name in ``assets/`` (e.g. "shadow.png") or a path
+        mode: Mode to convert the asset to
+        size: Optional target size (width, height)
+        fit: Resize to fit inside ``size`` keeping the aspect ratio (like
+            ``resize_image``) instead of stretching to exactly ``size``
+
+    Returns:
+        Copy-on-write view of the asset, or None if it is missing or
+        could not be loaded
+    """
+    path = _resolve(name)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    file_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, mode)
+    key = file_key + ((tuple(size), fit) if size else (None, False))
+    image = _get(key)
+    record_cache_lookup("asset", image is not None)
+    if image is not None:
+        return readonly_view(image)
+
+    original = _get(file_key + (None, False)) if size else None
+    if original is None:
+        original = safe_load_image(path, mode)
+        if original is None:
+            return None
+        _put(file_key + (None, False), original)
+
+    image = original
+    if size:
+        width, height = size
+        if width <= 0 or height <= 0:
+            return None
+        if fit:
+            image = resize_image(original, width, height)
+        elif original.size != tuple(size):
+            image = original.resize(tuple(size), get_resampling_filter())
+        _put(key, image)
+    return readonly_view(image)
+
+
+def clear_asset_cache() -> None:
+    """Drop every cached asset and variant."""
+    with _asset_cache_lock:
+        _asset_cache.clear()
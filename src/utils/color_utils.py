@@ -3,14 +3,190 @@ Shared color utilities for pattern and clipart mockups.
 """
 
 import colorsys
+import os
+import threading
+from collections import OrderedDict
 from typing import List, Tuple, Dict, Optional
-from PIL import ImageStat, Image
 
-from utils.common import setup_logging
+import numpy as np
+
+from utils.common import setup_logging, load_image_for_size
+from src.utils.metrics import record_cache_lookup
 
 # Set up logging
 logger = setup_logging(__name__)
 
+DEFAULT_BACKGROUND_COLOR = (222, 215, 211)
+
+# Palette engine tuning
+PALETTE_THUMBNAIL_SIZE = 200
+PALETTE_SAMPLE_PIXELS = 4096
+PALETTE_KMEANS_ITERATIONS = 12
+PALETTE_CACHE_SIZE = 256
+
+_palette_cache: "OrderedDict[Tuple, List[Tuple[Tuple[int, int, int], float]]]" = OrderedDict()
+_palette_cache_lock = threading.Lock()
+
+# sRGB (D65) -> XYZ matrix and reference white, used for the Lab conversion
+_RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+_XYZ_TO_RGB = np.linalg.inv(_RGB_TO_XYZ)
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+
+def _rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3) array of 0-255 sRGB values to CIE Lab."""
+    c = rgb.astype(np.float64) / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = (linear @ _RGB_TO_XYZ.T) / _D65_WHITE
+    f = np.where(xyz > 216 / 24389, np.cbrt(xyz), (24389 / 27 * xyz + 16) / 116)
+    return np.stack(
+        [116 * f[:, 1] - 16, 500 * (f[:, 0] - f[:, 1]), 200 * (f[:, 1] - f[:, 2])],
+        axis=1,
+    )
+
+
+def _lab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3) array of CIE Lab values back to 0-255 sRGB."""
+    fy = (lab[:, 0] + 16) / 116
+    fx = fy + lab[:, 1] / 500
+    fz = fy - lab[:, 2] / 200
+    f = np.stack([fx, fy, fz], axis=1)
+    xyz = np.where(f ** 3 > 216 / 24389, f ** 3, (116 * f - 16) / (24389 / 27))
+    linear = np.clip((xyz * _D65_WHITE) @ _XYZ_TO_RGB.T, 0.0, 1.0)
+    c = np.where(
+        linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055
+    )
+    return np.clip(np.rint(c * 255), 0, 255).astype(np.uint8)
+
+
+def _kmeans(
+    samples: np.ndarray, k: int, iterations: int, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Run k-means++ seeded Lloyd iterations on ``samples``.
+
+    Returns:
+        Tuple of (centers, labels)
+    """
+    n = len(samples)
+    centers = np.empty((k, samples.shape[1]))
+    centers[0] = samples[rng.integers(n)]
+    closest = ((samples - centers[0]) ** 2).sum(axis=1)
+    for i in range(1, k):
+        total = closest.sum()
+        if total <= 0:
+            centers[i:] = centers[0]
+            break
+        centers[i] = samples[rng.choice(n, p=closest / total)]
+        closest = np.minimum(closest, ((samples - centers[i]) ** 2).sum(axis=1))
+
+    labels = np.zeros(n, dtype=np.intp)
+    for iteration in range(iterations):
+        distances = (
+            (samples ** 2).sum(axis=1)[:, None]
+            - 2 * samples @ centers.T
+            + (centers ** 2).sum(axis=1)[None, :]
+        )
+        new_labels = distances.argmin(axis=1)
+        if iteration > 0 and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, samples)
+        populated = counts > 0
+        centers[populated] = sums[populated] / counts[populated, None]
+
+    return centers, labels
+
+
+def _palette_cache_key(image_path: str, num_colors: int) -> Optional[Tuple]:
+    """Build a cache key from the file's identity and modification state."""
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    return (os.path.abspath(image_path), st.st_size, st.st_mtime_ns, num_colors)
+
+
+def extract_palette(
+    image_path: str, num_colors: int = 8
+) -> List[Tuple[Tuple[int, int, int], float]]:
+    """Extract the weighted dominant colors of a single image.
+
+    Pixels are subsampled from a thumbnail and clustered with k-means in
+    CIE Lab space, so that cluster distances follow perceived color
+    differences. Results are cached per file (path, size and mtime), so
+    repeated mockup steps on the same folder only decode each image once.
+    Fully transparent pixels are ignored.
+
+    Args:
+        image_path: Path to the image
+        num_colors: Maximum number of palette entries to return
+
+    Returns:
+        List of ``((r, g, b), weight)`` tuples sorted by weight, where the
+        weights are the fraction of sampled pixels in each cluster. Empty
+        if the image could not be read.
+    """
+    key = _palette_cache_key(image_path, num_colors)
+    if key is not None:
+        with _palette_cache_lock:
+            cached = _palette_cache.get(key)
+            if cached is not None:
+                _palette_cache.move_to_end(key)
+        record_cache_lookup("palette", cached is not None)
+        if cached is not None:
+            return list(cached)
+
+    thumbnail_box = (PALETTE_THUMBNAIL_SIZE, PALETTE_THUMBNAIL_SIZE)
+    img = load_image_for_size(image_path, thumbnail_box, "RGBA")
+    if img is None:
+        logger.error(f"Error extracting colors from {image_path}")
+        return []
+    img.thumbnail(thumbnail_box)
+    pixels = np.asarray(img).reshape(-1, 4)
+
+    pixels = pixels[pixels[:, 3] > 0, :3]
+    if len(pixels) == 0:
+        return []
+
+    # Fixed seed keeps palettes (and therefore mockup colors) reproducible
+    rng = np.random.default_rng(0)
+    if len(pixels) > PALETTE_SAMPLE_PIXELS:
+        pixels = pixels[rng.choice(len(pixels), PALETTE_SAMPLE_PIXELS, replace=False)]
+
+    k = max(1, min(num_colors, len(np.unique(pixels, axis=0))))
+    centers, labels = _kmeans(_rgb_to_lab(pixels), k, PALETTE_KMEANS_ITERATIONS, rng)
+
+    counts = np.bincount(labels, minlength=k)
+    rgb_centers = _lab_to_rgb(centers)
+    order = np.argsort(-counts, kind="stable")
+    palette = [
+        (tuple(int(v) for v in rgb_centers[i]), float(counts[i]) / len(labels))
+        for i in order
+        if counts[i] > 0
+    ]
+
+    if key is not None:
+        with _palette_cache_lock:
+            _palette_cache[key] = palette
+            while len(_palette_cache) > PALETTE_CACHE_SIZE:
+                _palette_cache.popitem(last=False)
+
+    return list(palette)
+
+
+def clear_palette_cache() -> None:
+    """Drop all cached palettes."""
+    with _palette_cache_lock:
+        _palette_cache.clear()
+
 
 def extract_colors_from_images(
     images: List[str], num_colors: int = 5
@@ -26,130 +202,55 @@ def extract_colors_from_images(
     """
     if not images:
         logger.warning("No images provided for color extraction")
-        return [(222, 215, 211)]  # Default background color
+        return [DEFAULT_BACKGROUND_COLOR]
 
     # Use more images for better color representation
     sample_images = images[: min(5, len(images))]
-    all_colors = []
 
+    # Merge the per-image palettes, weighting each image equally
+    weights: Dict[Tuple[int, int, int], float] = {}
     for img_path in sample_images:
-        try:
-            with Image.open(img_path) as img:
-                # Convert to RGB if needed
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
-
-                # Resize for faster processing but keep enough detail for color extraction
-                img.thumbnail((200, 200))
-
-                # Get image statistics
-                stat = ImageStat.Stat(img)
-                avg_color = tuple(map(int, stat.mean))
-                all_colors.append(avg_color)
-
-                # Sample pixels from different regions
-                width, height = img.size
-
-                # Create a more detailed grid of regions
-                regions = []
-                grid_size = 4  # 4x4 grid
-                for x in range(grid_size):
-                    for y in range(grid_size):
-                        x_start = int(width * x / grid_size)
-                        y_start = int(height * y / grid_size)
-                        x_end = int(width * (x + 1) / grid_size)
-                        y_end = int(height * (y + 1) / grid_size)
-                        regions.append((x_start, y_start, x_end, y_end))
-
-                # Add some focused regions for potential accent colors
-                regions.extend(
-                    [
-                        (width // 4, height // 4, 3 * width // 4, 3 * height // 4),  # Center
-                        (0, 0, width // 3, height // 3),  # Top-left
-                        (2 * width // 3, 0, width, height // 3),  # Top-right
-                        (0, 2 * height // 3, width // 3, height),  # Bottom-left
-                        (2 * width // 3, 2 * height // 3, width, height),  # Bottom-right
-                    ]
-                )
-
-                for region in regions:
-                    region_img = img.crop(region)
-                    region_stat = ImageStat.Stat(region_img)
-                    region_color = tuple(map(int, region_stat.mean))
-                    all_colors.append(region_color)
-
-                    # Also extract min and max colors from each region for more variety
-                    min_vals = (
-                        region_stat.extrema[0][0],
-                        region_stat.extrema[1][0],
-                        region_stat.extrema[2][0],
-                    )
-                    max_vals = (
-                        region_stat.extrema[0][1],
-                        region_stat.extrema[1][1],
-                        region_stat.extrema[2][1],
-                    )
-                    all_colors.append(tuple(map(int, min_vals)))
-                    all_colors.append(tuple(map(int, max_vals)))
-
-        except Exception as e:
-            logger.error(f"Error extracting colors from {img_path}: {e}")
+        for color, weight in extract_palette(img_path, max(8, num_colors)):
+            weights[color] = weights.get(color, 0.0) + weight
 
     # If we couldn't extract any colors, return default
-    if not all_colors:
-        return [(222, 215, 211)]  # Default background color
-
-    # Filter out very similar colors
-    filtered_colors = []
-    for color in all_colors:
-        # Convert to HSV for better color comparison
-        h, s, v = colorsys.rgb_to_hsv(color[0] / 255, color[1] / 255, color[2] / 255)
-
-        # Allow a wider range of colors, only skip extreme values
-        if v < 0.1 or v > 0.98:
-            continue
-
-        # Allow more colors with lower saturation but prioritize vibrant ones
-        if s < 0.03:  # Only skip very desaturated colors
-            continue
-
-        # Check if this color is too similar to ones we've already kept
-        is_unique = True
-        for existing_color in filtered_colors:
-            existing_h, existing_s, existing_v = colorsys.rgb_to_hsv(
-                existing_color[0] / 255,
-                existing_color[1] / 255,
-                existing_color[2] / 255,
+    if not weights:
+        return [DEFAULT_BACKGROUND_COLOR]
+
+    # Most represented colors first so they win the similarity check below
+    all_colors = sorted(weights, key=weights.get, reverse=True)
+    hsv = np.array(
+        [colorsys.rgb_to_hsv(r / 255, g / 255, b / 255) for r, g, b in all_colors]
+    )
+
+    # Allow a wide range of colors, only skip extreme values and
+    # very desaturated colors
+    usable = (hsv[:, 2] >= 0.1) & (hsv[:, 2] <= 0.98) & (hsv[:, 1] >= 0.03)
+
+    # Skip colors too similar to a more represented one already kept
+    kept: List[int] = []
+    for i in np.flatnonzero(usable):
+        if kept:
+            h_diff = np.abs(hsv[kept, 0] - hsv[i, 0])
+            h_diff = np.minimum(h_diff, 1 - h_diff)
+            similar = (
+                (h_diff < 0.08)
+                & (np.abs(hsv[kept, 1] - hsv[i, 1]) < 0.15)
+                & (np.abs(hsv[kept, 2] - hsv[i, 2]) < 0.15)
             )
+            if similar.any():
+                continue
+        kept.append(i)
 
-            # Calculate color distance in HSV space
-            h_diff = min(abs(h - existing_h), 1 - abs(h - existing_h))
-            s_diff = abs(s - existing_s)
-            v_diff = abs(v - existing_v)
-
-            # If colors are too similar, skip this one (use tighter threshold)
-            if h_diff < 0.08 and s_diff < 0.15 and v_diff < 0.15:
-                is_unique = False
-                break
-
-        if is_unique:
-            filtered_colors.append(color)
-
-    # If filtering removed all colors, return the original average colors
-    if not filtered_colors:
-        filtered_colors = all_colors
+    # If filtering removed all colors, fall back to the unfiltered palette
+    if not kept:
+        kept = list(range(len(all_colors)))
 
     # Sort by saturation to prioritize more vibrant colors
-    filtered_colors_with_hsv = []
-    for color in filtered_colors:
-        h, s, v = colorsys.rgb_to_hsv(color[0] / 255, color[1] / 255, color[2] / 255)
-        filtered_colors_with_hsv.append((color, s))
-
-    filtered_colors_with_hsv.sort(key=lambda x: x[1], reverse=True)
-    sorted_colors = [c[0] for c in filtered_colors_with_hsv]
+    kept.sort(key=lambda i: hsv[i, 1], reverse=True)
 
     # Return the requested number of colors
-    return sorted_colors[:num_colors]
+    return [all_colors[i] for i in kept[:num_colors]]
 
 
 def calculate_contrast_ratio(
@@ -280,6 +280,85 @@ def safe_load_image(
         return None
 
 
+def load_image_for_size(
+    image_path: Union[str, Path],
+    target_size: Tuple[int, int],
+    mode: Optional[str] = None,
+    cover: bool = False,
+) -> Optional[Image.Image]:
+    """Load an image decoded at the lowest resolution that still covers a target box.
+
+    For JPEGs this uses ``Image.draft`` so libjpeg scales the DCT while
+    decoding (1/2, 1/4 or 1/8); other formats are shrunk with
+    ``Image.reduce`` right after loading. The returned image is never
+    smaller than what a fit into ``target_size`` needs, so callers still do
+    their own final resample exactly as before, just from a much smaller
+    source.
+
+    Args:
+        image_path: Path to the image file
+        target_size: Bounding box (width, height) the image will be resized to
+        mode: Optional mode to convert the image to (e.g., 'RGB', 'RGBA')
+        cover: If True, the image will be scaled to cover the whole box
+            (crop or stretch) rather than fit inside it
+
+    Returns:
+        The loaded image, or None if loading failed
+    """
+    try:
+        if not os.path.exists(str(image_path)):
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+
+        file_size = os.path.getsize(str(image_path))
+        max_size = ImageConstants.MAX_FILE_SIZE_MB * 1024 * 1024
+        if file_size > max_size:
+            raise ImageProcessingError(
+                f"Image file too large: {file_size / (1024*1024):.1f}MB"
+            )
+
+        target_width, target_height = target_size
+        if target_width <= 0 or target_height <= 0:
+            raise ImageProcessingError(f"Invalid target size: {target_size}")
+
+        with Image.open(str(image_path)) as img:
+            width_ratio = target_width / img.width
+            height_ratio = target_height / img.height
+            scale = max(width_ratio, height_ratio) if cover else min(width_ratio, height_ratio)
+
+            needed = (
+                max(1, math.ceil(img.width * scale)),
+                max(1, math.ceil(img.height * scale)),
+            )
+
+            if scale < 1:
+                # No-op for formats without draft support
+                img.draft(None, needed)
+            img.load()
+
+            result = img
+            factor = min(result.width // needed[0], result.height // needed[1])
+            if factor >= 2:
+                if result.mode not in ("L", "LA", "RGB", "RGBA", "RGBa", "La", "I", "F"):
+                    result = result.convert(mode or "RGBA")
+                result = result.reduce(factor)
+
+            if mode and result.mode != mode:
+                result = result.convert(mode)
+
+            # Detach from the file handle closed by the context manager
+            return result.copy() if result is img else result
+
+    except FileNotFoundError:
+        logging.getLogger(__name__).error(f"Image file not found: {image_path}")
+        return None
+    except Image.UnidentifiedImageError:
+        logging.getLogger(__name__).error(f"Unsupported image format: {image_path}")
+        return None
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error loading image {image_path}: {e}")
+        return None
+
+
 def get_resampling_filter():
     """
     Get the appropriate resampling filter based on the PIL version.
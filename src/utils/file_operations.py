@@ -6,6 +6,7 @@ import shutil
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from src.utils.common import setup_logging, ensure_dir_exists
+from src.utils.folder_inventory import list_files
 
 logger = setup_logging(__name__)
 
@@ -158,26 +159,21 @@ def get_directory_size(directory: str) -> int:
 def find_files_by_extension(directory: str, extensions: List[str]) -> List[str]:
     """Find all files with specific extensions in a directory.
     
+    Served from the workflow's cached folder inventory when one covers
+    ``directory``; hidden files are skipped.
+    
     Args:
         directory: Directory to search
         extensions: List of file extensions (with or without dots)
         
     Returns:
-        List of file paths
+        List of file paths in natural order
     """
-    # Normalize extensions
-    extensions = [ext if ext.startswith('.') else f'.{ext}' for ext in extensions]
-    
-    found_files = []
     try:
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if any(file.lower().endswith(ext.lower()) for ext in extensions):
-                    found_files.append(os.path.join(root, file))
+        return list_files(directory, extensions, recursive=True)
     except Exception as e:
         logger.error(f"Failed to search for files in {directory}: {e}")
-    
-    return found_files
+        return []
 
 
 def create_smart_zip_files(source_dir: str, output_dir: str, max_size_mb: float = 20.0, 
@@ -0,0 +1,291 @@
+"""
+Single-pass folder inventory shared by a workflow run.
+
+A run used to list the same product folder many times: every mockup
+builder globbed it, ``find_files_by_extension`` walked it, the resizer
+listed it once per extension and the processors walked it again to count
+images. ``FolderInventory`` scans the tree once with ``os.scandir`` and
+answers those queries from memory:
+
+- entries are categorized by their top-level folder (``sources``,
+  ``mocks``, ``zipped``, ``videos``, ``temp``)
+- each entry keeps its size, mtime and a natural sort key, so
+  ``pattern_2`` sorts before ``pattern_10``
+- hidden files (``.DS_Store``, in-progress temp outputs) and
+  ``Thumbs.db`` are skipped
+
+``BaseProcessor`` registers an inventory for its input folder with
+``cached_inventory`` for the length of a workflow run. ``list_files`` and
+``list_subfolders`` use a registered inventory that covers the folder and
+fall back to a fresh scan otherwise, which only descends as deep as the
+query needs. Writes that go through the pipeline
+(``save_image``, the background writer, resize commits) call
+``invalidate_path``, and every workflow step ends with one, so a cached
+listing never outlives a change made by the pipeline.
+
+Always import this module as ``src.utils.folder_inventory`` so the
+registry is shared.
+"""
+
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+SOURCES = "sources"
+CATEGORY_FOLDERS = {"mocks": "mocks", "zipped": "zipped", "videos": "videos", "temp": "temp"}
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+IGNORED_NAMES = {"Thumbs.db"}
+
+_registry: Dict[str, "FolderInventory"] = {}
+_recorders: List[Tuple[str, Set[str]]] = []
+_registry_lock = threading.Lock()
+
+_NUMBER_RE = re.compile(r"(\d+)")
+
+
+def natural_sort_key(name: str) -> Tuple:
+    """Sort key that orders embedded numbers numerically ("img_2" < "img_10")."""
+    return tuple(
+        (1, int(part), "") if part.isdigit() else (0, 0, part.lower())
+        for part in _NUMBER_RE.split(name)
+        if part
+    )
+
+
+def _normalize_extensions(extensions: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    if extensions is None:
+        return None
+    return tuple((ext if ext.startswith(".") else f".{ext}").lower() for ext in extensions)
+
+
+@dataclass(frozen=True)
+class InventoryEntry:
+    """A file found by a ``FolderInventory`` scan."""
+
+    path: str
+    relpath: str
+    name: str
+    extension: str
+    category: str
+    size: int
+    mtime_ns: int
+    sort_key: Tuple
+
+    @property
+    def folder(self) -> str:
+        return os.path.dirname(self.path)
+
+
+class FolderInventory:
+    """Files and folders under ``root``, scanned lazily in one pass.
+
+    Args:
+        root: Folder to inventory
+        max_depth: Levels of subfolders to scan below the root (default:
+            all); 0 lists only the root's own files and subfolders
+    """
+
+    def __init__(self, root: str, max_depth: Optional[int] = None):
+        self.root = os.path.abspath(root)
+        self.max_depth = max_depth
+        self.scans = 0
+        self._lock = threading.Lock()
+        self._entries: Optional[List[InventoryEntry]] = None
+        self._folders: List[str] = []
+
+    def invalidate(self) -> None:
+        """Drop the cached scan; the next query rescans the tree."""
+        with self._lock:
+            self._entries = None
+
+    @property
+    def entries(self) -> List[InventoryEntry]:
+        """Every file under the root in natural order, scanning if needed."""
+        with self._lock:
+            if self._entries is None:
+                self._entries, self._folders = self._scan()
+                self.scans += 1
+            return self._entries
+
+    def _scan(self) -> Tuple[List[InventoryEntry], List[str]]:
+        entries: List[InventoryEntry] = []
+        folders: List[str] = []
+        stack = [(self.root, "", SOURCES, 0)]
+        while stack:
+            folder, rel_folder, category, depth = stack.pop()
+            try:
+                with os.scandir(folder) as it:
+                    dir_entries = list(it)
+            except OSError:
+                continue
+            for entry in dir_entries:
+                if entry.name.startswith(".") or entry.name in IGNORED_NAMES:
+                    continue
+                relpath = os.path.join(rel_folder, entry.name) if rel_folder else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append(entry.path)
+                        if self.max_depth is not None and depth >= self.max_depth:
+                            continue
+                        sub_category = (
+                            CATEGORY_FOLDERS.get(entry.name, SOURCES) if not rel_folder else category
+                        )
+                        stack.append((entry.path, relpath, sub_category, depth + 1))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append(InventoryEntry(
+                    path=entry.path,
+                    relpath=relpath,
+                    name=entry.name,
+                    extension=os.path.splitext(entry.name)[1].lower(),
+                    category=category,
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    sort_key=tuple(natural_sort_key(part) for part in relpath.split(os.sep)),
+                ))
+        entries.sort(key=lambda e: e.sort_key)
+        folders.sort(key=lambda path: natural_sort_key(os.path.relpath(path, self.root)))
+        return entries, folders
+
+    def covers(self, path: str) -> bool:
+        path = os.path.abspath(path)
+        return path == self.root or path.startswith(self.root + os.sep)
+
+    def files(
+        self,
+        folder: Optional[str] = None,
+        extensions: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+        recursive: bool = True,
+    ) -> List[InventoryEntry]:
+        """Entries filtered by folder, extension and category.
+
+        Args:
+            folder: Only files under this folder (default: the root)
+            extensions: Extensions to keep, with or without dots (any case)
+            categories: Categories to keep (default: all)
+            recursive: Include files in subfolders of ``folder``
+        """
+        folder = os.path.abspath(folder) if folder else self.root
+        extensions = _normalize_extensions(extensions)
+        categories = set(categories) if categories is not None else None
+        prefix = folder + os.sep
+
+        selected = []
+        for entry in self.entries:
+            if recursive:
+                if not entry.path.startswith(prefix):
+                    continue
+            elif entry.folder != folder:
+                continue
+            if extensions is not None and entry.extension not in extensions:
+                continue
+            if categories is not None and entry.category not in categories:
+                continue
+            selected.append(entry)
+        return selected
+
+    def paths(self, *args, **kwargs) -> List[str]:
+        """Paths of ``files(...)``, in natural order."""
+        return [entry.path for entry in self.files(*args, **kwargs)]
+
+    def count(self, *args, **kwargs) -> int:
+        """Number of ``files(...)``."""
+        return len(self.files(*args, **kwargs))
+
+    def subfolders(self, folder: Optional[str] = None) -> List[str]:
+        """Names of the immediate subfolders of ``folder`` (default: the root)."""
+        folder = os.path.abspath(folder) if folder else self.root
+        self.entries  # make sure the folder list is current
+        with self._lock:
+            folders = list(self._folders)
+        return [os.path.basename(path) for path in folders if os.path.dirname(path) == folder]
+
+
+@contextmanager
+def cached_inventory(root: str) -> Iterator[FolderInventory]:
+    """Share one inventory of ``root`` with every lookup inside the block.
+
+    Nested blocks for the same root reuse the outer inventory.
+    """
+    root = os.path.abspath(root)
+    with _registry_lock:
+        inventory = _registry.get(root)
+        owner = inventory is None
+        if owner:
+            inventory = _registry[root] = FolderInventory(root)
+    try:
+        yield inventory
+    finally:
+        if owner:
+            with _registry_lock:
+                _registry.pop(root, None)
+
+
+def get_inventory(folder: str, recursive: bool = True) -> FolderInventory:
+    """The registered inventory covering ``folder``, or a fresh one for it.
+
+    Args:
+        folder: Folder to look up
+        recursive: Whether a fresh inventory must include subfolders; a
+            non-recursive one scans only ``folder`` itself
+    """
+    with _registry_lock:
+        inventories = list(_registry.values())
+    for inventory in inventories:
+        if inventory.covers(folder):
+            return inventory
+    return FolderInventory(folder, max_depth=None if recursive else 0)
+
+
+def invalidate_path(path: str) -> None:
+    """Mark every registered inventory containing ``path`` as stale."""
+    path = os.path.abspath(path)
+    with _registry_lock:
+        inventories = list(_registry.values())
+        for root, paths in _recorders:
+            if path.startswith(root + os.sep):
+                paths.add(path)
+    for inventory in inventories:
+        if inventory.covers(path):
+            inventory.invalidate()
+
+
+@contextmanager
+def recorded_writes(root: str) -> Iterator[Set[str]]:
+    """Collect the paths under ``root`` that the pipeline writes inside the block.
+
+    Every path passed to ``invalidate_path`` from any thread is added to the
+    yielded set (as an absolute path), so files that changed without going
+    through the pipeline can be told apart afterwards.
+    """
+    recorder = (os.path.abspath(root), set())
+    with _registry_lock:
+        _recorders.append(recorder)
+    try:
+        yield recorder[1]
+    finally:
+        with _registry_lock:
+            _recorders[:] = [r for r in _recorders if r is not recorder]
+
+
+def list_files(
+    folder: str,
+    extensions: Optional[Iterable[str]] = None,
+    recursive: bool = False,
+    categories: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """Files in ``folder`` (natural order), from the cached inventory if any."""
+    return get_inventory(folder, recursive).paths(folder, extensions, categories, recursive)
+
+
+def list_subfolders(folder: str) -> List[str]:
+    """Names of the subfolders of ``folder``, from the cached inventory if any."""
+    return get_inventory(folder, recursive=False).subfolders(folder)
@@ -3,18 +3,20 @@ Unified grid creation utilities for all product types.
 """
 
 import os
-import glob
 from typing import List, Tuple, Optional, Dict, Any
 from PIL import Image
 
 from src.utils.common import (
     setup_logging,
     get_resampling_filter,
-    safe_load_image,
+    load_image_for_size,
     apply_watermark,
     get_asset_path,
     ensure_dir_exists
 )
+from src.utils.asset_cache import load_asset
+from src.utils.folder_inventory import list_files
+from src.utils.image_writer import write_image
 
 logger = setup_logging(__name__)
 
@@ -27,7 +29,7 @@ class GridCreator:
     
     def load_background(self, canvas_name: str = "canvas.png", size: Tuple[int, int] = None) -> Optional[Image.Image]:
         """
-        Load a background image from assets.
+        Load a background image from assets (cached per process).
         
         Args:
             canvas_name: Name of the canvas file
@@ -41,14 +43,10 @@ class GridCreator:
             logger.warning(f"Background '{canvas_name}' not found in assets")
             return None
         
-        try:
-            bg = Image.open(canvas_path).convert("RGBA")
-            if size:
-                bg = bg.resize(size, get_resampling_filter())
-            return bg
-        except Exception as e:
-            logger.error(f"Error loading background {canvas_name}: {e}")
-            return None
+        bg = load_asset(canvas_path, "RGBA", size)
+        if bg is None:
+            logger.error(f"Error loading background {canvas_name}")
+        return bg
     
     def create_fallback_background(self, size: Tuple[int, int], color: Tuple[int, int, int] = (248, 248, 248)) -> Image.Image:
         """Create a fallback solid color background."""
@@ -101,6 +99,23 @@ class GridCreator:
         
         return image.resize((img_width, img_height), get_resampling_filter())
     
+    def load_image_for_cell(self, image_path: str, cell_size: Tuple[int, int]) -> Optional[Image.Image]:
+        """
+        Load an image at a resolution suited for fit_image_to_cell.
+        
+        Large images are decoded at reduced resolution (JPEG draft mode or
+        reduce) instead of at full size, since they are shrunk to the cell
+        anyway.
+        
+        Args:
+            image_path: Path to the image
+            cell_size: Size of the cell (width, height)
+            
+        Returns:
+            RGBA image or None if loading failed
+        """
+        return load_image_for_size(image_path, cell_size, "RGBA")
+    
     def place_image_in_grid(self, canvas: Image.Image, image: Image.Image, 
                            position: Tuple[int, int], cell_size: Tuple[int, int]):
         """
@@ -162,7 +177,7 @@ class GridCreator:
         
         for i, img_path in enumerate(image_paths[:4]):
             try:
-                img = safe_load_image(img_path, "RGBA")
+                img = self.load_image_for_cell(img_path, (cell_width, cell_height))
                 if not img:
                     logger.warning(f"Failed to load image: {img_path}")
                     continue
@@ -226,7 +241,7 @@ class GridCreator:
         
         for i, img_path in enumerate(image_paths[:6]):
             try:
-                img = safe_load_image(img_path, "RGBA")
+                img = self.load_image_for_cell(img_path, (cell_width, cell_height))
                 if not img:
                     logger.warning(f"Failed to load image: {img_path}")
                     continue
@@ -265,7 +280,7 @@ class GridCreator:
         output_folder = os.path.join(input_folder, "mocks")
         ensure_dir_exists(output_folder)
         
-        images = sorted(glob.glob(os.path.join(input_folder, "*.[jp][pn][g]")))
+        images = list_files(input_folder, [".jpg", ".png"])
         if not images:
             logger.warning("No images found for grid mockup")
             return None
@@ -305,7 +320,12 @@ class GridCreator:
         # Place images
         for i, img_path in enumerate(images_to_place):
             try:
-                img = Image.open(img_path).convert("RGB")
+                img = load_image_for_size(
+                    img_path, (cell_width, cell_height), "RGB", cover=True
+                )
+                if img is None:
+                    logger.warning(f"Failed to load image: {img_path}")
+                    continue
                 img = img.resize((cell_width, cell_height), get_resampling_filter())
                 row_index = i // grid_cols
                 col_index = i % grid_cols
@@ -331,7 +351,7 @@ class GridCreator:
         # Save result
         try:
             output_path = os.path.join(output_folder, "grid_mockup_with_borders.jpg")
-            final_image.save(output_path, "JPEG", quality=95)
+            write_image(final_image, output_path, "JPEG", quality=95)
             logger.info(f"Grid mockup saved: {output_path}")
             return output_path
         except Exception as e:
@@ -370,7 +390,7 @@ def apply_watermark_to_grid(grid_path: str, logger=None) -> Optional[str]:
         )
         
         # Save watermarked version (overwrite original)
-        watermarked_image.convert("RGB").save(grid_path, "PNG", quality=95, optimize=True)
+        write_image(watermarked_image.convert("RGB"), grid_path, "PNG")
         
         if logger:
             logger.info(f"Applied watermark to grid: {grid_path}")
@@ -0,0 +1,255 @@
+"""
+NumPy-backed image buffer shared between the PIL and OpenCV code paths.
+"""
+
+from typing import Optional, Tuple, Union
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from src.utils.common import setup_logging, safe_load_image, ImageProcessingError
+
+logger = setup_logging(__name__)
+
+# Channel layouts understood by the buffer, keyed by channel order
+_CHANNELS = {"L": 1, "RGB": 3, "BGR": 3, "RGBA": 4, "BGRA": 4}
+
+# Index maps used to swap between RGB(A) and BGR(A) orders
+_SWAP = {3: [2, 1, 0], 4: [2, 1, 0, 3]}
+
+
+class ImageBuffer:
+    """A single contiguous ``uint8`` array with its color layout.
+
+    PIL works in RGB(A) and OpenCV in BGR(A). Rather than converting
+    through ``np.array(img)`` and ``cv2.cvtColor`` at every hand-off, the
+    buffer records the channel order and whether alpha is premultiplied,
+    and only converts when a consumer asks for a different layout. Views
+    in the matching layout share the buffer's memory.
+
+    Attributes:
+        array: ``(height, width)`` or ``(height, width, channels)`` uint8 array
+        order: Channel order, one of ``L``, ``RGB``, ``BGR``, ``RGBA``, ``BGRA``
+        premultiplied: True if the color channels are premultiplied by alpha
+    """
+
+    def __init__(
+        self, array: np.ndarray, order: str = "RGB", premultiplied: bool = False
+    ):
+        if order not in _CHANNELS:
+            raise ImageProcessingError(f"Unsupported channel order: {order}")
+        if array.dtype != np.uint8:
+            raise ImageProcessingError(f"Image buffer must be uint8, got {array.dtype}")
+
+        channels = 1 if array.ndim == 2 else array.shape[2]
+        if channels != _CHANNELS[order]:
+            raise ImageProcessingError(
+                f"Array with {channels} channels does not match order {order}"
+            )
+        if premultiplied and not self._has_alpha(order):
+            raise ImageProcessingError("Only images with alpha can be premultiplied")
+
+        self.array = np.ascontiguousarray(array)
+        self.order = order
+        self.premultiplied = premultiplied
+
+    def __repr__(self) -> str:
+        return (
+            f"ImageBuffer({self.width}x{self.height}, order={self.order}, "
+            f"premultiplied={self.premultiplied})"
+        )
+
+    @staticmethod
+    def _has_alpha(order: str) -> bool:
+        return order in ("RGBA", "BGRA")
+
+    @property
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Size as (width, height), matching PIL."""
+        return self.width, self.height
+
+    @property
+    def has_alpha(self) -> bool:
+        return self._has_alpha(self.order)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_pil(cls, image: Image.Image) -> "ImageBuffer":
+        """Create a buffer from a PIL image.
+
+        L, RGB and RGBA images are read as-is; other modes are converted to
+        RGBA (or RGB if they carry no transparency) first. PIL's ``RGBa``
+        mode is kept as premultiplied RGBA.
+
+        Args:
+            image: Source PIL image
+
+        Returns:
+            New ImageBuffer over a single copy of the pixel data. The array
+            is read-only; use ``copy()`` to get a writable buffer.
+        """
+        if image.mode == "RGBa":
+            return cls(np.asarray(image), "RGBA", premultiplied=True)
+        if image.mode not in ("L", "RGB", "RGBA"):
+            has_transparency = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_transparency else "RGB")
+        return cls(np.asarray(image), image.mode)
+
+    @classmethod
+    def from_cv2(cls, array: np.ndarray, order: Optional[str] = None) -> "ImageBuffer":
+        """Wrap an OpenCV array without copying it.
+
+        Args:
+            array: Array as returned by ``cv2.imread`` or other cv2 calls
+            order: Channel order; defaults to BGR/BGRA based on channel count
+
+        Returns:
+            ImageBuffer sharing memory with ``array`` when it is contiguous
+        """
+        if order is None:
+            channels = 1 if array.ndim == 2 else array.shape[2]
+            order = {1: "L", 3: "BGR", 4: "BGRA"}.get(channels)
+            if order is None:
+                raise ImageProcessingError(f"Unsupported channel count: {channels}")
+        return cls(array, order)
+
+    @classmethod
+    def open(
+        cls, image_path: Union[str, Path], mode: Optional[str] = None
+    ) -> Optional["ImageBuffer"]:
+        """Load an image file into a buffer.
+
+        Args:
+            image_path: Path to the image file
+            mode: Optional PIL mode to convert to while loading
+
+        Returns:
+            ImageBuffer or None if the image could not be loaded
+        """
+        img = safe_load_image(image_path, mode)
+        if img is None:
+            return None
+        return cls.from_pil(img)
+
+    # ------------------------------------------------------------------
+    # Views and conversions
+    # ------------------------------------------------------------------
+
+    def copy(self) -> "ImageBuffer":
+        return ImageBuffer(self.array.copy(), self.order, self.premultiplied)
+
+    def crop(self, box: Tuple[int, int, int, int]) -> "ImageBuffer":
+        """Crop to a PIL-style (left, top, right, bottom) box.
+
+        The crop is copied into its own contiguous array so that it can be
+        handed to PIL or saved independently of the source buffer.
+        """
+        left, top, right, bottom = box
+        left, top = max(0, left), max(0, top)
+        right, bottom = min(self.width, right), min(self.height, bottom)
+        return ImageBuffer(
+            self.array[top:bottom, left:right].copy(), self.order, self.premultiplied
+        )
+
+    def with_order(self, order: str) -> "ImageBuffer":
+        """Return the buffer in another channel order.
+
+        Returns ``self`` when the order already matches. Dropping or adding
+        alpha is supported (added alpha is fully opaque); dropping alpha
+        from a premultiplied buffer un-premultiplies it first.
+        """
+        if order == self.order:
+            return self
+        if order not in _CHANNELS:
+            raise ImageProcessingError(f"Unsupported channel order: {order}")
+
+        # Channel swaps keep premultiplication; only dropping alpha needs
+        # straight color values
+        keep_premultiplied = self.premultiplied and self._has_alpha(order)
+        source = self.unpremultiply() if not keep_premultiplied else self
+        array = source.array
+
+        if order == "L":
+            rgb = source.with_order("RGB").array.astype(np.uint32)
+            # ITU-R 601-2 luma, same integer weights PIL uses for convert("L")
+            gray = (rgb[..., 0] * 19595 + rgb[..., 1] * 38470 + rgb[..., 2] * 7471 + 0x8000) >> 16
+            return ImageBuffer(gray.astype(np.uint8), "L")
+
+        if source.order == "L":
+            array = np.repeat(array[..., None], 3, axis=2)
+            current = "RGB"
+        else:
+            current = source.order
+
+        if current[:3] != order[:3]:
+            array = array[..., _SWAP[array.shape[2]]]
+
+        if len(order) == 3 and array.shape[2] == 4:
+            array = array[..., :3]
+        elif len(order) == 4 and array.shape[2] == 3:
+            alpha = np.full(array.shape[:2] + (1,), 255, dtype=np.uint8)
+            array = np.concatenate([array, alpha], axis=2)
+
+        return ImageBuffer(array, order, premultiplied=keep_premultiplied)
+
+    def premultiply(self) -> "ImageBuffer":
+        """Return a copy with color channels premultiplied by alpha."""
+        if self.premultiplied:
+            return self
+        if not self.has_alpha:
+            raise ImageProcessingError("Only images with alpha can be premultiplied")
+        array = self.array.astype(np.uint16)
+        alpha = array[..., 3:4]
+        array[..., :3] = (array[..., :3] * alpha + 127) // 255
+        return ImageBuffer(array.astype(np.uint8), self.order, premultiplied=True)
+
+    def unpremultiply(self) -> "ImageBuffer":
+        """Return a copy with straight (non-premultiplied) alpha."""
+        if not self.premultiplied:
+            return self
+        array = self.array.astype(np.uint32)
+        alpha = array[..., 3:4]
+        safe_alpha = np.maximum(alpha, 1)
+        color = np.where(alpha > 0, (array[..., :3] * 255 + safe_alpha // 2) // safe_alpha, 0)
+        array[..., :3] = np.minimum(color, 255)
+        return ImageBuffer(array.astype(np.uint8), self.order)
+
+    def to_pil(self) -> Image.Image:
+        """Return a PIL image for the buffer.
+
+        L and straight RGBA buffers are mapped with ``Image.frombuffer`` and
+        share memory with the array; treat the result as read-only or
+        ``copy()`` it before drawing on it. BGR(A) buffers are converted to
+        RGB(A) first, and premultiplied buffers come back in PIL's ``RGBa``
+        mode.
+        """
+        if self.order in ("BGR", "BGRA"):
+            return self.with_order("RGB" + self.order[3:]).to_pil()
+
+        mode = "RGBa" if self.premultiplied else self.order
+        return Image.frombuffer(mode, self.size, self.array, "raw", mode, 0, 1)
+
+    def to_cv2(self, order: str = "BGR") -> np.ndarray:
+        """Return an array in the layout OpenCV expects.
+
+        Args:
+            order: Desired channel order, ``BGR`` by default. Use ``BGRA``
+                to keep alpha or ``L`` for grayscale.
+
+        Returns:
+            The buffer's own array when the layout already matches,
+            otherwise a converted copy
+        """
+        return self.with_order(order).array
@@ -0,0 +1,159 @@
+"""
+Named encoder profiles for PNG and JPEG output.
+
+PNG ``optimize=True`` can cost several times the plain encode time, which
+is wasted on preview runs and on mockups that Etsy re-encodes anyway.
+Every save goes through ``save_image`` with a *purpose*:
+
+- ``delivery``: files the customer downloads (resized product images)
+- ``mockup``: listing images, grids, demos and other previews
+- ``working``: intermediate files that are processed again later
+
+``BaseProcessor`` picks a profile per purpose from the product type's
+``encode_settings`` in ``ConfigManager`` (overridable with
+``custom_settings["encode_profile"]``) and activates it with
+``encode_profiles``. Code outside a workflow gets ``DEFAULT_PURPOSE_PROFILES``.
+
+Always import this module as ``src.utils.image_encoding`` so the active
+profiles are shared.
+"""
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+from PIL import Image
+
+from src.utils.folder_inventory import invalidate_path
+
+
+@dataclass(frozen=True)
+class EncodeProfile:
+    """Encoder settings applied on top of the caller's save options.
+
+    Attributes:
+        name: Profile name
+        png_compress_level: zlib level 0-9 (ignored when png_optimize is set)
+        png_optimize: Let PIL search for the smallest PNG encoding (slow)
+        jpeg_optimize: Compute optimal Huffman tables (smaller, slower)
+        jpeg_progressive: Write a progressive JPEG
+        jpeg_subsampling: Chroma subsampling ("4:4:4", "4:2:2", "4:2:0"),
+            or None to keep the caller's setting / encoder default
+    """
+
+    name: str
+    png_compress_level: int
+    png_optimize: bool
+    jpeg_optimize: bool
+    jpeg_progressive: bool
+    jpeg_subsampling: Optional[str]
+
+    def save_options(self, image_format: str) -> Dict[str, Any]:
+        """PIL save keyword arguments for ``image_format`` ("PNG" or "JPEG")."""
+        if image_format == "PNG":
+            if self.png_optimize:
+                return {"optimize": True}
+            return {"compress_level": self.png_compress_level}
+        if image_format == "JPEG":
+            options: Dict[str, Any] = {
+                "optimize": self.jpeg_optimize,
+                "progressive": self.jpeg_progressive,
+            }
+            if self.jpeg_subsampling is not None:
+                options["subsampling"] = self.jpeg_subsampling
+            return options
+        return {}
+
+
+ENCODE_PROFILES: Dict[str, EncodeProfile] = {
+    "draft": EncodeProfile("draft", 1, False, False, False, "4:2:0"),
+    "fast": EncodeProfile("fast", 3, False, False, False, None),
+    "balanced": EncodeProfile("balanced", 6, False, True, False, None),
+    "archival": EncodeProfile("archival", 9, True, True, True, None),
+}
+
+PURPOSES = ("delivery", "mockup", "working")
+
+DEFAULT_PURPOSE_PROFILES: Dict[str, str] = {
+    "delivery": "archival",
+    "mockup": "balanced",
+    "working": "fast",
+}
+
+_FORMATS_BY_EXTENSION = {".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG"}
+
+_active_profiles: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "active_encode_profiles", default=None
+)
+
+
+def get_encode_profile(name: str) -> EncodeProfile:
+    """Look up a profile by name.
+
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    try:
+        return ENCODE_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown encode profile: {name}. Must be one of {', '.join(ENCODE_PROFILES)}"
+        ) from None
+
+
+def profile_for(purpose: str) -> EncodeProfile:
+    """Profile currently selected for a purpose."""
+    if purpose not in PURPOSES:
+        raise ValueError(f"Unknown encode purpose: {purpose}. Must be one of {', '.join(PURPOSES)}")
+    active = _active_profiles.get() or DEFAULT_PURPOSE_PROFILES
+    return get_encode_profile(active.get(purpose, DEFAULT_PURPOSE_PROFILES[purpose]))
+
+
+@contextmanager
+def encode_profiles(profiles: Dict[str, str]) -> Iterator[None]:
+    """Use the given purpose -> profile name mapping for saves in this context."""
+    for name in profiles.values():
+        get_encode_profile(name)
+    token = _active_profiles.set({**DEFAULT_PURPOSE_PROFILES, **profiles})
+    try:
+        yield
+    finally:
+        _active_profiles.reset(token)
+
+
+def save_image(
+    image: Image.Image,
+    path: str,
+    image_format: Optional[str] = None,
+    purpose: str = "mockup",
+    profile: Optional[str] = None,
+    **options: Any,
+) -> None:
+    """Save an image with the encoder settings of the active profile.
+
+    Args:
+        image: Image to save
+        path: Output path
+        image_format: "PNG" or "JPEG" (default: from the file extension)
+        purpose: "delivery", "mockup" or "working"
+        profile: Explicit profile name, overriding the purpose lookup
+        **options: Other PIL save options (quality, dpi, ...). ``quality``
+            is dropped for PNG, which does not use it.
+    """
+    image_format = (
+        image_format or _FORMATS_BY_EXTENSION.get(os.path.splitext(path)[1].lower(), "PNG")
+    ).upper()
+    if image_format == "JPG":
+        image_format = "JPEG"
+
+    encode_profile = get_encode_profile(profile) if profile else profile_for(purpose)
+    if image_format == "PNG":
+        options.pop("quality", None)
+    elif image_format == "JPEG" and image.mode not in ("RGB", "L", "CMYK"):
+        image = image.convert("RGB")
+
+    options = {**options, **encode_profile.save_options(image_format)}
+    image.save(path, image_format, **options)
+    invalidate_path(path)
@@ -2,8 +2,11 @@
 Shared image processing utilities for pattern and clipart mockups.
 """
 
+from functools import lru_cache
 from typing import List, Tuple, Optional
-from PIL import Image, ImageDraw
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
 
 from utils.common import setup_logging, get_resampling_filter
 
@@ -153,6 +156,81 @@ def create_grid(
         return canvas
 
 
+# Shadows are low-frequency: blurs of at least this many pixels per step
+# are computed on an alpha mask reduced by up to SHADOW_MAX_SCALE and
+# upsampled afterwards
+SHADOW_MIN_SCALED_RADIUS = 2
+SHADOW_MAX_SCALE = 4
+
+
+def _shadow_scale(blur_radius: float) -> int:
+    return max(1, min(SHADOW_MAX_SCALE, int(blur_radius // SHADOW_MIN_SCALED_RADIUS)))
+
+
+def shadow_mask(alpha: Image.Image, blur_radius: float, opacity: int = 255) -> Image.Image:
+    """
+    Blur an alpha mask into a drop-shadow mask of the same size.
+
+    Large blurs are computed at reduced resolution (``Image.reduce``, blur,
+    bilinear upsample), which is visually identical for a soft shadow and
+    several times faster than blurring at full size.
+
+    Args:
+        alpha: "L" mask of the shape casting the shadow
+        blur_radius: Gaussian blur radius in full-resolution pixels
+        opacity: Shadow opacity (0-255) where the shape is opaque
+
+    Returns:
+        "L" mask to paste the shadow color through
+    """
+    if alpha.mode != "L":
+        alpha = alpha.convert("L")
+    scale = _shadow_scale(blur_radius)
+    if scale > 1:
+        small = alpha.reduce(scale).filter(ImageFilter.GaussianBlur(blur_radius / scale))
+        mask = small.resize(alpha.size, Image.BILINEAR)
+    elif blur_radius > 0:
+        mask = alpha.filter(ImageFilter.GaussianBlur(blur_radius))
+    else:
+        mask = alpha.copy()
+    if opacity < 255:
+        mask = mask.point([value * opacity // 255 for value in range(256)])
+    return mask
+
+
+@lru_cache(maxsize=16)
+def _rect_shadow_mask(
+    size: Tuple[int, int], angle: float, blur_radius: float, opacity: int
+) -> Image.Image:
+    alpha = Image.new("L", size, 255)
+    if angle:
+        alpha = alpha.rotate(angle, expand=True, resample=Image.BICUBIC)
+    return shadow_mask(alpha, blur_radius, opacity)
+
+
+def rect_shadow_mask(
+    size: Tuple[int, int], angle: float = 0, blur_radius: float = 0, opacity: int = 255
+) -> Image.Image:
+    """
+    Shadow mask of an opaque rectangle, optionally rotated, cached per arguments.
+
+    Matches the alpha of an opaque ``size`` image rotated with
+    ``rotate(angle, expand=True, resample=Image.BICUBIC)``, so layered
+    mockups can reuse one shadow for every image with the same size and
+    rotation.
+
+    Args:
+        size: Rectangle (width, height) before rotation
+        angle: Rotation in degrees counter-clockwise
+        blur_radius: Gaussian blur radius
+        opacity: Shadow opacity (0-255)
+
+    Returns:
+        Copy-on-write view of the cached "L" mask (see ``readonly_view``)
+    """
+    return readonly_view(_rect_shadow_mask(tuple(size), angle, blur_radius, opacity))
+
+
 def apply_shadow(
     image: Image.Image,
     shadow_color: Tuple[int, int, int, int] = (0, 0, 0, 100),
@@ -162,6 +240,9 @@ def apply_shadow(
     """
     Apply a drop shadow to an image.
 
+    The shadow follows the image's alpha channel (or its rectangle if it
+    has none) and is blurred with ``shadow_mask``.
+
     Args:
         image: PIL Image to apply shadow to
         shadow_color: RGBA shadow color
@@ -188,25 +269,221 @@ def apply_shadow(
     shadow_x = img_x + offset[0]
     shadow_y = img_y + offset[1]
     
-    # Create a new transparent image
-    result = Image.new("RGBA", (new_width, new_height), (0, 0, 0, 0))
-    
-    # Create the shadow
-    shadow = Image.new("RGBA", image.size, shadow_color)
-    
-    # Apply blur to the shadow (if PIL supports it)
-    try:
-        from PIL import ImageFilter
-        shadow = shadow.filter(ImageFilter.GaussianBlur(blur_radius))
-    except (ImportError, AttributeError):
-        # Skip blur if not supported
-        pass
-    
-    # Paste the shadow and then the image
-    result.paste(shadow, (shadow_x, shadow_y), shadow)
-    result.paste(image, (img_x, img_y), image)
+    # Shadow shape on the padded canvas, so the blur can spread past the image
+    shape = Image.new("L", (new_width, new_height), 0)
+    if "A" in image.getbands():
+        shape.paste(image.getchannel("A"), (shadow_x, shadow_y))
+    else:
+        shape.paste(255, (shadow_x, shadow_y, shadow_x + width, shadow_y + height))
+
+    # Create the shadow and paste the image over it
+    result = Image.new("RGBA", (new_width, new_height), tuple(shadow_color[:3]) + (0,))
+    result.putalpha(shadow_mask(shape, blur_radius, shadow_color[3]))
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    result.alpha_composite(image, (img_x, img_y))
     
     return result
 
 
+Box = Tuple[int, int, int, int]
+
+
+def _clip_box(canvas: Image.Image, box: Box) -> Optional[Box]:
+    left, top = max(0, box[0]), max(0, box[1])
+    right, bottom = min(canvas.width, box[2]), min(canvas.height, box[3])
+    if right <= left or bottom <= top:
+        return None
+    return left, top, right, bottom
+
+
+def composite_region(
+    canvas: Image.Image, overlay: Image.Image, position: Tuple[int, int] = (0, 0)
+) -> Optional[Box]:
+    """
+    Alpha-composite an element onto a canvas in place, touching only its bounding box.
+
+    Unlike converting the whole canvas to RGBA, compositing a full-size
+    layer and converting back, only the pixels under the element are
+    converted and blended. Parts of the element outside the canvas are
+    clipped.
+
+    Args:
+        canvas: RGB, RGBA or L canvas, modified in place
+        overlay: Element to composite (converted to RGBA if needed)
+        position: Top-left corner of the element on the canvas
+
+    Returns:
+        The dirty rectangle (left, top, right, bottom) that changed, or
+        None if the element lies outside the canvas
+    """
+    x, y = position
+    box = _clip_box(canvas, (x, y, x + overlay.width, y + overlay.height))
+    if box is None:
+        return None
+    if overlay.mode != "RGBA":
+        overlay = overlay.convert("RGBA")
+    if box != (x, y, x + overlay.width, y + overlay.height):
+        overlay = overlay.crop((box[0] - x, box[1] - y, box[2] - x, box[3] - y))
+
+    if canvas.mode == "RGBA":
+        canvas.alpha_composite(overlay, box[:2])
+    else:
+        region = canvas.crop(box).convert("RGBA")
+        region.alpha_composite(overlay)
+        canvas.paste(region.convert(canvas.mode), box[:2])
+    return box
+
+
+def fill_region(canvas: Image.Image, box: Box, color: Tuple[int, ...]) -> Optional[Box]:
+    """
+    Composite a solid, possibly translucent color over a rectangle of a canvas in place.
+
+    Used for frames, flat shadows and tint overlays instead of building a
+    full-size RGBA layer for them. The result is the same as
+    alpha-compositing a layer filled with ``color`` over the box.
+
+    Args:
+        canvas: RGB or RGBA canvas, modified in place
+        box: Rectangle (left, top, right, bottom), right/bottom exclusive
+        color: RGB or RGBA color; the alpha is the opacity of the fill
+
+    Returns:
+        The dirty rectangle that changed, or None if the box lies outside
+        the canvas
+    """
+    box = _clip_box(canvas, box)
+    if box is None:
+        return None
+    alpha = color[3] if len(color) == 4 else 255
+    if alpha <= 0:
+        return None
+    size = (box[2] - box[0], box[3] - box[1])
+    if canvas.mode == "RGBA":
+        if alpha >= 255:
+            canvas.paste(tuple(color[:3]) + (255,), box)
+        else:
+            canvas.alpha_composite(Image.new("RGBA", size, tuple(color[:3]) + (alpha,)), box[:2])
+    elif alpha >= 255:
+        canvas.paste(tuple(color[:3]), box)
+    else:
+        # Pasting through a constant mask is the same blend on an opaque canvas
+        canvas.paste(tuple(color[:3]), box, Image.new("L", size, alpha))
+    return box
+
+
+def tile_image(
+    tile: Image.Image,
+    size: Tuple[int, int],
+    offset: Tuple[int, int] = (0, 0),
+    step: Optional[Tuple[int, int]] = None,
+) -> Image.Image:
+    """
+    Fill an image of the given size by repeating a tile.
+
+    The tile is placed once into a cell of ``step`` size and the cell is
+    repeated with ``numpy.tile``, so the cost does not depend on the number
+    of tile positions. The result can be pasted onto a canvas in a single
+    call (use it as its own mask to get the same result as pasting every
+    tile with its alpha).
+
+    Args:
+        tile: Tile image (L, RGB or RGBA; other modes are converted to RGBA)
+        size: Output (width, height)
+        offset: Position of one tile's top-left corner; the tiling repeats
+            from there in both directions, so negative offsets shift the
+            pattern up/left
+        step: Distance between tile origins, defaults to the tile size.
+            Gaps between smaller tiles are left empty (transparent for
+            RGBA), and tiles larger than the step are cropped to it.
+
+    Returns:
+        New image of the requested size in the tile's mode
+    """
+    if tile.mode not in ("L", "RGB", "RGBA"):
+        tile = tile.convert("RGBA")
+
+    step_w, step_h = step or tile.size
+    if tile.size != (step_w, step_h):
+        cell = Image.new(tile.mode, (step_w, step_h))
+        cell.paste(tile.crop((0, 0, min(tile.width, step_w), min(tile.height, step_h))), (0, 0))
+        tile = cell
+
+    width, height = size
+    start_x = -offset[0] % step_w
+    start_y = -offset[1] % step_h
+    reps_x = -(-(width + start_x) // step_w)
+    reps_y = -(-(height + start_y) // step_h)
+
+    cell_array = np.asarray(tile)
+    reps = (reps_y, reps_x) + (1,) * (cell_array.ndim - 2)
+    tiled = np.tile(cell_array, reps)[start_y : start_y + height, start_x : start_x + width]
+
+    return Image.frombuffer(
+        tile.mode, (width, height), np.ascontiguousarray(tiled), "raw", tile.mode, 0, 1
+    )
+
+
 # Removed duplicate watermarking functions - use utils.common.apply_watermark() instead
+
+
+def readonly_view(image: Image.Image) -> Image.Image:
+    """
+    Return a copy-on-write view of an image.
+
+    The view shares the pixels of ``image`` and is marked read-only, so PIL
+    copies the pixels before the first in-place change (paste, putalpha,
+    ImageDraw). Use it to hand out cached images without copying them for
+    callers that only read.
+
+    Args:
+        image: Image to share
+
+    Returns:
+        New Image object sharing the pixels of ``image``
+    """
+    view = image._new(image.im)
+    view.readonly = 1
+    return view
+
+
+@lru_cache(maxsize=16)
+def _checkerboard(
+    size: Tuple[int, int],
+    cell_size: int,
+    color1: Tuple[int, int, int, int],
+    color2: Tuple[int, int, int, int],
+) -> Image.Image:
+    width, height = size
+    rows = (np.arange(height) // cell_size) % 2
+    cols = (np.arange(width) // cell_size) % 2
+    palette = np.array([color1, color2], dtype=np.uint8)
+    return Image.fromarray(palette[rows[:, None] ^ cols[None, :]], "RGBA")
+
+
+def checkerboard(
+    size: Tuple[int, int],
+    cell_size: int = 30,
+    color1: Tuple[int, ...] = (255, 255, 255),
+    color2: Tuple[int, ...] = (200, 200, 200),
+) -> Image.Image:
+    """
+    Create a checkerboard of two colors, starting with ``color1`` at the top left.
+
+    The board is built with NumPy index arithmetic and cached per size,
+    cell size and colors; the result is a copy-on-write view of the cached
+    board (see ``readonly_view``).
+
+    Args:
+        size: Output (width, height)
+        cell_size: Edge length of one square in pixels
+        color1: RGB or RGBA color of the top-left square
+        color2: RGB or RGBA color of the other squares
+
+    Returns:
+        RGBA checkerboard image
+    """
+    color1 = tuple(color1) + (255,) * (4 - len(color1))
+    color2 = tuple(color2) + (255,) * (4 - len(color2))
+    board = _checkerboard(tuple(size), max(1, int(cell_size)), color1, color2)
+    return readonly_view(board)
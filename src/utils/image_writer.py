@@ -0,0 +1,228 @@
+"""
+Background image writer.
+
+Encoding a finished mockup (PNG compression in particular) takes as long
+as building it, and until now every producer waited for ``Image.save``
+before starting on the next image. ``ImageWriteQueue`` takes finished
+images and encodes them on a small thread pool instead; PIL releases the
+GIL while compressing, so producers keep working in the meantime.
+
+- Pending writes are bounded: ``submit`` blocks once ``max_pending``
+  images are waiting, so a slow disk applies back-pressure instead of
+  holding every image in memory.
+- Files are written under a hidden temporary name, fsynced and renamed
+  into place, so readers never see a half-written image.
+- Encode settings are resolved when the image is submitted, because pool
+  threads do not inherit the caller's active encode profiles.
+
+``BaseProcessor`` activates a queue for each workflow run with
+``image_writes``. Library code calls ``write_image``, which queues the
+image when a writer is active and saves synchronously otherwise. Each
+workflow step drains the queue before it finishes and reports the
+outcome under ``"writes"`` in its result.
+
+Always import this module as ``src.utils.image_writer`` so the active
+writer is shared.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from PIL import Image
+
+from src.utils.folder_inventory import invalidate_path
+from src.utils.image_encoding import profile_for, save_image
+
+WRITE_TEMP_MARKER = ".writing"
+
+_active_writer: ContextVar[Optional["ImageWriteQueue"]] = ContextVar(
+    "active_image_writer", default=None
+)
+
+
+def _temp_path(path: str) -> str:
+    # Hidden so folder listings skip it; the extension is kept so the
+    # format is still inferred from the name
+    folder, name = os.path.split(path)
+    root, ext = os.path.splitext(name)
+    return os.path.join(folder, f".{root}{WRITE_TEMP_MARKER}{ext}")
+
+
+class ImageWriteQueue:
+    """Bounded queue of images encoded and written on background threads.
+
+    The caller hands over ownership of a submitted image and must not
+    modify it afterwards.
+
+    Args:
+        max_workers: Encoder threads
+        max_pending: Images queued or being written before ``submit`` blocks
+        fsync: Flush each file to disk before renaming it into place
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 4, fsync: bool = True):
+        self.fsync = fsync
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[Future, str, Optional[str]]] = []
+        self._collectors: List[List[Future]] = []
+
+    def submit(
+        self,
+        image: Image.Image,
+        path: str,
+        image_format: Optional[str] = None,
+        purpose: str = "mockup",
+        profile: Optional[str] = None,
+        tag: Optional[str] = None,
+        **options: Any,
+    ) -> "Future[int]":
+        """Queue an image for writing, blocking while the queue is full.
+
+        Args:
+            image: Finished image
+            path: Output path
+            image_format: "PNG" or "JPEG" (default: from the file extension)
+            purpose: Encode purpose ("delivery", "mockup" or "working")
+            profile: Explicit encode profile name, overriding the purpose
+            tag: Label to group writes by in ``drain`` (e.g. the source file)
+            **options: Other PIL save options (quality, dpi, ...)
+
+        Returns:
+            Future resolving to the number of bytes written
+        """
+        profile = profile or profile_for(purpose).name
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write, image, path, image_format, profile, options)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._pending.append((future, path, tag))
+            for futures in self._collectors:
+                futures.append(future)
+        return future
+
+    @contextmanager
+    def collect(self) -> Iterator[List["Future[int]"]]:
+        """Collect the futures of every write submitted while the block runs.
+
+        Writes submitted from any thread are included, so worker threads
+        started inside the block are covered too.
+        """
+        futures: List[Future] = []
+        with self._lock:
+            self._collectors.append(futures)
+        try:
+            yield futures
+        finally:
+            with self._lock:
+                self._collectors.remove(futures)
+
+    def _write(
+        self,
+        image: Image.Image,
+        path: str,
+        image_format: Optional[str],
+        profile: str,
+        options: Dict[str, Any],
+    ) -> int:
+        temp_path = _temp_path(path)
+        try:
+            save_image(image, temp_path, image_format, profile=profile, **options)
+            if self.fsync:
+                with open(temp_path, "rb") as f:
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+            invalidate_path(path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return os.path.getsize(path)
+
+    def drain(self) -> Dict[str, Any]:
+        """Wait for every write submitted so far and summarize them.
+
+        Returns:
+            Dict with the number of writes queued and written, bytes written,
+            the files written per tag and an error message per failed write
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        summary: Dict[str, Any] = {"queued": len(pending), "written": 0, "bytes_written": 0, "errors": []}
+        by_tag: Dict[str, int] = {}
+        for future, path, tag in pending:
+            try:
+                summary["bytes_written"] += future.result()
+            except Exception as e:
+                summary["errors"].append(f"{os.path.basename(path)}: {e}")
+                continue
+            summary["written"] += 1
+            if tag is not None:
+                by_tag[tag] = by_tag.get(tag, 0) + 1
+        if by_tag:
+            summary["written_by_tag"] = by_tag
+        return summary
+
+    def close(self) -> Dict[str, Any]:
+        """Drain the queue and stop the encoder threads."""
+        summary = self.drain()
+        self._executor.shutdown()
+        return summary
+
+    def __enter__(self) -> "ImageWriteQueue":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def active_writer() -> Optional[ImageWriteQueue]:
+    """The writer ``write_image`` currently routes through, if any."""
+    return _active_writer.get()
+
+
+@contextmanager
+def image_writes(writer: ImageWriteQueue) -> Iterator[ImageWriteQueue]:
+    """Route ``write_image`` calls in this context through ``writer``."""
+    token = _active_writer.set(writer)
+    try:
+        yield writer
+    finally:
+        _active_writer.reset(token)
+
+
+def write_image(
+    image: Image.Image,
+    path: str,
+    image_format: Optional[str] = None,
+    purpose: str = "mockup",
+    **options: Any,
+) -> "Future[int]":
+    """Write a finished image through the active writer, if there is one.
+
+    Only use this for final outputs that nothing reads back before the
+    current workflow step ends; use ``save_image`` otherwise. Without an
+    active writer the image is saved synchronously and save errors are
+    raised here as before.
+
+    Returns:
+        Future resolving to the number of bytes written
+    """
+    writer = _active_writer.get()
+    if writer is not None:
+        return writer.submit(image, path, image_format, purpose, **options)
+
+    save_image(image, path, image_format, purpose, **options)
+    future: "Future[int]" = Future()
+    future.set_result(os.path.getsize(path))
+    return future
@@ -3,12 +3,10 @@ Shared utilities for creating main mockups across different product types.
 """
 
 import os
-import glob
 from typing import Optional, Dict, Tuple
 from PIL import Image
 
 from src.utils.common import setup_logging, ensure_dir_exists
-from src.utils.common import get_project_root
 from src.utils.color_utils import extract_colors_from_images
 from src.utils.image_utils import resize_image
 from src.products.pattern.dynamic_main_mockup import (
@@ -18,6 +16,9 @@ from src.products.pattern.dynamic_main_mockup import (
 from src.utils.text_utils import create_text_backdrop
 from PIL import ImageDraw
 from src.utils.text_utils import draw_text, calculate_text_dimensions, get_font
+from src.utils.asset_cache import load_asset
+from src.utils.folder_inventory import list_files
+from src.utils.image_writer import write_image
 
 logger = setup_logging(__name__)
 
@@ -99,7 +100,7 @@ def create_shared_main_mockup(
     ensure_dir_exists(output_folder)
 
     # Find all images in the input folder
-    images = sorted(glob.glob(os.path.join(input_folder, "*.[jp][pn][g]")))
+    images = list_files(input_folder, [".jpg", ".png"])
     if not images:
         logger.warning(f"No images found in {input_folder} for main mockup.")
         return None
@@ -118,27 +119,24 @@ def create_shared_main_mockup(
     total_spacing_x = grid_width - (avg_cell_width * grid_cols)
     spacing_between_x = total_spacing_x / (grid_cols + 1) if grid_cols > 0 else 0
 
-    # Load shadow - use correct path to assets
-    # This file is in src/utils/, so we go up two levels to get to project root
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    shadow_path = os.path.join(project_root, "assets", "shadow.png")
+    # Load shadow (cached per process, with one variant per cell height)
     shadow = None
     shadow_new_width = 0
+    shadow_img = load_asset("shadow.png")
 
-    if os.path.exists(shadow_path):
+    if shadow_img is not None:
         try:
-            shadow_img = Image.open(shadow_path).convert("RGBA")
             scale_factor = (
                 cell_height / shadow_img.height if shadow_img.height > 0 else 1
             )
             shadow_new_width = int(shadow_img.width * scale_factor)
 
             if shadow_new_width > 0 and cell_height > 0:
-                shadow = resize_image(shadow_img, shadow_new_width, cell_height)
+                shadow = load_asset(
+                    "shadow.png", size=(shadow_new_width, cell_height), fit=True
+                )
         except Exception as e:
-            logger.warning(f"Error loading or resizing shadow: {e}. Skipping shadow.")
+            logger.warning(f"Error resizing shadow: {e}. Skipping shadow.")
 
     # First pass: Draw images
     image_positions_for_shadow = []
@@ -233,7 +231,7 @@ def create_shared_main_mockup(
     # Save final image
     try:
         save_path = os.path.join(output_folder, output_filename)
-        final_image.save(save_path, "PNG")
+        write_image(final_image, save_path, "PNG")
         logger.info(f"Shared main mockup saved: {save_path}")
         return save_path
     except Exception as e:
@@ -4,13 +4,19 @@ Unified image resizing utilities for all product types.
 
 import os
 import re
-from typing import Tuple, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Tuple, Dict, List, Optional
 from PIL import Image
 
 from src.utils.common import setup_logging, get_resampling_filter, ensure_dir_exists
+from src.utils.folder_inventory import invalidate_path, list_files, list_subfolders
+from src.utils.image_encoding import profile_for, save_image
 
 logger = setup_logging(__name__)
 
+# Suffix of in-progress outputs; they are renamed over the target when complete
+TEMP_SUFFIX = ".resize.tmp"
+
 
 def extract_number_from_filename(filename: str) -> int:
     """
@@ -74,6 +80,7 @@ def safe_remove_file(file_path: str) -> bool:
     """
     try:
         os.remove(file_path)
+        invalidate_path(file_path)
         return True
     except Exception as e:
         logger.error(f"Error removing file {file_path}: {e}")
@@ -119,12 +126,93 @@ def get_existing_numbers(folder_path: str, safe_folder_name: str) -> set:
     return existing_numbers
 
 
+def temp_output_path(target_path: str) -> str:
+    """Hidden temp file next to ``target_path`` used while it is being written."""
+    folder, name = os.path.split(target_path)
+    return os.path.join(folder, f".{name}{TEMP_SUFFIX}")
+
+
+def remove_stale_temp_files(folder_path: str) -> int:
+    """Delete temp outputs left behind by an interrupted resize."""
+    removed = 0
+    for filename in os.listdir(folder_path):
+        if filename.startswith(".") and filename.endswith(TEMP_SUFFIX):
+            if safe_remove_file(os.path.join(folder_path, filename)):
+                removed += 1
+    return removed
+
+
+def _resize_image_task(
+    style: str,
+    max_size: Any,
+    dpi: Tuple[int, int],
+    source_path: str,
+    temp_path: str,
+    profile: str,
+) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Decode, prepare, resize and encode one image into ``temp_path``.
+    
+    Runs in a worker process, so it only takes picklable arguments and
+    gets the encode profile by name. The source file is never modified.
+    
+    Returns:
+        Original size and output size
+    
+    Raises:
+        ValueError: If the image is empty after trimming
+    """
+    resizer = ImageResizer(max_size=max_size, dpi=dpi, workers=1)
+    with Image.open(source_path) as img:
+        original_size = img.size
+        
+        if style == "clipart":
+            # Ensure proper transparency handling
+            if img.mode not in ("RGBA", "LA"):
+                img = img.convert("RGBA")
+            img = trim_image(img)
+            if img.size == (0, 0):
+                raise ValueError("invalid size after trim")
+        
+        if resizer.should_resize(img):
+            img = img.resize(resizer.calculate_new_size(img.size), get_resampling_filter())
+        
+        if style == "clipart":
+            # Save with proper transparency preservation
+            save_image(img, temp_path, "PNG", profile=profile, dpi=dpi)
+        else:
+            if hasattr(img, "info"):
+                img.info["dpi"] = dpi
+            save_image(img, temp_path, "JPEG", profile=profile, dpi=dpi, quality=85)
+        
+        return original_size, img.size
+
+
 class ImageResizer:
-    """Unified image resizer for all product types."""
+    """Unified image resizer for all product types.
+    
+    Images in a folder are independent apart from their output names, so
+    names are assigned up front and the decode/trim/resize/encode work runs
+    on a process pool. Every output is written to a temp file and renamed
+    into place, and originals are only deleted once all outputs of the
+    folder are in place, so a crash never leaves half-written images or
+    loses a source.
+    
+    Args:
+        max_size: Maximum width/height in pixels (int or (width, height))
+        dpi: DPI stored in the output files
+        workers: Worker processes (default one per CPU; 1 resizes in-process)
+    """
     
-    def __init__(self, max_size: int = 3600, dpi: Tuple[int, int] = (300, 300)):
+    def __init__(
+        self,
+        max_size: int = 3600,
+        dpi: Tuple[int, int] = (300, 300),
+        workers: Optional[int] = None,
+    ):
         self.max_size = max_size
         self.dpi = dpi
+        self.workers = workers or os.cpu_count() or 1
         self.supported_extensions = [".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".webp"]
     
     def should_resize(self, image: Image.Image) -> bool:
@@ -160,16 +248,7 @@ class ImageResizer:
     
     def get_image_files(self, folder_path: str) -> List[str]:
         """Get all image files in a folder."""
-        if not os.path.exists(folder_path):
-            return []
-        
-        image_files = []
-        for ext in self.supported_extensions:
-            image_files.extend([
-                os.path.join(folder_path, f)
-                for f in os.listdir(folder_path)
-                if f.lower().endswith(ext) and os.path.isfile(os.path.join(folder_path, f))
-            ])
+        image_files = list_files(folder_path, self.supported_extensions)
         
         # Sort by extracted number from filename
         return sorted(image_files, key=lambda x: extract_number_from_filename(os.path.basename(x)))
@@ -199,8 +278,7 @@ class ImageResizer:
         }
         
         # Check for subfolders or process current folder
-        subfolders = [d for d in os.listdir(input_folder) 
-                     if os.path.isdir(os.path.join(input_folder, d)) and d not in ["mocks", "zipped"]]
+        subfolders = [d for d in list_subfolders(input_folder) if d not in ["mocks", "zipped"]]
         
         if not subfolders:
             # Process images directly in folder
@@ -246,8 +324,7 @@ class ImageResizer:
         }
         
         # Check for subfolders or process current folder
-        subfolders = [d for d in os.listdir(input_folder) 
-                     if os.path.isdir(os.path.join(input_folder, d)) and d not in ["mocks", "zipped", "videos"]]
+        subfolders = [d for d in list_subfolders(input_folder) if d not in ["mocks", "zipped", "videos"]]
         
         if not subfolders:
             # Process images directly in folder
@@ -267,9 +344,113 @@ class ImageResizer:
         
         return results
     
+    def _run_resize_tasks(
+        self, style: str, tasks: List[Tuple[str, str]]
+    ) -> List[Tuple[Optional[Tuple], Optional[Exception]]]:
+        """
+        Resize ``(source_path, target_path)`` pairs into their temp files.
+        
+        Returns:
+            ``(sizes, error)`` per task, in task order
+        """
+        profile = profile_for("delivery").name
+        args = [
+            (style, self.max_size, self.dpi, source, temp_output_path(target), profile)
+            for source, target in tasks
+        ]
+        workers = min(self.workers, len(tasks))
+        outcomes: List[Tuple[Optional[Tuple], Optional[Exception]]] = []
+        
+        if workers <= 1:
+            for task_args in args:
+                try:
+                    outcomes.append((_resize_image_task(*task_args), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+            return outcomes
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_resize_image_task, *task_args) for task_args in args]
+            for future in futures:
+                try:
+                    outcomes.append((future.result(), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+        return outcomes
+    
+    def _commit_outputs(
+        self,
+        tasks: List[Tuple[str, str]],
+        outcomes: List[Tuple[Optional[Tuple], Optional[Exception]]],
+    ) -> Dict:
+        """
+        Rename finished temp files over their targets, then delete originals.
+        
+        Outputs that would overwrite the source of a failed image are
+        dropped so that source is kept. A target can be the source of
+        another task (``a.png -> folder_1.png`` while ``folder_1.png ->
+        folder_2.png``), so that task's output is committed first and a
+        crash part-way never leaves a source replaced before its own
+        output is in place.
+        
+        Returns:
+            Dictionary with processed, errors and deleted counts
+        """
+        processed = errors = deleted = 0
+        failed_sources = {
+            os.path.abspath(source)
+            for (source, _), (_, error) in zip(tasks, outcomes)
+            if error is not None
+        }
+        
+        remaining: List[Tuple[str, str, Tuple]] = []
+        for (source, target), (sizes, error) in zip(tasks, outcomes):
+            if error is None and os.path.abspath(target) in failed_sources:
+                error = RuntimeError(f"{os.path.basename(target)} would replace a failed source")
+            if error is not None:
+                logger.error(f"Error processing {source}: {error}")
+                temp_path = temp_output_path(target)
+                if os.path.exists(temp_path):
+                    safe_remove_file(temp_path)
+                errors += 1
+                continue
+            remaining.append((source, target, sizes))
+        
+        committed: List[Tuple[str, str]] = []
+        while remaining:
+            # Sources still waiting for their own output must not be overwritten
+            needed = {
+                os.path.abspath(source)
+                for source, target, _ in remaining
+                if os.path.abspath(source) != os.path.abspath(target)
+            }
+            ready = [task for task in remaining if os.path.abspath(task[1]) not in needed]
+            if not ready:
+                # Only a cycle of renames is left; names are assigned in
+                # natural order, so this does not happen in practice
+                ready = remaining
+            for source, target, (original_size, new_size) in ready:
+                os.replace(temp_output_path(target), target)
+                invalidate_path(target)
+                committed.append((source, target))
+                processed += 1
+                resized = f" (resized from {original_size} to {new_size})" if original_size != new_size else ""
+                logger.info(f"Processed {os.path.basename(source)} -> {os.path.basename(target)}{resized}")
+            remaining = [task for task in remaining if task not in ready]
+        
+        targets = {os.path.abspath(target) for _, target in committed}
+        for source, _ in committed:
+            # Remove original unless an output now lives under its name
+            if os.path.abspath(source) not in targets:
+                if safe_remove_file(source):
+                    deleted += 1
+        
+        return {"processed": processed, "errors": errors, "deleted": deleted}
+    
     def _process_clipart_folder(self, folder_path: str, folder_name: str) -> Dict:
         """Process a single folder for clipart-style resizing."""
         logger.info(f"Processing clipart folder: {folder_name}")
+        remove_stale_temp_files(folder_path)
         
         image_files = self.get_image_files(folder_path)
         if not image_files:
@@ -277,59 +458,18 @@ class ImageResizer:
             return {"processed": 0, "errors": 0, "deleted": 0}
         
         safe_folder_name = re.sub(r"[^a-zA-Z0-9_]", "_", folder_name)
-        processed = errors = deleted = 0
+        tasks = [
+            (image_path, os.path.join(folder_path, f"{safe_folder_name}_{i}.png"))
+            for i, image_path in enumerate(image_files, start=1)
+        ]
         
-        for i, image_path in enumerate(image_files, start=1):
-            try:
-                original_filename = os.path.basename(image_path)
-                target_name = f"{safe_folder_name}_{i}.png"
-                target_path = os.path.join(folder_path, target_name)
-                
-                logger.info(f"Processing {original_filename} -> {target_name}")
-                
-                with Image.open(image_path) as img:
-                    # Ensure proper transparency handling
-                    if img.mode not in ("RGBA", "LA"):
-                        if img.mode == "P" and "transparency" in img.info:
-                            # Convert palette images with transparency to RGBA
-                            img = img.convert("RGBA")
-                        elif img.mode in ("RGB", "L"):
-                            # Convert RGB/L to RGBA to support transparency
-                            img = img.convert("RGBA")
-                        else:
-                            img = img.convert("RGBA")
-                    
-                    img = trim_image(img)
-                    
-                    if img.size == (0, 0):
-                        logger.warning(f"Skipping {original_filename} - invalid size after trim")
-                        errors += 1
-                        continue
-                    
-                    if self.should_resize(img):
-                        new_size = self.calculate_new_size(img.size)
-                        logger.info(f"Resizing from {img.size} to {new_size}")
-                        img = img.resize(new_size, get_resampling_filter())
-                    
-                    # Save with proper transparency preservation
-                    img.save(target_path, format="PNG", dpi=self.dpi, optimize=True)
-                    
-                    # Remove original if different from target
-                    if os.path.abspath(target_path) != os.path.abspath(image_path):
-                        if safe_remove_file(image_path):
-                            deleted += 1
-                    
-                    processed += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing {image_path}: {e}")
-                errors += 1
-        
-        return {"processed": processed, "errors": errors, "deleted": deleted}
+        outcomes = self._run_resize_tasks("clipart", tasks)
+        return self._commit_outputs(tasks, outcomes)
     
     def _process_pattern_folder(self, folder_path: str, folder_name: str) -> Dict:
         """Process a single folder for pattern-style resizing."""
         logger.info(f"Processing pattern folder: {folder_name}")
+        remove_stale_temp_files(folder_path)
         
         image_files = self.get_image_files(folder_path)
         if not image_files:
@@ -339,12 +479,6 @@ class ImageResizer:
         safe_folder_name = re.sub(r"[^a-zA-Z0-9_]", "_", folder_name).lower()
         existing_numbers = get_existing_numbers(folder_path, safe_folder_name)
         
-        # Find next available number
-        next_number = 1
-        while next_number in existing_numbers:
-            next_number += 1
-        
-        processed = 0
         files_to_process = []
         
         # Check which files need processing
@@ -367,33 +501,16 @@ class ImageResizer:
             logger.info(f"All files in {folder_name} are already correctly processed")
             return {"processed": 0}
         
+        # Assign output names up front, skipping numbers already in use
+        tasks = []
+        next_number = 1
         for image_path in files_to_process:
-            try:
-                original_filename = os.path.basename(image_path)
-                new_filename = f"{safe_folder_name}_{next_number}.jpg"
-                new_path = os.path.join(folder_path, new_filename)
-                
-                logger.info(f"Processing {original_filename} -> {new_filename}")
-                
-                with Image.open(image_path) as img:
-                    if self.should_resize(img):
-                        new_size = self.calculate_new_size(img.size)
-                        logger.info(f"Resizing from {img.size} to {new_size}")
-                        img = img.resize(new_size, get_resampling_filter())
-                    
-                    if hasattr(img, "info"):
-                        img.info["dpi"] = self.dpi
-                    
-                    img.save(new_path, format="JPEG", dpi=self.dpi, quality=85, optimize=True)
-                    
-                    # Remove original if different
-                    if image_path != new_path:
-                        safe_remove_file(image_path)
-                    
-                    processed += 1
-                    next_number += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing {image_path}: {e}")
-        
-        return {"processed": processed}
\ No newline at end of file
+            while next_number in existing_numbers:
+                next_number += 1
+            tasks.append(
+                (image_path, os.path.join(folder_path, f"{safe_folder_name}_{next_number}.jpg"))
+            )
+            next_number += 1
+        
+        outcomes = self._run_resize_tasks("pattern", tasks)
+        return {"processed": self._commit_outputs(tasks, outcomes)["processed"]}
@@ -5,7 +5,9 @@ Unified video creation utilities for all product types.
 import os
 from typing import List, Tuple, Optional
 
-from src.utils.common import setup_logging, safe_load_image, ensure_dir_exists
+from src.utils.common import setup_logging, safe_load_image, ensure_dir_exists, load_image_for_size
+from src.utils.image_buffer import ImageBuffer
+from src.utils.image_utils import tile_image
 
 logger = setup_logging(__name__)
 
@@ -56,6 +58,67 @@ def validate_video_for_etsy(video_path: str) -> Tuple[bool, str]:
     return True, "Video validation passed"
 
 
+class FrameCompositor:
+    """
+    Persistent BGR frame buffer for progressive reveal animations.
+    
+    Instead of building every video frame from scratch, content is drawn
+    into one preallocated frame and only the rectangle that changes is
+    updated. Fades go through 256-entry lookup tables, so a fade step is a
+    table lookup into a reusable scratch buffer rather than a float blend.
+    """
+    
+    def __init__(self, size: Tuple[int, int], background: int = 255):
+        """
+        Args:
+            size: Frame size as (width, height)
+            background: Gray level the frame starts with and tiles fade from
+        """
+        import numpy as np
+        
+        width, height = size
+        self.background = background
+        self.frame = np.full((height, width, 3), background, dtype=np.uint8)
+        self._scratch = {}
+    
+    @staticmethod
+    def fade_luts(steps: int, background: int = 255) -> list:
+        """
+        Precompute lookup tables for a fade from the background color.
+        
+        Table ``i`` maps a pixel value ``v`` to
+        ``v * a + background * (1 - a)`` with ``a = i / steps``, truncated
+        to uint8 the same way a float blend cast with ``astype`` would be.
+        """
+        import numpy as np
+        
+        values = np.arange(256, dtype=np.float64)
+        luts = []
+        for i in range(steps):
+            alpha = i / steps
+            luts.append((values * alpha + background * (1 - alpha)).astype(np.uint8))
+        return luts
+    
+    def _region(self, image, position: Tuple[int, int]):
+        x, y = position
+        height, width = image.shape[:2]
+        return self.frame[y:y + height, x:x + width]
+    
+    def place(self, image, position: Tuple[int, int]) -> None:
+        """Copy a BGR image into the frame at (x, y)."""
+        self._region(image, position)[...] = image
+    
+    def blend(self, image, position: Tuple[int, int], lut) -> None:
+        """Draw a BGR image at (x, y) through a fade lookup table."""
+        import cv2
+        
+        scratch = self._scratch.get(image.shape)
+        if scratch is None:
+            scratch = self._scratch.setdefault(image.shape, image.copy())
+        cv2.LUT(image, lut, dst=scratch)
+        self._region(image, position)[...] = scratch
+
+
 class VideoCreator:
     """Unified video creator for different product types."""
     
@@ -141,21 +204,18 @@ class VideoCreator:
         cv_images = []
         for img_path in image_paths:
             try:
-                # Load with PIL first for better format support
-                pil_img = safe_load_image(img_path)
+                # Load with PIL first for better format support, decoded
+                # close to the video size
+                pil_img = load_image_for_size(img_path, target_size, "RGB", cover=True)
                 if not pil_img:
                     logger.warning(f"Failed to load image: {img_path}")
                     continue
                 
-                # Convert to RGB if needed
-                if pil_img.mode != "RGB":
-                    pil_img = pil_img.convert("RGB")
-                
                 # Resize to target size
                 pil_img = pil_img.resize(target_size, resample=1)  # LANCZOS
                 
                 # Convert to OpenCV format
-                cv_img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+                cv_img = ImageBuffer.from_pil(pil_img).to_cv2()
                 cv_images.append(cv_img)
                 
             except Exception as e:
@@ -188,7 +248,8 @@ class VideoCreator:
         final_duration = (cycles_needed * frames_per_cycle) / fps
         logger.info(f"Creating video with {cycles_needed} cycles, estimated duration: {final_duration:.1f}s")
         
-        # Create frames
+        # Create frames; transitions blend into one reusable buffer
+        blend_buffer = np.empty_like(cv_images[0])
         try:
             for cycle in range(cycles_needed):
                 for i in range(len(cv_images)):
@@ -202,8 +263,8 @@ class VideoCreator:
                     # Transition to next image
                     for j in range(transition_frames):
                         alpha = j / transition_frames
-                        blended = cv2.addWeighted(current_img, 1 - alpha, next_img, alpha, 0)
-                        video_writer.write(blended)
+                        cv2.addWeighted(current_img, 1 - alpha, next_img, alpha, 0, dst=blend_buffer)
+                        video_writer.write(blend_buffer)
             
             video_writer.release()
             
@@ -357,24 +418,20 @@ class VideoCreator:
             from PIL import Image, ImageDraw, ImageFont
             from utils.common import get_font
             
-            pil_img = safe_load_image(image_path)
-            if not pil_img:
-                logger.error(f"Could not load image: {image_path}")
-                return False
-            
-            # Convert to RGB if needed
-            if pil_img.mode != "RGB":
-                pil_img = pil_img.convert("RGB")
-            
             # Video dimensions
             video_size = (1000, 1000)
             tile_size = (video_size[0] // 2, video_size[1] // 2)  # 500x500 each tile
             
+            pil_img = load_image_for_size(image_path, tile_size, "RGB", cover=True)
+            if not pil_img:
+                logger.error(f"Could not load image: {image_path}")
+                return False
+            
             # Resize source image to tile size
             pil_img = pil_img.resize(tile_size, resample=1)  # LANCZOS
             
             # Convert to OpenCV format
-            cv_tile = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+            cv_tile = ImageBuffer.from_pil(pil_img).to_cv2()
             
             # Create video writer
             fourcc = cv2.VideoWriter_fourcc(*"mp4v")
@@ -398,45 +455,31 @@ class VideoCreator:
             frames_per_tile = phase1_frames // 4
             fade_frames = frames_per_tile // 2  # Half the time for fade-in
             
+            # Tiles accumulate on one persistent white frame; each frame only
+            # touches the rectangle of the tile that is fading in
+            compositor = FrameCompositor(video_size)
+            fade_luts = FrameCompositor.fade_luts(fade_frames)
+            
             for tile_idx in range(4):
-                for frame_in_tile in range(frames_per_tile):
-                    # Create white background
-                    frame = np.ones((video_size[1], video_size[0], 3), dtype=np.uint8) * 255
-                    
-                    # Draw all previous tiles (fully opaque)
-                    for i in range(tile_idx):
-                        x, y = tiles_positions[i]
-                        frame[y:y + tile_size[1], x:x + tile_size[0]] = cv_tile
-                    
-                    # Draw current tile with fade-in effect
-                    if frame_in_tile < fade_frames:
-                        # Fade in current tile
-                        alpha = frame_in_tile / fade_frames
-                        x, y = tiles_positions[tile_idx]
-                        
-                        # Create alpha blended tile
-                        white_tile = np.ones_like(cv_tile) * 255
-                        faded_tile = (cv_tile * alpha + white_tile * (1 - alpha)).astype(np.uint8)
-                        frame[y:y + tile_size[1], x:x + tile_size[0]] = faded_tile
-                    else:
-                        # Fully visible current tile
-                        x, y = tiles_positions[tile_idx]
-                        frame[y:y + tile_size[1], x:x + tile_size[0]] = cv_tile
-                    
-                    video.write(frame)
+                position = tiles_positions[tile_idx]
+                
+                # Fade in current tile
+                for frame_in_tile in range(fade_frames):
+                    compositor.blend(cv_tile, position, fade_luts[frame_in_tile])
+                    video.write(compositor.frame)
+                
+                # Fully visible current tile; the frame no longer changes
+                compositor.place(cv_tile, position)
+                for _ in range(frames_per_tile - fade_frames):
+                    video.write(compositor.frame)
             
             # Final display with text overlay (3 seconds)
             phase2_frames = total_frames - phase1_frames
             
-            # Create text overlay using PIL
-            text_img = Image.new("RGB", video_size, (255, 255, 255))
+            # Create text overlay using PIL on the tiled background
+            text_img = tile_image(pil_img, video_size)
             text_draw = ImageDraw.Draw(text_img)
             
-            # Add tiled background
-            for y in range(2):
-                for x in range(2):
-                    text_img.paste(pil_img, (x * tile_size[0], y * tile_size[1]))
-            
             # Add text overlay
             font = get_font("DSMarkerFelt", 80)
             text = "Images tile seamlessly"
@@ -464,7 +507,7 @@ class VideoCreator:
             text_draw.text(text_position, text, font=font, fill=(255, 255, 255), anchor="mm")
             
             # Convert text overlay to OpenCV format
-            text_frame = cv2.cvtColor(np.array(text_img), cv2.COLOR_RGB2BGR)
+            text_frame = ImageBuffer.from_pil(text_img).to_cv2()
             
             for i in range(phase2_frames):
                 video.write(text_frame)
@@ -552,7 +595,7 @@ class VideoCreator:
             else:
                 scaled_img = img
             # Convert to OpenCV format
-            cv_img = cv2.cvtColor(np.array(scaled_img), cv2.COLOR_RGB2BGR)
+            cv_img = ImageBuffer.from_pil(scaled_img).to_cv2()
             scaled_cv_images.append(cv_img)
         
         cv_images = scaled_cv_images
@@ -585,7 +628,8 @@ class VideoCreator:
             
             logger.info(f"Creating slideshow: {display_frames} display frames, {transition_frames} transition frames per image")
             
-            # Create slideshow with fade transitions
+            # Create slideshow with fade transitions into one reusable buffer
+            blend_buffer = np.empty_like(cv_images[0])
             for i in range(num_images):
                 current_img = cv_images[i]
                 next_img = cv_images[(i + 1) % num_images] if num_images > 1 else current_img
@@ -598,8 +642,8 @@ class VideoCreator:
                 if num_images > 1 and i < num_images - 1:  # Don't fade after last image
                     for j in range(transition_frames):
                         alpha = j / transition_frames
-                        blended = cv2.addWeighted(current_img, 1 - alpha, next_img, alpha, 0)
-                        video_writer.write(blended)
+                        cv2.addWeighted(current_img, 1 - alpha, next_img, alpha, 0, dst=blend_buffer)
+                        video_writer.write(blend_buffer)
             
             video_writer.release()
             